@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+GENESIS Memory Benchmark
+Bytes per organism at a large population, per feature profile.
+
+Every profile runs in a fresh subprocess: config flags are read at import
+time, and peak RSS is per process. Allocations are traced with tracemalloc
+while the population grows from a tenth of the target to the target, so
+per-world state is left out; ticks run after each step so that state
+created on first use (cognitive subsystems, memories, kin lists) counts.
+
+    python benchmarks/bench_memory.py                      # 10k organisms, both profiles
+    python benchmarks/bench_memory.py --population 2000 --ticks 3
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import subprocess
+import sys
+
+from bench_tick import PROFILES, SEED, SRC, profile_overrides, peak_rss_mb
+
+POPULATION = 10000
+GRID = 200
+TICKS = 1
+
+
+def run_case(case):
+    """Measure one profile in this process; returns a result dict"""
+    sys.path.insert(0, SRC)
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    import config
+    overrides = profile_overrides(case['profile'])
+    overrides.update({
+        'GRID_WIDTH': case['grid'],
+        'GRID_HEIGHT': case['grid'],
+        'MAX_POPULATION': case['population'],
+        'ENABLE_AUTOSAVE': False,
+    })
+    for name, value in overrides.items():
+        setattr(config, name, value)
+
+    import tracemalloc
+    from universe import Universe
+    from organism import Organism
+
+    def populate(universe, count):
+        """Add organisms at random cells, run the ticks; returns (traced bytes, population)"""
+        rng = universe.rng.spawn
+        for _ in range(count):
+            x = rng.randint(0, universe.width - 1)
+            y = rng.randint(0, universe.height - 1)
+            universe.add_organism(Organism(x, y, rng=universe.rng, config=universe.config))
+        for _ in range(case['ticks']):
+            universe.update()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0], len(universe.organisms)
+
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        universe = Universe(seed=case['seed'])
+        # A tenth of the population first, so per-world state (energy fields,
+        # caches) exists before the measured organisms arrive
+        warm_bytes, warm_population = populate(universe, case['population'] // 10)
+        full_bytes, population = populate(universe, case['population'] - warm_population)
+    tracemalloc.stop()
+
+    added = population - warm_population
+    return dict(case,
+                name=case['profile'],
+                final_population=population,
+                bytes=full_bytes - warm_bytes,
+                bytes_per_organism=(full_bytes - warm_bytes) / added if added else 0.0,
+                peak_rss_mb=peak_rss_mb())
+
+
+def run_in_subprocess(case):
+    """Run one case in a fresh interpreter and parse its JSON result"""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', json.dumps(case)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GENESIS memory-per-organism benchmark")
+    parser.add_argument('--profiles', nargs='+', default=PROFILES, choices=PROFILES)
+    parser.add_argument('--population', type=int, default=POPULATION)
+    parser.add_argument('--grid', type=int, default=GRID)
+    parser.add_argument('--ticks', type=int, default=TICKS)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(json.loads(args.worker))))
+        return
+
+    for profile in args.profiles:
+        case = {'profile': profile, 'grid': args.grid, 'population': args.population,
+                'ticks': args.ticks, 'seed': args.seed}
+        result = run_in_subprocess(case)
+        print(f"{result['name']:<14} {result['bytes_per_organism']:9.0f} bytes/organism "
+              f"({result['final_population']} organisms, {result['bytes'] / 2**20:.1f} MB traced for the last 90%, "
+              f"peak RSS {result['peak_rss_mb']:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
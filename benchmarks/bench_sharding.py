@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+GENESIS Sharding Benchmark
+How the per-worker cost of a sharded world shrinks as workers are added.
+
+Every worker count runs in a fresh subprocess, so the resource usage of
+its worker processes can be read back once they have exited. Reported per
+worker count:
+
+- wall milliseconds per tick (only drops with workers on a machine with
+  that many free cores)
+- CPU milliseconds per tick per worker, summed over the worker processes
+  and divided by their number (what near-linear scaling needs to shrink)
+- peak RSS of the largest worker
+
+    python benchmarks/bench_sharding.py                   # 1000x1000 world, 1/2/4 workers
+    python benchmarks/bench_sharding.py --grid 400 --workers 1 2 --ticks 5
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+from bench_tick import SEED, SRC, profile_overrides
+
+GRID = 1000
+WORKERS = [1, 2, 4]
+POPULATION = 2000
+TICKS = 10
+WARMUP_TICKS = 1
+
+
+def run_case(case):
+    """Run one worker count in this process; returns a result dict"""
+    sys.path.insert(0, SRC)
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    import config
+    overrides = profile_overrides(case['profile'])
+    overrides.update({
+        'GRID_WIDTH': case['grid'],
+        'GRID_HEIGHT': case['grid'],
+        'ENABLE_AUTOSAVE': False,
+    })
+    for name, value in overrides.items():
+        setattr(config, name, value)
+
+    import resource
+    from organism import Organism
+    from sharding import ShardedUniverse
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ShardedUniverse(workers=case['workers'], seed=case['seed']) as world:
+            rng = world.rng.spawn
+            for _ in range(case['population']):
+                x = rng.randint(0, world.width - 1)
+                y = rng.randint(0, world.height - 1)
+                world.add_organism(Organism(x, y, rng=world.rng))
+            for _ in range(WARMUP_TICKS):
+                world.update()
+            start = time.perf_counter()
+            for _ in range(case['ticks']):
+                world.update()
+            seconds = time.perf_counter() - start
+            population = world.population
+
+    # Workers have exited: their usage is in RUSAGE_CHILDREN (warm-up ticks included)
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    ticks = case['ticks'] + WARMUP_TICKS
+    peak = usage.ru_maxrss / (1024 * 1024) if sys.platform == 'darwin' else usage.ru_maxrss / 1024
+    return dict(case,
+                final_population=population,
+                wall_ms_per_tick=seconds / case['ticks'] * 1000,
+                worker_cpu_ms_per_tick=(usage.ru_utime + usage.ru_stime) / case['workers'] / ticks * 1000,
+                worker_peak_rss_mb=peak)
+
+
+def run_in_subprocess(case):
+    """Run one case in a fresh interpreter and parse its JSON result"""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', json.dumps(case)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GENESIS sharded world scaling benchmark")
+    parser.add_argument('--workers', nargs='+', type=int, default=WORKERS)
+    parser.add_argument('--grid', type=int, default=GRID)
+    parser.add_argument('--population', type=int, default=POPULATION)
+    parser.add_argument('--ticks', type=int, default=TICKS)
+    parser.add_argument('--profile', default='performance', choices=['all_features', 'performance'])
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(json.loads(args.worker))))
+        return
+
+    print(f"{args.grid}x{args.grid} world, {args.population} organisms, {args.profile} profile")
+    for workers in args.workers:
+        case = {'workers': workers, 'grid': args.grid, 'population': args.population,
+                'ticks': args.ticks, 'profile': args.profile, 'seed': args.seed}
+        result = run_in_subprocess(case)
+        print(f"{workers:>3} workers  {result['wall_ms_per_tick']:8.1f} ms/tick wall  "
+              f"{result['worker_cpu_ms_per_tick']:8.1f} ms/tick CPU per worker  "
+              f"{result['worker_peak_rss_mb']:7.1f} MB peak RSS per worker  "
+              f"({result['final_population']} organisms)")
+
+
+if __name__ == "__main__":
+    main()
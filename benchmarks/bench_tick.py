@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+GENESIS Tick Benchmark
+Headless tick-loop throughput across population sizes, grid sizes and
+feature profiles.
+
+Every configuration runs in a fresh subprocess: config flags are read at
+import time, and peak RSS is per process.
+
+    python benchmarks/bench_tick.py                 # full matrix
+    python benchmarks/bench_tick.py --quick         # one small run per profile
+    python benchmarks/bench_tick.py --compare old.json new.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SRC = os.path.join(ROOT, 'src')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Feature profiles: config overrides applied before the simulation is imported
+PHASE_4_5_FLAGS = [
+    'ENABLE_ABSTRACT_REASONING', 'ENABLE_LANGUAGE', 'ENABLE_SELF_AWARENESS',
+    'ENABLE_CREATIVITY', 'ENABLE_METACOGNITION',
+    'ENABLE_GENERAL_INTELLIGENCE', 'ENABLE_AUTONOMOUS_GOALS',
+]
+PROFILES = ['all_features', 'performance']
+
+POPULATIONS = [100, 1000]
+GRIDS = [100, 200]
+TICKS = 20
+WARMUP_TICKS = 2
+SEED = 1234
+
+def profile_overrides(profile):
+    """Config overrides for a feature profile"""
+    import config
+    if profile == 'performance':
+        overrides = dict(config.PERFORMANCE_OVERRIDES)
+        overrides['PERFORMANCE_MODE'] = True
+        return overrides
+    if profile == 'all_features':
+        return {flag: True for flag in PHASE_4_5_FLAGS}
+    raise ValueError(f"Unknown profile: {profile}")
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(case):
+    """Run one benchmark configuration in this process; returns a result dict"""
+    sys.path.insert(0, SRC)
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    import config
+    overrides = profile_overrides(case['profile'])
+    overrides.update({
+        'GRID_WIDTH': case['grid'],
+        'GRID_HEIGHT': case['grid'],
+        'INITIAL_ORGANISMS': case['population'],
+        'ENABLE_AUTOSAVE': False,
+    })
+    for name, value in overrides.items():
+        setattr(config, name, value)
+
+    from main import initialize_universe
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        universe = initialize_universe(seed=case['seed'])
+        for _ in range(case['warmup']):
+            universe.update()
+
+        # Built-in tick profiler: per-phase and per-subsystem timings
+        universe.profiler.enabled = True
+        universe.profiler.reset()
+
+        organism_ticks = 0
+        ticks = 0
+        start = time.perf_counter()
+        for _ in range(case['ticks']):
+            organism_ticks += len(universe.organisms)
+            ticks += 1
+            if not universe.update() or not universe.organisms:
+                break
+        elapsed = time.perf_counter() - start
+
+    profile = universe.profiler.summary()
+    sections = {name: section['ms_per_tick'] for name, section in profile['sections'].items()}
+    # Reproduction attempts are timed inside the organism sweep
+    reproduction = sections.get('reproduction', 0.0)
+    phases = {
+        'spawn_energy': sections.get('spawn_energy', 0.0),
+        'signals': sections.get('signals', 0.0),
+        'structures': sections.get('structures', 0.0),
+        'spawning': sections.get('spawning', 0.0),
+        'organism_update': sections.get('organisms', 0.0) - reproduction,
+        'reproduction': reproduction + sections.get('births_and_deaths', 0.0),
+    }
+
+    return dict(case,
+                name=case_name(case),
+                ticks=ticks,
+                seconds=elapsed,
+                ticks_per_sec=ticks / elapsed if elapsed else 0.0,
+                us_per_organism_tick=elapsed * 1e6 / organism_ticks if organism_ticks else 0.0,
+                mean_population=organism_ticks / ticks if ticks else 0,
+                final_population=len(universe.organisms),
+                peak_rss_mb=peak_rss_mb(),
+                phase_ms_per_tick=phases,
+                profile=profile)
+
+
+def case_name(case):
+    return f"{case['profile']}/grid{case['grid']}/pop{case['population']}"
+
+
+def run_in_subprocess(case):
+    """Run one case in a fresh interpreter and parse its JSON result"""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', json.dumps(case)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_result(result):
+    phases = ' '.join(f"{name}={ms:.1f}" for name, ms in result['phase_ms_per_tick'].items())
+    print(f"{result['name']:<32} {result['ticks_per_sec']:8.2f} ticks/s "
+          f"{result['us_per_organism_tick']:9.1f} us/org/tick "
+          f"{result['peak_rss_mb']:7.1f} MB  pop {result['mean_population']:.0f}")
+    print(f"{'':<32} ms/tick: {phases}")
+
+
+def compare(old_path, new_path):
+    """Print ticks/sec and us/organism/tick side by side for two result files"""
+    with open(old_path) as f:
+        old = {r['name']: r for r in json.load(f)['results']}
+    with open(new_path) as f:
+        new = {r['name']: r for r in json.load(f)['results']}
+
+    print(f"{'case':<32} {'old t/s':>9} {'new t/s':>9} {'speedup':>8} {'old us':>9} {'new us':>9}")
+    for name in sorted(set(old) & set(new)):
+        o, n = old[name], new[name]
+        speedup = n['ticks_per_sec'] / o['ticks_per_sec'] if o['ticks_per_sec'] else float('nan')
+        print(f"{name:<32} {o['ticks_per_sec']:9.2f} {n['ticks_per_sec']:9.2f} {speedup:7.2f}x "
+              f"{o['us_per_organism_tick']:9.1f} {n['us_per_organism_tick']:9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GENESIS tick-loop benchmark")
+    parser.add_argument('--quick', action='store_true', help="one small case per profile")
+    parser.add_argument('--profiles', nargs='+', default=PROFILES, choices=PROFILES)
+    parser.add_argument('--populations', nargs='+', type=int, default=POPULATIONS)
+    parser.add_argument('--grids', nargs='+', type=int, default=GRIDS)
+    parser.add_argument('--ticks', type=int, default=TICKS)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--output', help="results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="compare two result files")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_case(json.loads(args.worker))))
+        return
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    populations = args.populations[:1] if args.quick else args.populations
+    grids = args.grids[:1] if args.quick else args.grids
+    ticks = min(args.ticks, 5) if args.quick else args.ticks
+
+    results = []
+    for profile in args.profiles:
+        for grid in grids:
+            for population in populations:
+                case = {'profile': profile, 'grid': grid, 'population': population,
+                        'ticks': ticks, 'warmup': WARMUP_TICKS, 'seed': args.seed}
+                result = run_in_subprocess(case)
+                print_result(result)
+                results.append(result)
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
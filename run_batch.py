@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+GENESIS Batch Runner
+Run many headless universes in parallel and collect one summary table
+
+    python run_batch.py --seeds 1 2 3 --ticks 5000
+    python run_batch.py --seeds 1 2 --set MUTATION_RATE=0.01,0.05 --set PERFORMANCE_MODE=true
+    python run_batch.py --set NEURAL_HIDDEN_LAYERS=[8,8],[16]
+    python run_batch.py sweep.json
+
+A sweep file holds {"ticks": ..., "runs": [{"seed": 1, "overrides": {...}}, ...]}
+(the runs.json written next to every batch's results has this shape).
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from batch import expand_runs, run_batch, format_table, parse_setting
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run GENESIS universes in parallel")
+    parser.add_argument('sweep', nargs='?', help="sweep file (JSON) listing the runs")
+    parser.add_argument('--seeds', nargs='+', type=int, default=[1], help="seeds to run")
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=V1,V2',
+                        help="config override; several values make a sweep axis")
+    parser.add_argument('--ticks', type=int, default=None, help="ticks per run (default 10000)")
+    parser.add_argument('--processes', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--output', default="batch_runs", help="output directory")
+    args = parser.parse_args()
+
+    ticks = args.ticks
+    if args.sweep:
+        with open(args.sweep) as f:
+            sweep = json.load(f)
+        runs = sweep['runs']
+        ticks = ticks or sweep.get('ticks')
+    else:
+        grid = {}
+        for setting in args.set:
+            name, values = parse_setting(setting)
+            grid[name] = values
+        runs = expand_runs(args.seeds, grid)
+
+    print(f"🧪 {len(runs)} runs -> {args.output}/")
+    rows = run_batch(runs, ticks=ticks or 10000, processes=args.processes, output_dir=args.output)
+    print()
+    print(format_table(rows))
+    print(f"\n📄 Summary: {os.path.join(args.output, 'summary.csv')}")
+
+
+if __name__ == "__main__":
+    main()
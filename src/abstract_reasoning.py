@@ -3,7 +3,6 @@ Phase 4: Abstract Reasoning System
 Implements pattern recognition, categorization, analogy, causal reasoning
 """
 
-import random
 import numpy as np
 from collections import defaultdict, deque
 
@@ -208,7 +207,7 @@ class AbstractReasoning:
                 sim = category.similarity(problem_features)
                 if sim > 0.4:
                     # Found analogy! Return similar past situation
-                    return random.choice(category.members)
+                    return self.organism.rng.cognition.choice(category.members)
         
         return None
     
@@ -3,7 +3,7 @@ Phase 5: AGI Emergence System
 Implements general problem solving, autonomous goals, consciousness indicators, ethics
 """
 
-import random
+from rng import stable_hash
 import math
 from collections import defaultdict, deque
 import numpy as np
@@ -145,7 +145,7 @@ class EthicalSystem:
     def should_cooperate(self, other_organism):
         """Decide whether to cooperate"""
         # Check reputation
-        other_id = id(other_organism)
+        other_id = other_organism.id
         reputation = self.reputation.get(other_id, 0.5)
         
         # Cooperate with high-reputation organisms
@@ -153,7 +153,7 @@ class EthicalSystem:
     
     def punish_defector(self, defector):
         """Punish organism that defected"""
-        defector_id = id(defector)
+        defector_id = defector.id
         
         # Lower reputation
         if defector_id not in self.reputation:
@@ -272,7 +272,7 @@ class GeneralIntelligence:
                 return analogy
         
         # Random guess (simplified)
-        return f"solution_{random.randint(0, 100)}"
+        return f"solution_{self.organism.rng.cognition.randint(0, 100)}"
     
     def _record_success(self, problem):
         """Record successful problem solving"""
@@ -371,7 +371,7 @@ class GeneralIntelligence:
     def _behavior_distance(self, behavior1, behavior2):
         """Calculate distance between behaviors"""
         # Simplified - hash-based distance
-        return abs(hash(str(behavior1)) - hash(str(behavior2))) / (2**32)
+        return abs(stable_hash(str(behavior1)) - stable_hash(str(behavior2))) / (2**32)
     
     def archive_behavior(self, behavior):
         """Add novel behavior to archive"""
@@ -383,8 +383,8 @@ class GeneralIntelligence:
         
         return False
     
-    def measure_complexity(self):
-        """Measure organism complexity"""
+    def measure_complexity(self, record=True):
+        """Measure organism complexity (record=True appends it to the history)"""
         complexity = 0.0
         
         # Count cognitive systems
@@ -401,7 +401,8 @@ class GeneralIntelligence:
         if hasattr(self.organism, 'genome'):
             complexity += len(self.organism.genome) / 10.0
         
-        self.complexity_history.append(complexity)
+        if record:
+            self.complexity_history.append(complexity)
         
         return complexity
     
@@ -438,7 +439,7 @@ class GeneralIntelligence:
             'active_goals': len([g for g in self.goals if not g.completed]),
             'consciousness_phi': self.consciousness.phi,
             'general_intelligence': self.calculate_general_intelligence(),
-            'complexity': self.measure_complexity(),
+            'complexity': self.measure_complexity(record=False),
             'complexity_increasing': self.is_complexity_increasing(),
             'novel_behaviors': len(self.behavior_archive),
             'ethical_decisions': len(self.ethics.reputation)
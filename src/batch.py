@@ -0,0 +1,254 @@
+"""
+Batch Runner
+Run many independent universes in parallel, e.g. for parameter sweeps
+
+Each run is a seed plus config overrides. Runs go to a process pool;
+every run gets a fresh interpreter (config flags are read at import
+time) and its own output directory holding its saves, a stats.csv with
+the periodic stats rows, and run.log with everything it printed. Stats
+rows are streamed back to the driver while the runs progress, and the
+final stats of every run are collected into one summary table.
+"""
+
+import contextlib
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from config import LOG_INTERVAL
+
+# Columns of the per-run stats.csv and of the streamed stats rows
+STATS_COLUMNS = ('tick', 'population', 'total_births', 'total_deaths',
+                 'total_energy_consumed', 'predator_count', 'avg_organism_energy')
+
+# Columns of the summary table (summary.csv)
+SUMMARY_COLUMNS = ('run', 'seed', 'overrides', 'ticks', 'population', 'peak_population',
+                   'total_births', 'total_deaths', 'total_energy_consumed',
+                   'seconds', 'ticks_per_second', 'stopped')
+
+
+def expand_runs(seeds, grid=None, overrides=None):
+    """Runs for every combination of grid values, once per seed.
+
+    grid maps config names to lists of values; overrides apply to every
+    run. expand_runs([1, 2], {'MUTATION_RATE': [0.01, 0.05]}) gives four
+    runs.
+    """
+    grid = grid or {}
+    names = sorted(grid)
+    runs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        for seed in seeds:
+            run_overrides = dict(overrides or {})
+            run_overrides.update(zip(names, values))
+            runs.append({'seed': seed, 'overrides': run_overrides})
+    return runs
+
+
+def parse_setting(text):
+    """NAME and values of a NAME=V1,V2 setting.
+
+    Values split on top-level commas only, so list values stay whole:
+    NEURAL_HIDDEN_LAYERS=[8,8],[16] gives two values, [8, 8] and [16].
+    Each value is parsed as JSON if it parses (numbers, true/false,
+    lists), else kept as a string.
+    """
+    name, _, values = text.partition('=')
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, char in enumerate(values):
+        if char == '"' and (i == 0 or values[i - 1] != '\\'):
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char in '[{(':
+            depth += 1
+        elif char in ']})':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(values[start:i])
+            start = i + 1
+    parts.append(values[start:])
+    return name.strip(), [_parse_value(part.strip()) for part in parts]
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def apply_overrides(overrides):
+    """Set config values (before anything else imports config)"""
+    import config
+    if overrides.get('PERFORMANCE_MODE'):
+        for name, value in config.PERFORMANCE_OVERRIDES.items():
+            setattr(config, name, value)
+    for name, value in overrides.items():
+        if not hasattr(config, name):
+            raise ValueError(f"Unknown config setting: {name}")
+        setattr(config, name, value)
+
+
+def _stats_row(stats):
+    return {column: stats.get(column, 0) for column in STATS_COLUMNS}
+
+
+_stats_queue = None
+
+
+def _init_worker(stats_queue):
+    global _stats_queue
+    _stats_queue = stats_queue
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+
+def _run(index, run, ticks, run_dir, log_interval):
+    """One run, in a fresh worker process; returns its summary row"""
+    apply_overrides(run['overrides'])
+    from config import ENABLE_AUTOSAVE, AUTOSAVE_INTERVAL
+    from main import initialize_universe
+    from persistence import SimulationSaver
+
+    os.makedirs(run_dir, exist_ok=True)
+    with open(os.path.join(run_dir, 'run.log'), 'w') as log, \
+            open(os.path.join(run_dir, 'stats.csv'), 'w', newline='') as stats_file, \
+            contextlib.redirect_stdout(log):
+        writer = csv.DictWriter(stats_file, fieldnames=STATS_COLUMNS)
+        writer.writeheader()
+
+        universe = initialize_universe(seed=run['seed'])
+        saver = SimulationSaver(os.path.join(run_dir, 'saves'))
+        stopped = 'done'
+        start = time.perf_counter()
+        while universe.tick < ticks:
+            if not universe.update():
+                stopped = 'safety limit'
+                break
+            if ENABLE_AUTOSAVE and universe.tick % AUTOSAVE_INTERVAL == 0:
+                saver.autosave(universe, AUTOSAVE_INTERVAL)
+            if universe.tick % log_interval == 0:
+                row = _stats_row(universe.get_stats())
+                writer.writerow(row)
+                _stats_queue.put((index, row))
+            if len(universe.organisms) == 0:
+                stopped = 'extinct'
+                break
+        seconds = time.perf_counter() - start
+
+        saver.flush()
+        saver.save(universe, "final_save")
+
+    stats = universe.get_stats()
+    return {
+        'run': index,
+        'seed': universe.rng.seed,
+        'overrides': run['overrides'],
+        'ticks': universe.tick,
+        'population': stats['population'],
+        'peak_population': stats['peak_population'],
+        'total_births': stats['total_births'],
+        'total_deaths': stats['total_deaths'],
+        'total_energy_consumed': float(stats['total_energy_consumed']),
+        'seconds': seconds,
+        'ticks_per_second': universe.tick / seconds if seconds else 0.0,
+        'stopped': stopped,
+    }
+
+
+def run_batch(runs, ticks=10000, processes=None, output_dir="batch_runs",
+              log_interval=LOG_INTERVAL, on_stats=None):
+    """Run every run in a process pool; returns the summary rows in run order.
+
+    runs: dicts with 'seed' and 'overrides' (see expand_runs).
+    on_stats(run index, stats row) is called in this process as the
+    periodic stats arrive; by default they are printed.
+    Results go to output_dir/run_NNN/ and output_dir/summary.csv.
+    """
+    if on_stats is None:
+        on_stats = _print_stats
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'runs.json'), 'w') as f:
+        json.dump({'ticks': ticks, 'runs': runs}, f, indent=2)
+
+    # Spawn, not fork: every run must import the simulation under its own config
+    context = multiprocessing.get_context('spawn')
+    stats_queue = context.Queue()
+    processes = min(processes or os.cpu_count() or 1, max(1, len(runs)))
+    with context.Pool(processes, initializer=_init_worker, initargs=(stats_queue,),
+                      maxtasksperchild=1) as pool:
+        pending = [pool.apply_async(_run, (index, run, ticks,
+                                           os.path.join(output_dir, f"run_{index:03d}"),
+                                           log_interval))
+                   for index, run in enumerate(runs)]
+        while not all(result.ready() for result in pending):
+            _drain(stats_queue, on_stats, timeout=0.2)
+        rows = [_result_row(result, index, run, output_dir)
+                for index, (result, run) in enumerate(zip(pending, runs))]
+    _drain(stats_queue, on_stats)
+
+    with open(os.path.join(output_dir, 'summary.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(dict(row, overrides=_format_overrides(row['overrides'])))
+    return rows
+
+
+def _result_row(result, index, run, output_dir):
+    """Summary row of a finished run; a run that raised gets an error row.
+
+    The traceback goes to the run's error.log, so one failing run does
+    not cost the summary of the others.
+    """
+    try:
+        return result.get()
+    except Exception as error:
+        run_dir = os.path.join(output_dir, f"run_{index:03d}")
+        os.makedirs(run_dir, exist_ok=True)
+        with open(os.path.join(run_dir, 'error.log'), 'w') as f:
+            f.write(''.join(traceback.format_exception(type(error), error, error.__traceback__)))
+        row = {column: 0 for column in SUMMARY_COLUMNS}
+        row.update(run=index, seed=run.get('seed'), overrides=run.get('overrides', {}),
+                   seconds=0.0, ticks_per_second=0.0,
+                   stopped=f"error: {type(error).__name__}: {error}")
+        return row
+
+
+def _drain(stats_queue, on_stats, timeout=None):
+    """Hand queued stats rows to on_stats (waiting up to timeout for the first)"""
+    try:
+        item = stats_queue.get(timeout=timeout) if timeout else stats_queue.get_nowait()
+        while True:
+            on_stats(*item)
+            item = stats_queue.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def _print_stats(index, row):
+    print(f"[Run {index:3d}] [Tick {row['tick']:6d}] "
+          f"Pop: {row['population']:4d} | "
+          f"Births: {row['total_births']:5d} | "
+          f"Deaths: {row['total_deaths']:5d}")
+
+
+def _format_overrides(overrides):
+    return ' '.join(f"{name}={value}" for name, value in sorted(overrides.items()))
+
+
+def format_table(rows):
+    """Summary rows as an aligned text table"""
+    header = ('run', 'seed', 'ticks', 'pop', 'peak', 'births', 'deaths', 'ticks/s', 'stopped', 'overrides')
+    lines = [f"{header[0]:>4} {header[1]:>12} {header[2]:>7} {header[3]:>6} {header[4]:>6} "
+             f"{header[5]:>8} {header[6]:>8} {header[7]:>8}  {header[8]:<12} {header[9]}"]
+    for row in rows:
+        lines.append(f"{row['run']:>4} {str(row['seed']):>12} {row['ticks']:>7} {row['population']:>6} "
+                     f"{row['peak_population']:>6} {row['total_births']:>8} {row['total_deaths']:>8} "
+                     f"{row['ticks_per_second']:>8.1f}  {row['stopped']:<12} "
+                     f"{_format_overrides(row['overrides'])}")
+    return '\n'.join(lines)
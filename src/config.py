@@ -9,6 +9,7 @@ INITIAL_ENERGY_DISTRIBUTION = 0.3  # 30% of cells start with energy
 ENERGY_SPAWN_RATE = 0.01  # Probability of energy appearing per cell per tick
 ENERGY_AMOUNT = 100  # Energy units per resource
 MAX_ENERGY_PER_CELL = 500
+RANDOM_SEED = None  # Seed for all random streams (None = fresh entropy, printed at startup)
 
 # Organism Parameters
 INITIAL_ORGANISMS = 10
@@ -18,15 +19,16 @@ ENERGY_COST_REPLICATE = 150
 ENERGY_COST_ALIVE = 0.5  # Energy cost per tick just to exist
 MIN_ENERGY_TO_REPLICATE = 200
 
-# Performance Mode (for long runs)
+# Performance Mode (for long runs) - applied at the end of this file
 PERFORMANCE_MODE = False  # Set True for faster simulation
-if PERFORMANCE_MODE:
-    MAX_POPULATION = 500  # Lower cap
-    ENABLE_COMMUNICATION = False
-    ENABLE_STRUCTURES = False
-    ENABLE_PUZZLES = False
-    ENABLE_ABSTRACT_REASONING = False
-    ENABLE_LANGUAGE = False
+PERFORMANCE_OVERRIDES = {
+    'MAX_POPULATION': 500,  # Lower cap
+    'ENABLE_COMMUNICATION': False,
+    'ENABLE_STRUCTURES': False,
+    'ENABLE_PUZZLES': False,
+    'ENABLE_ABSTRACT_REASONING': False,
+    'ENABLE_LANGUAGE': False,
+}
 
 # Evolution Parameters
 MUTATION_RATE = 0.1  # 10% chance of mutation during replication
@@ -36,12 +38,18 @@ MUTATION_STRENGTH = 0.2  # How much genes can change
 MAX_POPULATION = 10000  # Safety limit
 TICKS_PER_SECOND = 10
 MAX_ORGANISM_AGE = 1000  # Organisms die of old age
+SPATIAL_BUCKET_SIZE = 5  # Cells per side of a spatial index bucket (~VISION_RANGE)
+ARRAY_MODE = False  # Keep organism state in NumPy arrays and batch the simple per-tick rules
+TWO_PHASE_TICK = False  # Organisms decide against a read-only world, then one ordered pass commits
+TWO_PHASE_BATCH_SIZE = 256  # Organisms per decide batch in the two-phase tick
 
 # Phase 2: Neural Networks
 USE_NEURAL_NETWORKS = True  # Use neural networks instead of simple genomes
 NEURAL_HIDDEN_LAYERS = [8, 8]  # Hidden layer sizes
 NEURAL_MUTATION_RATE = 0.1
 NEURAL_MUTATION_STRENGTH = 0.2
+BATCH_NEURAL_INFERENCE = False  # Decide all neural moves in one batched pass per tick
+GENOME_POOL = False  # Keep every genome (brain included) in one preallocated float32 table
 
 # Phase 2: Predator-Prey
 ENABLE_PREDATORS = True
@@ -62,6 +70,7 @@ VISION_RANGE = 5  # How far organisms can see
 ENABLE_DIRECTIONAL_SENSING = True
 ENERGY_COST_TURN = 0.5  # Energy cost to change direction
 VISION_CONE_ANGLE = 180  # Degrees of forward vision (180 = half circle)
+ENERGY_FIELD_SENSING = True  # Neural sensors read FFT energy fields (built per tick, patched as energy is eaten)
 
 # Phase 3: Multi-cellular
 ENABLE_MULTICELLULAR = True
@@ -106,12 +115,25 @@ FPS = 30
 # Safety
 ENABLE_LOGGING = True
 LOG_INTERVAL = 100  # Log stats every N ticks
+DEEP_STATS_INTERVAL = LOG_INTERVAL  # Sample per-organism cognitive stats every N ticks (0 = only via get_stats(deep=True))
+ENABLE_PROFILING = False  # Time each tick phase and cognitive subsystem call
+PROFILE_LOG_INTERVAL = 1000  # Print the profile with the stats log every N ticks (0 = never)
 EMERGENCY_STOP_POPULATION = 50000  # Hard stop if population explodes
 
+# Sharding (headless only)
+SHARD_WORKERS = 0  # Split the world into this many tiles, one worker process each (0/1 = off)
+
+# Lineage
+TRACK_LINEAGE = True  # Record (id, parent id, birth tick, genome hash) for every birth
+LINEAGE_PRUNE_INTERVAL = 1000  # Drop records of extinct branches every N ticks (0 = never)
+
 # Persistence
 ENABLE_AUTOSAVE = True
 AUTOSAVE_INTERVAL = 1000  # Auto-save every N ticks
 KEEP_AUTOSAVES = 5  # Number of autosaves to keep
+ASYNC_AUTOSAVE = True  # Write autosaves on a background thread
+AUTOSAVE_FORK = True  # Pickle and write background autosaves in a forked (copy-on-write) child where fork() exists
+AUTOSAVE_FULL_EVERY = 5  # Every Nth autosave is a full snapshot, the rest are deltas (1 = always full)
 
 # Phase 4: Cognitive Emergence
 ENABLE_ABSTRACT_REASONING = True
@@ -183,3 +205,7 @@ NOVELTY_REWARD_MULTIPLIER = 2.0  # Reward for novel behaviors
 COMPLEXITY_TRACKING = True
 DIVERSITY_MAINTENANCE = True
 EXTINCTION_RESISTANCE = True
+
+# Performance Mode overrides win over the defaults above
+if PERFORMANCE_MODE:
+    globals().update(PERFORMANCE_OVERRIDES)
@@ -3,7 +3,7 @@ Phase 4: Creativity & Innovation System
 Implements novel behavior generation, exploration, intrinsic motivation, play
 """
 
-import random
+from rng import stable_hash
 import math
 from collections import deque, defaultdict
 
@@ -47,7 +47,7 @@ class CuriosityDrive:
     
     def get_curiosity(self, state):
         """How curious about this state?"""
-        state_hash = hash(str(state))
+        state_hash = stable_hash(str(state))
         
         # More curious about less-visited states
         visit_count = self.state_visit_counts[state_hash]
@@ -60,14 +60,14 @@ class CuriosityDrive:
     
     def visit_state(self, state):
         """Record state visit"""
-        state_hash = hash(str(state))
+        state_hash = stable_hash(str(state))
         self.state_visit_counts[state_hash] += 1
         self.explored_states.add(state_hash)
     
     def experience_surprise(self, expected, actual):
         """Record surprising outcome"""
         if expected != actual:
-            surprise = abs(hash(expected) - hash(actual))
+            surprise = abs(stable_hash(expected) - stable_hash(actual))
             self.surprises.append(surprise)
             
             # Surprise increases curiosity
@@ -167,19 +167,19 @@ class CreativitySystem:
         explore_prob += curiosity_bonus * 0.2
         
         # Random exploration
-        return random.random() < explore_prob
+        return self.organism.rng.cognition.random() < explore_prob
     
     def generate_novel_behavior(self, context):
         """Create new behavior"""
         # Combine existing behaviors in new ways
         if len(self.behavior_repertoire) >= 2:
             # Recombination
-            behaviors = random.sample(list(self.behavior_repertoire), 2)
+            behaviors = self.organism.rng.cognition.sample(sorted(self.behavior_repertoire), 2)
             novel_actions = list(behaviors[0]) + list(behaviors[1])
         else:
             # Random variation
-            novel_actions = [f"action_{random.randint(0, 10)}" 
-                           for _ in range(random.randint(2, 5))]
+            novel_actions = [f"action_{self.organism.rng.cognition.randint(0, 10)}" 
+                           for _ in range(self.organism.rng.cognition.randint(2, 5))]
         
         # Create novel behavior
         behavior = NovelBehavior(
@@ -234,12 +234,12 @@ class CreativitySystem:
         """Playful exploration"""
         # Choose random skill to practice
         skills = ['movement', 'sensing', 'communication', 'tool_use']
-        skill = random.choice(skills)
+        skill = self.organism.rng.cognition.choice(skills)
         
         self.play.play(skill)
         
         # Play might lead to innovation
-        if random.random() < 0.1:
+        if self.organism.rng.cognition.random() < 0.1:
             return self.generate_novel_behavior('play')
         
         return None
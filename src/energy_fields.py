@@ -0,0 +1,131 @@
+"""
+Directional Energy Fields
+Grid-wide summaries of the energy an organism would see in each direction
+"""
+
+import numpy as np
+from vision import get_table
+
+
+class DirectionalEnergyFields:
+    """Average energy to the N, S, E and W of every cell, per facing direction.
+
+    For each facing direction the vision window is split into the offsets
+    with dy < 0, dy > 0, dx > 0 and dx < 0. The per-cell sums over each
+    part are a correlation of the energy grid with that part's mask,
+    computed for the whole grid at once with FFTs. The FFTs are padded by
+    the vision range, so cells beyond the edge count as empty, as they do
+    for get_energy. Dividing by the (constant) number of offsets gives the
+    same averages that organisms used to build offset by offset, so
+    looking one up is O(1).
+
+    Fields and kernel spectra are computed lazily, one facing direction at
+    a time. Fields are kept until invalidate() is called (once per tick);
+    consumed() patches the computed fields in place when energy is eaten
+    during the tick, so lookups follow the live grid. Memory for both
+    grows with grid area, so very large worlds may prefer to switch
+    ENERGY_FIELD_SENSING off.
+    """
+
+    def __init__(self, width, height, vision_range, cone_angle=None):
+        self.width = width
+        self.height = height
+        self.vision_range = vision_range
+        # Padded FFT shape: wrapped reads land in zeros instead of the far edge
+        self.shape = (height + vision_range, width + vision_range)
+
+        # Precomputed cone masks; no directional sensing means one full window
+        if cone_angle is None:
+            masks = get_table(vision_range, 360).masks[:1].copy()
+        else:
+            masks = get_table(vision_range, cone_angle).masks.copy()
+        masks[:, vision_range, vision_range] = False
+
+        offsets = np.arange(-vision_range, vision_range + 1)
+        dx, dy = np.meshgrid(offsets, offsets)
+        quadrants = [dy < 0, dy > 0, dx > 0, dx < 0]  # N, S, E, W
+
+        # Per direction: the four window parts and their offset counts
+        self.parts = [[mask & quadrant for quadrant in quadrants] for mask in masks]
+        self.counts = [np.array([max(1, int(part.sum())) for part in parts],
+                                dtype=float).reshape(4, 1, 1)
+                       for parts in self.parts]
+        self._kernels = [None] * len(masks)
+
+        # Per direction, every (part, dy, dx) offset and its weight in the average
+        self.offsets = []
+        for parts, counts in zip(self.parts, self.counts):
+            part, ys, xs = np.nonzero(np.array(parts))
+            self.offsets.append((part, ys - vision_range, xs - vision_range,
+                                 1.0 / counts.ravel()[part]))
+
+        self._grid_spectrum = None
+        self._fields = {}
+
+    def _kernel_spectra(self, direction):
+        """Conjugate spectra of one direction's four window parts (cached)"""
+        spectra = self._kernels[direction]
+        if spectra is None:
+            r = self.vision_range
+            spectra = []
+            for part in self.parts[direction]:
+                kernel = np.zeros(self.shape)
+                ys, xs = np.nonzero(part)
+                np.add.at(kernel, ((ys - r) % self.shape[0], (xs - r) % self.shape[1]), 1)
+                spectra.append(np.conj(np.fft.rfft2(kernel)))
+            spectra = np.array(spectra, dtype=np.complex64)
+            self._kernels[direction] = spectra
+        return spectra
+
+    def invalidate(self):
+        """Forget cached fields (the energy grid has changed)"""
+        self._grid_spectrum = None
+        self._fields = {}
+
+    def consumed(self, xs, ys, amounts):
+        """Take energy eaten at cells (xs, ys) out of the computed fields.
+
+        Every cell whose window holds an eaten cell drops by the amount
+        over its part's offset count; directions not computed yet will be
+        computed from the live grid.
+        """
+        self._grid_spectrum = None
+        if not self._fields:
+            return
+        r = self.vision_range
+        if np.ndim(xs) == 0 and r <= xs < self.width - r and r <= ys < self.height - r:
+            # One cell away from the edges: every offset lands inside, none repeats
+            for direction, fields in self._fields.items():
+                part, dys, dxs, weights = self.offsets[direction]
+                fields[part, ys - dys, xs - dxs] -= amounts * weights
+            return
+
+        xs, ys, amounts = np.atleast_1d(xs, ys, amounts)
+        for direction, fields in self._fields.items():
+            part, dys, dxs, weights = self.offsets[direction]
+            cy = ys[:, None] - dys
+            cx = xs[:, None] - dxs
+            inside = (cy >= 0) & (cy < self.height) & (cx >= 0) & (cx < self.width)
+            cell, offset = np.nonzero(inside)
+            np.subtract.at(fields, (part[offset], cy[cell, offset], cx[cell, offset]),
+                           amounts[cell] * weights[offset])
+
+    def field(self, energy_grid, direction=0):
+        """(4, height, width) array of N/S/E/W averages for one facing direction"""
+        if len(self.parts) == 1:
+            direction = 0
+
+        fields = self._fields.get(direction)
+        if fields is None:
+            if self._grid_spectrum is None:
+                self._grid_spectrum = np.fft.rfft2(energy_grid, s=self.shape)
+            sums = np.fft.irfft2(self._grid_spectrum * self._kernel_spectra(direction),
+                                 s=self.shape)[:, :self.height, :self.width]
+            fields = (sums / self.counts[direction]).astype(np.float32)
+            self._fields[direction] = fields
+        return fields
+
+    def lookup(self, energy_grid, x, y, direction=0):
+        """(energy_n, energy_s, energy_e, energy_w) seen from (x, y)"""
+        n, s, e, w = self.field(energy_grid, direction)[:, y % self.height, x % self.width]
+        return float(n), float(s), float(e), float(w)
@@ -0,0 +1,266 @@
+"""
+Flat Genomes
+A genome is one float32 vector laid out by a schema
+
+The schema lists the genome's keys in order: scalar genes take one slot,
+'color' takes three and 'brain' takes the network's flattened weights and
+biases. Genome behaves like the dict genomes used to be (genome['color'],
+genome.get('brain'), 'cooperation' in genome, ...), while copying,
+mutating and clamping work on the whole vector at once, so reproduction
+allocates one array instead of a dict plus a network per layer.
+"""
+
+from collections.abc import MutableMapping
+import numpy as np
+
+# gene -> (lowest value, highest value, mutation sigma); strings name a config setting
+GENE_LIMITS = {
+    'move_probability': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    'move_randomness': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    'eat_threshold': (0.0, np.inf, 10.0),
+    'reproduce_threshold': ('MIN_ENERGY_TO_REPLICATE', np.inf, 20.0),
+    'signal_probability': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    'signal_response': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    'cooperation': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    'aggression': (0.0, 1.0, 'MUTATION_STRENGTH'),
+    # Cognitive genes can be picked by a mutation but stay as they were born
+    'pattern_recognition': (0.0, 1.0, 0.0),
+    'causal_reasoning': (0.0, 1.0, 0.0),
+    'language_ability': (0.0, 1.0, 0.0),
+    'innovation_tendency': (0.0, 1.0, 0.0),
+    'curiosity': (0.0, 1.0, 0.0),
+    'exploration_tendency': (0.0, 1.0, 0.0),
+    'self_reflection': (0.0, 1.0, 0.0),
+    'theory_of_mind': (0.0, 1.0, 0.0),
+}
+COLOR_LIMITS = (50, 255)
+COLOR_SHIFT = 20           # Colour channels move by up to this much...
+COLOR_MUTATION_CHANCE = 0.3  # ...with this chance when a gene mutates
+INTEGER_GENES = ('generation',)
+
+_SCALAR, _INTEGER, _COLOR, _BRAIN = range(4)
+
+
+class GenomeSchema:
+    """Layout of a genome vector: which key lives in which slots.
+
+    Schemas are shared; get() returns the one instance per layout.
+    """
+
+    _schemas = {}
+
+    def __init__(self, keys, topology=None):
+        self.keys = keys
+        self.topology = topology  # Brain (input_size, hidden_sizes, output_size), or None
+        self.fields = {}  # key -> (kind, start, stop)
+        self.brain_layers = ()  # Parameters per brain layer (weights then biases)
+        size = 0
+        for key in keys:
+            if key == 'color':
+                kind, width = _COLOR, 3
+            elif key == 'brain':
+                input_size, hidden_sizes, output_size = topology
+                sizes = (input_size,) + tuple(hidden_sizes) + (output_size,)
+                self.brain_layers = tuple(a * b + b for a, b in zip(sizes[:-1], sizes[1:]))
+                kind, width = _BRAIN, sum(self.brain_layers)
+            else:
+                kind, width = (_INTEGER if key in INTEGER_GENES else _SCALAR), 1
+            self.fields[key] = (kind, size, size + width)
+            size += width
+        self.size = size
+        # Numeric genes: (key, slot, whether the gene is an integer)
+        self.numeric = tuple((key, start, kind == _INTEGER) for key, (kind, start, _) in self.fields.items()
+                             if kind in (_SCALAR, _INTEGER))
+        self._limits = {}
+
+    @classmethod
+    def get(cls, keys, topology=None):
+        keys = tuple(keys)
+        if topology is not None:
+            input_size, hidden_sizes, output_size = topology
+            topology = (input_size, tuple(hidden_sizes), output_size)
+        schema = cls._schemas.get((keys, topology))
+        if schema is None:
+            schema = cls._schemas[(keys, topology)] = cls(keys, topology)
+        return schema
+
+    def __reduce__(self):
+        return (GenomeSchema.get, (self.keys, self.topology))
+
+    def limits(self, config):
+        """Bounds, mutation sigmas and mutable slots under a config"""
+        limits = self._limits.get(config)
+        if limits is None:
+            limits = self._limits[config] = _Limits(self, config)
+        return limits
+
+
+class _Limits:
+    """Per-slot bounds and mutation settings of one schema under one config"""
+
+    def __init__(self, schema, config):
+        setting = lambda value: getattr(config, value) if isinstance(value, str) else value
+        self.low = np.full(schema.size, -np.inf, dtype=np.float32)
+        self.high = np.full(schema.size, np.inf, dtype=np.float32)
+        self.sigma = {}
+        for key, (kind, start, stop) in schema.fields.items():
+            if kind == _COLOR:
+                self.low[start:stop], self.high[start:stop] = COLOR_LIMITS
+            elif key in GENE_LIMITS:
+                low, high, sigma = GENE_LIMITS[key]
+                self.low[start], self.high[start] = setting(low), setting(high)
+                self.sigma[start] = setting(sigma)
+
+        # Genes a mutation may pick: the enabled features' genes this genome has
+        self.mutable = [schema.fields[gene][1] for gene in config.mutable_genes
+                        if gene in schema.fields and gene in GENE_LIMITS]
+        self.color = slice(*schema.fields['color'][1:]) if 'color' in schema.fields else None
+        self.brain = None
+        if config.USE_NEURAL_NETWORKS and 'brain' in schema.fields:
+            self.brain = schema.fields['brain'][1]
+            self.brain_layers = np.array(schema.brain_layers)
+            self.brain_rate = config.NEURAL_MUTATION_RATE
+            self.brain_strength = config.NEURAL_MUTATION_STRENGTH
+        self.mutable_sigma = np.array([self.sigma[slot] for slot in self.mutable], dtype=np.float32)
+        self.rate = config.MUTATION_RATE
+
+
+class Genome(MutableMapping):
+    """Genes in a float32 vector (see GenomeSchema), read and written like a dict.
+
+    Keys outside the schema (genes added during a lifetime, odd values from
+    old saves) are kept in `extras`. genome['brain'] is a NeuralNetwork whose
+    weights are views into the vector.
+    """
+
+    __slots__ = ('schema', 'vector', 'extras', '_brain')
+
+    def __init__(self, schema, vector=None, extras=None):
+        self.schema = schema
+        self.vector = np.zeros(schema.size, dtype=np.float32) if vector is None else vector
+        self.extras = extras
+        self._brain = None
+
+    @classmethod
+    def from_dict(cls, genes):
+        """Genome holding a dict's genes (numbers, 'color' and 'brain' go in the vector)"""
+        keys, extras = [], {}
+        topology = None
+        for key, value in genes.items():
+            if key == 'color' or (key == 'brain' and hasattr(value, 'get_params')) or \
+                    (isinstance(value, (int, float, np.number)) and not isinstance(value, bool)):
+                keys.append(key)
+                if key == 'brain':
+                    topology = value.topology
+            else:
+                extras[key] = value
+        genome = cls(GenomeSchema.get(keys, topology), extras=extras or None)
+        for key in keys:
+            genome[key] = genes[key]
+        return genome
+
+    def __getitem__(self, key):
+        field = self.schema.fields.get(key)
+        if field is None:
+            if self.extras is None:
+                raise KeyError(key)
+            return self.extras[key]
+        kind, start, stop = field
+        if kind == _SCALAR:
+            return float(self.vector[start])
+        elif kind == _INTEGER:
+            return int(self.vector[start])
+        elif kind == _COLOR:
+            return tuple(int(channel) for channel in self.vector[start:stop])
+        if self._brain is None:
+            from neural_network import NeuralNetwork
+            self._brain = NeuralNetwork.from_params(self.vector[start:stop], *self.schema.topology,
+                                                    copy=False)
+        return self._brain
+
+    def __setitem__(self, key, value):
+        field = self.schema.fields.get(key)
+        if field is None:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+            return
+        kind, start, stop = field
+        if kind == _BRAIN:
+            if value.topology != self.schema.topology:
+                raise ValueError(f"Brain topology {value.topology} does not fit this genome "
+                                 f"({self.schema.topology})")
+            if value is not self._brain:
+                self.vector[start:stop] = value.params
+                self._brain = None
+        elif kind == _COLOR:
+            self.vector[start:stop] = value
+        else:
+            self.vector[start] = value
+
+    def __delitem__(self, key):
+        if key in self.schema.fields:
+            raise KeyError(f"{key!r} is part of the genome layout and cannot be removed")
+        if self.extras is None:
+            raise KeyError(key)
+        del self.extras[key]
+
+    def __iter__(self):
+        yield from self.schema.keys
+        if self.extras:
+            yield from self.extras
+
+    def __len__(self):
+        return len(self.schema.keys) + (len(self.extras) if self.extras else 0)
+
+    def __contains__(self, key):
+        return key in self.schema.fields or (self.extras is not None and key in self.extras)
+
+    def __repr__(self):
+        return f"Genome({dict(self)!r})"
+
+    def rebind(self, vector):
+        """Keep the genes in another vector (e.g. a GenomePool row) from now on"""
+        vector[...] = self.vector
+        self.vector = vector
+        self._brain = None
+
+    def copy(self):
+        """Independent copy (one vector copy)"""
+        return Genome(self.schema, self.vector.copy(), dict(self.extras) if self.extras else None)
+
+    def __deepcopy__(self, memo):
+        import copy
+        return Genome(self.schema, self.vector.copy(), copy.deepcopy(self.extras, memo))
+
+    def __reduce__(self):
+        return (Genome, (self.schema, self.vector, self.extras))
+
+    def mutated(self, config, rng):
+        """Mutated copy, drawing from rng (a Stream).
+
+        Brain: each layer is picked with probability NEURAL_MUTATION_RATE and
+        each parameter of a picked layer gets Gaussian noise with that
+        probability again. Genes: with probability MUTATION_RATE one gene
+        (among config.mutable_genes) gets Gaussian noise, and sometimes the
+        colour shifts. Every slot is then clamped to its bounds in one go.
+        """
+        limits = self.schema.limits(config)
+        vector = self.vector.copy()
+
+        if limits.brain is not None:
+            picked = np.repeat(rng.np.random(len(limits.brain_layers)) < limits.brain_rate,
+                               limits.brain_layers)
+            candidates = np.flatnonzero(picked)
+            if len(candidates):
+                hit = candidates[rng.np.random(len(candidates)) < limits.brain_rate]
+                vector[limits.brain + hit] += rng.np.standard_normal(len(hit)) * limits.brain_strength
+
+        if rng.random() < limits.rate and limits.mutable:
+            slot = rng.choice(limits.mutable)
+            vector[slot] += rng.gauss(0, limits.sigma[slot])
+            if limits.color is not None and rng.random() < COLOR_MUTATION_CHANCE:
+                vector[limits.color] += rng.np.integers(-COLOR_SHIFT, COLOR_SHIFT + 1, 3)
+
+        np.clip(vector, limits.low, limits.high, out=vector)
+        return Genome(self.schema, vector, dict(self.extras) if self.extras else None)
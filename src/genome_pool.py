@@ -0,0 +1,170 @@
+"""
+Genome Pool
+Every living organism's genome, brain included, in preallocated float32 tables
+
+Each genome layout (GenomeSchema) gets one (capacity, genome size) table.
+An organism takes a row when it enters the universe and gives it back when
+it leaves; meanwhile its Genome's vector, and so its brain's weights, are
+views into that row. Brains of many organisms can then be gathered with one
+fancy index for batched inference, and a tick's offspring mutated together
+in place, without touching a NeuralNetwork object per organism.
+"""
+
+import numpy as np
+from genome import Genome, COLOR_MUTATION_CHANCE, COLOR_SHIFT
+
+
+class _Table:
+    """Rows of one genome layout; freed rows are reused before new ones"""
+
+    def __init__(self, schema, capacity):
+        self.schema = schema
+        self.rows = np.zeros((max(1, capacity), schema.size), dtype=np.float32)
+        self.genomes = []  # genome held in each used row (None: freed)
+        self.free = []
+
+    def allocate(self, genome):
+        if self.free:
+            slot = self.free.pop()
+            self.genomes[slot] = genome
+        else:
+            slot = len(self.genomes)
+            if slot == len(self.rows):
+                self._grow()
+            self.genomes.append(genome)
+        genome.rebind(self.rows[slot])
+        return slot
+
+    def release(self, slot):
+        genome = self.genomes[slot]
+        genome.rebind(np.empty(self.schema.size, dtype=np.float32))
+        self.genomes[slot] = None
+        self.free.append(slot)
+
+    def _grow(self):
+        """Double capacity; genomes move to their rows in the new table"""
+        rows = np.zeros((len(self.rows) * 2, self.schema.size), dtype=np.float32)
+        self.rows = rows
+        for slot, genome in enumerate(self.genomes):
+            if genome is not None:
+                genome.rebind(rows[slot])
+
+
+class GenomePool:
+    """Pooled genomes of one universe, one table per genome layout.
+
+    attach() moves an organism's genome into a row, detach() copies it back
+    out and frees the row. An organism whose genome was replaced after it
+    was attached keeps working; it is simply no longer pooled.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity  # Initial rows per table
+        self.tables = {}  # schema -> _Table
+        self.slots = {}   # organism ID -> (table, row)
+
+    def __len__(self):
+        return len(self.slots)
+
+    @property
+    def nbytes(self):
+        return sum(table.rows.nbytes for table in self.tables.values())
+
+    def attach(self, organism):
+        """Move an organism's genome into a pool row"""
+        genome = getattr(organism, 'genome', None)
+        if not isinstance(genome, Genome) or organism.id in self.slots:
+            return
+        table = self.tables.get(genome.schema)
+        if table is None:
+            table = self.tables[genome.schema] = _Table(genome.schema, self.capacity)
+        self.slots[organism.id] = (table, table.allocate(genome))
+
+    def detach(self, organism):
+        """Give an organism's genome its own vector again and free its row"""
+        entry = self.slots.pop(organism.id, None)
+        if entry is not None:
+            table, slot = entry
+            table.release(slot)
+
+    def clear(self):
+        """Detach every genome"""
+        for table, slot in self.slots.values():
+            table.release(slot)
+        self.slots.clear()
+
+    def _pooled(self, organisms):
+        """Per table: (positions in organisms, rows) of the organisms whose genome is pooled.
+
+        Also returns the positions of the organisms that are not pooled.
+        """
+        groups = {}
+        unpooled = []
+        for i, organism in enumerate(organisms):
+            entry = self.slots.get(organism.id)
+            if entry is not None and entry[0].genomes[entry[1]] is organism.genome:
+                positions, rows = groups.setdefault(entry[0], ([], []))
+                positions.append(i)
+                rows.append(entry[1])
+            else:
+                unpooled.append(i)
+        return groups, unpooled
+
+    def brain_params(self, organisms):
+        """Brain parameters of same-topology organisms as one (n, params) array"""
+        start, stop = organisms[0].genome.schema.fields['brain'][1:]
+        groups, unpooled = self._pooled(organisms)
+        params = np.empty((len(organisms), stop - start), dtype=np.float32)
+        for table, (positions, rows) in groups.items():
+            start, stop = table.schema.fields['brain'][1:]
+            params[positions] = table.rows[rows, start:stop]
+        for i in unpooled:
+            params[i] = organisms[i].genome['brain'].params
+        return params
+
+    def forward(self, organisms, inputs):
+        """Batched forward pass for same-topology organisms, straight from the pool"""
+        from neural_network import forward_params
+        params = self.brain_params(organisms)
+        return forward_params(params, organisms[0].genome.schema.topology, inputs)
+
+    def mutate(self, organisms, config, rng):
+        """Mutate the pooled genomes of these organisms in place, all at once.
+
+        Same rules as Genome.mutated, drawn for every row together from
+        rng.np. Organisms that are not pooled are left alone.
+
+        Universe.apply_births_and_deaths calls this for a tick's offspring
+        before adding them, so the organism store's gene columns and the
+        lineage record are filled in from the mutated genes (and snapshot
+        deltas record offspring in full). Organisms already in a universe
+        would need OrganismStore.sync_genes afterwards.
+        """
+        groups, _ = self._pooled(organisms)
+        for table, (_, rows) in groups.items():
+            limits = table.schema.limits(config)
+            rows = np.asarray(rows)
+            block = table.rows[rows]
+            n = len(block)
+
+            if limits.brain is not None:
+                picked = np.repeat(rng.np.random((n, len(limits.brain_layers))) < limits.brain_rate,
+                                   limits.brain_layers, axis=1)
+                row, column = np.nonzero(picked)
+                hit = rng.np.random(len(row)) < limits.brain_rate
+                block[row[hit], limits.brain + column[hit]] += \
+                    rng.np.standard_normal(int(hit.sum())) * limits.brain_strength
+
+            if limits.mutable:
+                which = np.flatnonzero(rng.np.random(n) < limits.rate)
+                genes = rng.np.integers(len(limits.mutable), size=len(which))
+                block[which, np.asarray(limits.mutable)[genes]] += \
+                    rng.np.standard_normal(len(which)) * limits.mutable_sigma[genes]
+                if limits.color is not None:
+                    recolor = which[rng.np.random(len(which)) < COLOR_MUTATION_CHANCE]
+                    block[recolor, limits.color] += rng.np.integers(-COLOR_SHIFT, COLOR_SHIFT + 1,
+                                                                    (len(recolor), 3))
+
+            np.clip(block, limits.low, limits.high, out=block)
+            table.rows[rows] = block
+
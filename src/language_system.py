@@ -155,7 +155,7 @@ class LanguageSystem:
         symbol = self.lexicon.get_meaning(meaning)
         
         # If no symbol exists, maybe invent one
-        if not symbol and random.random() < self.innovation_rate:
+        if not symbol and self.organism.rng.cognition.random() < self.innovation_rate:
             symbol = self.lexicon.create_symbol(meaning)
         
         if not symbol:
@@ -182,7 +182,7 @@ class LanguageSystem:
             symbol = self.lexicon.get_meaning(meaning)
             if not symbol:
                 # Invent if needed
-                if random.random() < self.innovation_rate:
+                if self.organism.rng.cognition.random() < self.innovation_rate:
                     symbol = self.lexicon.create_symbol(meaning)
             
             if symbol:
@@ -223,7 +223,7 @@ class LanguageSystem:
                 meanings.append(known_symbol.meaning)
             else:
                 # Learn new symbol
-                if random.random() < self.learning_rate:
+                if self.organism.rng.cognition.random() < self.learning_rate:
                     # Copy symbol to our lexicon
                     new_symbol = Symbol(symbol.form, symbol.meaning)
                     self.lexicon.symbols[symbol.form] = new_symbol
@@ -262,7 +262,7 @@ class LanguageSystem:
         """Spontaneously create new symbol"""
         # Invent symbol for common experience
         common_meanings = ['food', 'danger', 'friend', 'home', 'tool']
-        meaning = random.choice(common_meanings)
+        meaning = self.organism.rng.cognition.choice(common_meanings)
         
         # Only if we don't have one already
         if not self.lexicon.get_meaning(meaning):
@@ -0,0 +1,180 @@
+"""
+Lineage Store
+Compact, append-only ancestry records kept apart from the organisms
+
+Organisms only remember their parent's ID. Who descended from whom is
+recorded here instead, one row per birth: (ID, parent ID, birth tick,
+genome hash) in growable NumPy arrays. Dead organisms are therefore not
+kept alive by their descendants, and prune() drops the records of
+branches that died out so long runs stay bounded.
+"""
+
+import hashlib
+import numpy as np
+from genome import Genome
+
+# name -> dtype of each record column
+LINEAGE_COLUMNS = {
+    'id': np.int64,
+    'parent_id': np.int64,    # -1: no recorded parent
+    'birth_tick': np.int64,   # -1: unknown (e.g. rebuilt from an old save)
+    'genome_hash': np.uint64,
+}
+
+
+def genome_hash(genome):
+    """64-bit hash of a genome's genes and brain weights"""
+    digest = hashlib.blake2b(digest_size=8)
+    if isinstance(genome, Genome):
+        # Flat genomes: the layout, the vector, then any genes outside it
+        digest.update(repr(genome.schema.keys).encode())
+        digest.update(genome.vector.tobytes())
+        genome = genome.extras or {}
+    for key in sorted(genome):
+        value = genome[key]
+        if hasattr(value, 'get_params'):
+            digest.update(value.get_params().tobytes())
+        else:
+            digest.update(repr((key, value)).encode())
+    return int.from_bytes(digest.digest(), 'little')
+
+
+class LineageStore:
+    """Ancestry records in ID order, one row per recorded organism.
+
+    Rows are appended as organisms are born; IDs are handed out in
+    increasing order, so lookups are binary searches.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.columns = {name: np.zeros(self.capacity, dtype=dtype)
+                        for name, dtype in LINEAGE_COLUMNS.items()}
+        self._sorted = True
+        self.pruned = 0  # Records dropped by prune() so far
+
+    def __len__(self):
+        return self.count
+
+    def __getattr__(self, name):
+        # Convenience access: lineage.id, lineage.parent_id, ... (live rows only)
+        columns = self.__dict__.get('columns')
+        if columns is not None and name in columns:
+            return columns[name][:self.count]
+        raise AttributeError(name)
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def _grow(self):
+        """Double capacity, keeping existing rows"""
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def record(self, organism, tick):
+        """Append a birth record for an organism"""
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        columns = self.columns
+        if i and organism.id <= columns['id'][i - 1]:
+            self._sorted = False
+        parent_id = getattr(organism, 'parent_id', None)
+        columns['id'][i] = organism.id
+        columns['parent_id'][i] = -1 if parent_id is None else parent_id
+        columns['birth_tick'][i] = tick
+        columns['genome_hash'][i] = genome_hash(organism.genome)
+        self.count += 1
+
+    def _sort(self):
+        if not self._sorted:
+            order = np.argsort(self.id, kind='stable')
+            for name, column in self.columns.items():
+                column[:self.count] = column[:self.count][order]
+            self._sorted = True
+
+    def rows(self, ids):
+        """Row of each ID (-1 where there is no record)"""
+        self._sort()
+        ids = np.asarray(ids, dtype=np.int64)
+        recorded = self.id
+        rows = np.searchsorted(recorded, ids)
+        clipped = np.minimum(rows, max(self.count - 1, 0))
+        found = (rows < self.count) & (recorded[clipped] == ids) if self.count else np.zeros(len(ids), bool)
+        return np.where(found, rows, -1)
+
+    def get(self, organism_id):
+        """Record of one organism as a dict, or None"""
+        row = int(self.rows([organism_id])[0])
+        if row < 0:
+            return None
+        return {name: self.columns[name][row].item() for name in LINEAGE_COLUMNS}
+
+    def parent_of(self, organism_id):
+        """Recorded parent ID, or None"""
+        record = self.get(organism_id)
+        if record is None or record['parent_id'] < 0:
+            return None
+        return record['parent_id']
+
+    def ancestors(self, organism_id):
+        """IDs of recorded ancestors, parent first"""
+        chain = []
+        parent = self.parent_of(organism_id)
+        while parent is not None:
+            chain.append(parent)
+            parent = self.parent_of(parent)
+        return chain
+
+    def prune(self, living_ids):
+        """Drop records of extinct branches; returns how many were dropped.
+
+        Kept: the living organisms and every recorded ancestor of one.
+        """
+        self._sort()
+        keep = np.zeros(self.count, dtype=bool)
+        frontier = self.rows(np.fromiter(living_ids, dtype=np.int64))
+        frontier = frontier[frontier >= 0]
+        parent_ids = self.parent_id
+        while len(frontier):
+            keep[frontier] = True
+            parents = self.rows(parent_ids[frontier][parent_ids[frontier] >= 0])
+            frontier = np.unique(parents[parents >= 0])
+            frontier = frontier[~keep[frontier]]
+
+        dropped = self.count - int(keep.sum())
+        if dropped:
+            kept = np.flatnonzero(keep)
+            for name, column in self.columns.items():
+                column[:len(kept)] = column[kept]
+            self.count = len(kept)
+            self.pruned += dropped
+        return dropped
+
+    def arrays(self):
+        """Copies of the live rows, by column name (for saving)"""
+        self._sort()
+        return {name: self.columns[name][:self.count].copy() for name in LINEAGE_COLUMNS}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Store holding previously saved rows"""
+        count = len(arrays['id'])
+        lineage = cls(capacity=count)
+        for name, dtype in LINEAGE_COLUMNS.items():
+            lineage.columns[name][:count] = np.asarray(arrays[name], dtype=dtype)
+        lineage.count = count
+        return lineage
+
+    @classmethod
+    def from_organisms(cls, organisms):
+        """Store with one row per organism (birth ticks unknown)"""
+        lineage = cls(capacity=len(organisms))
+        for organism in sorted(organisms, key=lambda organism: organism.id):
+            lineage.record(organism, -1)
+        return lineage
@@ -5,7 +5,6 @@ The first truly open-ended artificial life system
 Run this to start the simulation and watch evolution unfold.
 """
 
-import random
 import sys
 from universe import Universe
 from organism import Organism
@@ -13,34 +12,37 @@ from visualizer import Visualizer
 from persistence import SimulationSaver, restore_universe
 from config import *
 
-def initialize_universe():
+def initialize_universe(seed=None, config=None):
     """Create universe and spawn initial organisms"""
-    universe = Universe()
+    universe = Universe(seed=seed, config=config)
+    config = universe.config
+    rng = universe.rng.spawn
     
     print("🌍 Initializing GENESIS Digital Biosphere...")
-    print(f"   Grid: {GRID_WIDTH}x{GRID_HEIGHT}")
-    print(f"   Initial organisms: {INITIAL_ORGANISMS}")
-    print(f"   Mutation rate: {MUTATION_RATE * 100}%")
-    print(f"   Neural networks: {USE_NEURAL_NETWORKS}")
-    print(f"   Predators enabled: {ENABLE_PREDATORS}")
-    print(f"   Communication enabled: {ENABLE_COMMUNICATION}")
-    print(f"   Multi-cellular enabled: {ENABLE_MULTICELLULAR}")
+    print(f"   Grid: {config.GRID_WIDTH}x{config.GRID_HEIGHT}")
+    print(f"   Initial organisms: {config.INITIAL_ORGANISMS}")
+    print(f"   Mutation rate: {config.MUTATION_RATE * 100}%")
+    print(f"   Neural networks: {config.USE_NEURAL_NETWORKS}")
+    print(f"   Predators enabled: {config.ENABLE_PREDATORS}")
+    print(f"   Communication enabled: {config.ENABLE_COMMUNICATION}")
+    print(f"   Multi-cellular enabled: {config.ENABLE_MULTICELLULAR}")
+    print(f"   Random seed: {universe.rng.seed}")
     print()
     
     # Spawn initial prey organisms
-    for _ in range(INITIAL_ORGANISMS):
-        x = random.randint(0, GRID_WIDTH - 1)
-        y = random.randint(0, GRID_HEIGHT - 1)
-        organism = Organism(x, y)
+    for _ in range(config.INITIAL_ORGANISMS):
+        x = rng.randint(0, config.GRID_WIDTH - 1)
+        y = rng.randint(0, config.GRID_HEIGHT - 1)
+        organism = Organism(x, y, rng=universe.rng, config=config)
         universe.add_organism(organism)
     
     # Spawn initial predators
-    if ENABLE_PREDATORS:
+    if config.ENABLE_PREDATORS:
         from predator import Predator
-        for _ in range(INITIAL_PREDATORS):
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            predator = Predator(x, y)
+        for _ in range(config.INITIAL_PREDATORS):
+            x = rng.randint(0, config.GRID_WIDTH - 1)
+            y = rng.randint(0, config.GRID_HEIGHT - 1)
+            predator = Predator(x, y, rng=universe.rng, config=config)
             universe.add_organism(predator)
     
     print("✅ Universe initialized")
@@ -57,16 +59,61 @@ def log_stats(universe):
           f"Births: {stats['total_births']:5d} | "
           f"Deaths: {stats['total_deaths']:5d} | "
           f"Avg Energy: {stats['avg_organism_energy']:6.1f}")
+    
+    # Periodic profile dump
+    if (universe.profiler.enabled and PROFILE_LOG_INTERVAL
+            and stats['tick'] % PROFILE_LOG_INTERVAL == 0):
+        print(universe.profiler.report())
+
+def run_sharded(workers, config=None):
+    """Headless run with the world split across worker processes (no saves)"""
+    from sharding import ShardedUniverse
+    
+    print(f"🧩 Running SHARDED across {workers} worker processes (headless, no saves)")
+    print("   Press Ctrl+C to stop")
+    with ShardedUniverse(workers=workers, config=config) as world:
+        rng = world.rng.spawn
+        for _ in range(world.config.INITIAL_ORGANISMS):
+            x = rng.randint(0, world.width - 1)
+            y = rng.randint(0, world.height - 1)
+            world.add_organism(Organism(x, y, rng=world.rng, config=world.config))
+        
+        try:
+            while world.update():
+                stats = world.get_stats()
+                if ENABLE_LOGGING and world.tick % LOG_INTERVAL == 0:
+                    print(f"[Tick {stats['tick']:6d}] "
+                          f"Pop: {stats['population']:4d} | "
+                          f"Births: {stats['total_births']:5d} | "
+                          f"Deaths: {stats['total_deaths']:5d} | "
+                          f"Shards: {stats['shard_populations']}")
+                if stats['population'] == 0:
+                    print(f"\n💀 EXTINCTION at tick {world.tick}")
+                    break
+        except KeyboardInterrupt:
+            print("\n\n⚠️ Simulation interrupted by user")
+        
+        stats = world.get_stats()
+        print(f"\nTotal ticks: {stats['tick']} | Final population: {stats['population']} | "
+              f"Peak population: {stats['peak_population']}")
 
 def main():
     """Main simulation loop"""
     # Check for headless mode
     headless = '--headless' in sys.argv
     
+    # Sharded mode (--shards N, or SHARD_WORKERS in config) is headless only
+    workers = SHARD_WORKERS
+    if '--shards' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--shards') + 1])
+    if workers > 1:
+        run_sharded(workers)
+        return
+    
     # Check for save file argument
     saver = SimulationSaver()
     
-    if len(sys.argv) > 1 and sys.argv[1] != '--headless':
+    if len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
         # Load from save file
         save_filename = sys.argv[1]
         save_data = saver.load(save_filename)
@@ -138,9 +185,10 @@ def main():
         print("\n\n⚠️ Simulation interrupted by user")
     
     finally:
-        # Save before exit
+        # Save before exit (after any autosave still being written)
         print("\n💾 Saving simulation state...")
-        final_save = saver.save(universe, "final_save.pkl")
+        saver.flush()
+        final_save = saver.save(universe, "final_save")
         
         # Final statistics
         stats = universe.get_stats()
@@ -155,7 +203,7 @@ def main():
         print(f"Energy consumed:    {stats['total_energy_consumed']:.0f}")
         print("="*60)
         print(f"\n💾 Saved to: {final_save}")
-        print("   To resume: python run.py final_save.pkl")
+        print("   To resume: python run.py final_save")
         
         if not headless:
             visualizer.close()
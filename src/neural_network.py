@@ -5,59 +5,181 @@ Simple feedforward neural network that evolves through mutation
 
 import numpy as np
 import random
+import threading
 from config import *
 
+def _layer_slices(input_size, hidden_sizes, output_size):
+    """((weights slice, weights shape), biases slice) per layer of a flat parameter vector"""
+    key = (input_size, tuple(hidden_sizes), output_size)
+    layers = _LAYERS.get(key)
+    if layers is None:
+        layers = []
+        offset = 0
+        sizes = [input_size] + list(hidden_sizes) + [output_size]
+        for prev_size, size in zip(sizes[:-1], sizes[1:]):
+            weights = (slice(offset, offset + prev_size * size), (prev_size, size))
+            offset += prev_size * size
+            layers.append((weights, slice(offset, offset + size)))
+            offset += size
+        layers = _LAYERS[key] = (tuple(layers), offset)
+    return layers
+
+_LAYERS = {}  # topology -> layer slices, parameter count
+
+# Per-thread forward-pass buffers, by (topology, dtype)
+_scratch = threading.local()
+
+
 class NeuralNetwork:
-    """Simple neural network for organism decision-making"""
+    """Simple neural network for organism decision-making.
+    
+    All weights and biases live in one flat vector, `params` (layer by
+    layer, W then b); `weights` and `biases` are views into it.
+    """
+    
+    def __init__(self, input_size=10, hidden_sizes=[8, 8], output_size=6, rng=None):
+        self._bind(input_size, hidden_sizes, output_size, None)
+        
+        # Initialize weights randomly (from rng's numpy generator if given); biases start at 0
+        normal = rng.np.standard_normal if rng is not None else np.random.standard_normal
+        for weights in self.weights:
+            weights[...] = normal(weights.shape) * 0.5
     
-    def __init__(self, input_size=10, hidden_sizes=[8, 8], output_size=6):
+    def _bind(self, input_size, hidden_sizes, output_size, params, dtype=np.float64):
+        """Adopt a parameter vector (a new zeroed one if None) and view it as layers"""
+        layers, size = _layer_slices(input_size, hidden_sizes, output_size)
         self.input_size = input_size
-        self.hidden_sizes = hidden_sizes
+        self.hidden_sizes = list(hidden_sizes)
         self.output_size = output_size
+        self.params = np.zeros(size, dtype=dtype) if params is None else params
+        self.weights = [self.params[w].reshape(shape) for (w, shape), b in layers]
+        self.biases = [self.params[b] for w, b in layers]
+    
+    @classmethod
+    def empty(cls, input_size, hidden_sizes, output_size, dtype=np.float64):
+        """Network with uninitialised parameters (to be filled in by the caller)"""
+        net = cls.__new__(cls)
+        size = _layer_slices(input_size, hidden_sizes, output_size)[1]
+        net._bind(input_size, hidden_sizes, output_size, np.empty(size, dtype=dtype))
+        return net
+    
+    def forward(self, inputs, out=None):
+        """Forward pass through network.
         
-        # Initialize weights randomly
-        self.weights = []
-        self.biases = []
-        
-        # Input to first hidden layer
-        prev_size = input_size
-        for hidden_size in hidden_sizes:
-            self.weights.append(np.random.randn(prev_size, hidden_size) * 0.5)
-            self.biases.append(np.zeros(hidden_size))
-            prev_size = hidden_size
+        Hidden activations go to per-thread scratch buffers; the outputs go
+        to `out` if given, else to a new array.
+        """
+        key = (self.topology, self.params.dtype)
+        buffers = getattr(_scratch, 'buffers', None)
+        if buffers is None:
+            buffers = _scratch.buffers = {}
+        scratch = buffers.get(key)
+        if scratch is None:
+            sizes = [self.input_size] + self.hidden_sizes
+            scratch = buffers[key] = [np.empty(size, dtype=self.params.dtype) for size in sizes]
         
-        # Last hidden to output
-        self.weights.append(np.random.randn(prev_size, output_size) * 0.5)
-        self.biases.append(np.zeros(output_size))
-    
-    def forward(self, inputs):
-        """Forward pass through network"""
-        activation = np.array(inputs)
+        activation = scratch[0]
+        activation[:] = inputs
         
         # Hidden layers with ReLU
         for i in range(len(self.weights) - 1):
-            activation = np.maximum(0, np.dot(activation, self.weights[i]) + self.biases[i])
+            hidden = scratch[i + 1]
+            np.dot(activation, self.weights[i], out=hidden)
+            hidden += self.biases[i]
+            np.maximum(hidden, 0, out=hidden)
+            activation = hidden
         
         # Output layer with sigmoid
-        output = 1 / (1 + np.exp(-(np.dot(activation, self.weights[-1]) + self.biases[-1])))
-        
-        return output
+        output = np.dot(activation, self.weights[-1])
+        output += self.biases[-1]
+        np.negative(output, out=output)
+        np.exp(output, out=output)
+        output += 1
+        return np.reciprocal(output, out=output if out is None else out)
+    
+    @property
+    def topology(self):
+        """Layer sizes; networks with equal topology can be batched together"""
+        return (self.input_size, tuple(self.hidden_sizes), self.output_size)
     
-    def mutate(self, mutation_rate=0.1, mutation_strength=0.2):
-        """Mutate network weights"""
+    def mutate(self, mutation_rate=0.1, mutation_strength=0.2, rng=None):
+        """Mutate network weights (drawing from rng, a Stream, if given)"""
+        if rng is None:
+            rng_py, rng_np = random, np.random
+        else:
+            rng_py, rng_np = rng, rng.np
+        
         for i in range(len(self.weights)):
-            if random.random() < mutation_rate:
+            if rng_py.random() < mutation_rate:
                 # Mutate weights
-                mask = np.random.random(self.weights[i].shape) < mutation_rate
-                self.weights[i] += mask * np.random.randn(*self.weights[i].shape) * mutation_strength
+                mask = rng_np.random(self.weights[i].shape) < mutation_rate
+                self.weights[i] += mask * rng_np.standard_normal(self.weights[i].shape) * mutation_strength
                 
                 # Mutate biases
-                mask = np.random.random(self.biases[i].shape) < mutation_rate
-                self.biases[i] += mask * np.random.randn(*self.biases[i].shape) * mutation_strength
+                mask = rng_np.random(self.biases[i].shape) < mutation_rate
+                self.biases[i] += mask * rng_np.standard_normal(self.biases[i].shape) * mutation_strength
+    
+    def get_params(self):
+        """All weights and biases as one flat vector (layer by layer, W then b)"""
+        return self.params.copy()
+    
+    @classmethod
+    def from_params(cls, params, input_size, hidden_sizes, output_size, copy=True):
+        """Network with the given topology whose parameters come from a flat vector.
+        
+        With copy=False the weights and biases are views into `params`.
+        """
+        net = cls.__new__(cls)
+        params = np.array(params, copy=True) if copy else params
+        net._bind(input_size, hidden_sizes, output_size, params)
+        return net
     
     def copy(self):
-        """Create a copy of this network"""
-        new_net = NeuralNetwork(self.input_size, self.hidden_sizes, self.output_size)
-        new_net.weights = [w.copy() for w in self.weights]
-        new_net.biases = [b.copy() for b in self.biases]
+        """Create a copy of this network (one buffer copy, no initialisation)"""
+        new_net = self.__class__.__new__(self.__class__)
+        new_net._bind(self.input_size, self.hidden_sizes, self.output_size, self.params.copy())
         return new_net
+    
+    def __getstate__(self):
+        return {'topology': self.topology, 'params': self.params}
+    
+    def __setstate__(self, state):
+        if 'params' not in state:
+            # Pickles from before the flat parameter vector held per-layer arrays
+            parts = [part.ravel() for layer in zip(state['weights'], state['biases']) for part in layer]
+            state = {'topology': (state['input_size'], state['hidden_sizes'], state['output_size']),
+                     'params': np.concatenate(parts)}
+        self._bind(*state['topology'], state['params'])
+
+
+def forward_batch(networks, inputs):
+    """Forward pass for many same-topology networks at once.
+    
+    `inputs` has one row per network. Returns an (n, output_size) array.
+    """
+    params = np.stack([net.params for net in networks])
+    return forward_params(params, networks[0].topology, inputs)
+
+
+def forward_params(params, topology, inputs):
+    """Forward pass for n networks given as stacked flat parameters (n, params).
+    
+    Each layer's weights are viewed as a (n, in, out) tensor and applied
+    with one batched matmul; no per-network objects are needed.
+    """
+    layers = _layer_slices(*topology)[0]
+    n = len(params)
+    activation = np.asarray(inputs, dtype=params.dtype)[:, np.newaxis, :]
+    
+    for i, ((weights, shape), biases) in enumerate(layers):
+        activation = np.matmul(activation, params[:, weights].reshape(n, *shape))
+        activation += params[:, np.newaxis, biases]
+        
+        if i < len(layers) - 1:
+            # Hidden layers with ReLU
+            np.maximum(activation, 0, out=activation)
+        else:
+            # Output layer with sigmoid
+            activation = 1 / (1 + np.exp(-activation))
+    
+    return activation[:, 0, :]
@@ -1,303 +1,310 @@
-import random
 import numpy as np
 from config import *
+from rng import default_streams
+from simulation_config import default_config
+from vision import get_table as get_vision_table
+from neural_network import NeuralNetwork
+from genome import Genome
+from ring_buffer import RingBuffer
 
-if USE_NEURAL_NETWORKS:
-    from neural_network import NeuralNetwork
+def _subsystem(module, cls):
+    """Factory for a cognitive subsystem, imported on first use"""
+    def create(organism):
+        return getattr(__import__(module), cls)(organism)
+    return create
+
+# Per-organism state created on first use, only while its feature is on:
+# attribute -> (setting, factory)
+LAZY_ATTRIBUTES = {
+    'memory': ('ENABLE_MEMORY', lambda organism: RingBuffer(organism.config.MEMORY_SIZE, 3)),  # (x, y, energy_found)
+    'kin': ('ENABLE_SOCIAL', lambda organism: []),  # Recognized kin
+    'cells': ('ENABLE_MULTICELLULAR', lambda organism: [organism]),  # Cells of this organism
+    # Phase 4/5 cognitive subsystems
+    'reasoning': ('ENABLE_ABSTRACT_REASONING', _subsystem('abstract_reasoning', 'AbstractReasoning')),
+    'language': ('ENABLE_LANGUAGE', _subsystem('language_system', 'LanguageSystem')),
+    'self_awareness': ('ENABLE_SELF_AWARENESS', _subsystem('self_awareness', 'SelfAwareness')),
+    'creativity': ('ENABLE_CREATIVITY', _subsystem('creativity', 'CreativitySystem')),
+    'self_modification': ('ENABLE_SELF_MODIFICATION', _subsystem('self_modification', 'SelfModificationSystem')),
+    'agi': ('ENABLE_GENERAL_INTELLIGENCE', _subsystem('agi_emergence', 'GeneralIntelligence')),
+}
+COGNITIVE_ATTRIBUTES = ('reasoning', 'language', 'self_awareness', 'creativity',
+                        'self_modification', 'agi')
+
+_SLOTS = {}  # class -> ((name, slot descriptor), ...)
+
+def _slots(cls):
+    """Slot attributes of an organism class and its bases"""
+    slots = _SLOTS.get(cls)
+    if slots is None:
+        slots = _SLOTS[cls] = tuple(
+            (name, vars(klass)[name]) for klass in reversed(cls.__mro__)
+            for name in vars(klass).get('__slots__', ()) if name not in ('__weakref__', '__dict__'))
+    return slots
 
 class Organism:
-    """A digital life form that can move, eat, and reproduce"""
+    """A digital life form that can move, eat, and reproduce.
+    
+    Organisms are slotted: no per-instance __dict__. State a feature needs
+    (LAZY_ATTRIBUTES) is created the first time it is used, and only while
+    the feature is on, so hasattr(organism, 'language') still tells whether
+    the organism has language.
+    """
+    
+    __slots__ = ('config', 'id', 'rng', 'x', 'y', 'energy', 'age', 'generation', 'is_predator',
+                 'parent_id', 'direction', 'is_multicellular', 'group', 'genome',
+                 '_store', '_slot', '__weakref__') + tuple(LAZY_ATTRIBUTES)
+    
+    living_cost = ENERGY_COST_ALIVE  # Energy cost per tick just to exist
     
-    def __init__(self, x, y, genome=None, parent=None):
+    _next_id = 1  # Next stable organism ID to hand out
+    _id_step = 1  # Stride between IDs (sharded worlds interleave ID ranges)
+    
+    def __init__(self, x, y, genome=None, parent=None, rng=None, config=None):
+        # Settings: the universe's, inherited from the parent by default
+        if config is None:
+            config = parent.config if parent is not None else default_config
+        self.config = config
+        
+        # Stable integer ID: unique within a run and kept across saves
+        self.id = Organism.new_id()
+        
+        # Random streams: the universe's, inherited from the parent by default
+        if rng is None:
+            rng = parent.rng if parent is not None else default_streams
+        self.rng = rng
+        
         self.x = x
         self.y = y
-        self.energy = ORGANISM_START_ENERGY
+        self.energy = config.ORGANISM_START_ENERGY
         self.age = 0
         self.generation = 0
         self.is_predator = False
-        self.parent = parent
+        self.parent_id = parent.id if parent is not None else None  # Ancestry: see lineage.py
         
         # Phase 2: Directional sensing
-        if ENABLE_DIRECTIONAL_SENSING:
-            self.direction = random.randint(0, 7)  # 0=N, 1=NE, 2=E, 3=SE, 4=S, 5=SW, 6=W, 7=NW
-        
-        # Phase 2: Memory system
-        if ENABLE_MEMORY:
-            self.memory = []  # List of (x, y, energy_found) tuples
-            self.visited_recently = set()
+        if config.ENABLE_DIRECTIONAL_SENSING:
+            self.direction = self.rng.movement.randint(0, 7)  # 0=N, 1=NE, 2=E, 3=SE, 4=S, 5=SW, 6=W, 7=NW
         
-        # Phase 3: Multi-cellular
-        if ENABLE_MULTICELLULAR:
-            self.cells = [self]  # List of cells in this organism
+        # Phase 3: Multi-cellular (cells: see LAZY_ATTRIBUTES, like memory and kin)
+        if config.ENABLE_MULTICELLULAR:
             self.is_multicellular = False
         
         # Phase 3: Social
-        if ENABLE_SOCIAL:
-            self.kin = []  # List of recognized kin
+        if config.ENABLE_SOCIAL:
             self.group = None
         
-        # Phase 4: Abstract Reasoning
-        if ENABLE_ABSTRACT_REASONING:
-            from abstract_reasoning import AbstractReasoning
-            self.reasoning = AbstractReasoning(self)
-        
-        # Phase 4: Language
-        if ENABLE_LANGUAGE:
-            from language_system import LanguageSystem
-            self.language = LanguageSystem(self)
-        
-        # Phase 4: Self-Awareness
-        if ENABLE_SELF_AWARENESS:
-            from self_awareness import SelfAwareness
-            self.self_awareness = SelfAwareness(self)
-        
-        # Phase 4: Creativity
-        if ENABLE_CREATIVITY:
-            from creativity import CreativitySystem
-            self.creativity = CreativitySystem(self)
-        
-        # Phase 4.5: Self-Modification (Experimental)
-        if ENABLE_SELF_MODIFICATION:
-            from self_modification import SelfModificationSystem
-            self.self_modification = SelfModificationSystem(self)
-        
-        # Phase 5: AGI Emergence
-        if ENABLE_GENERAL_INTELLIGENCE:
-            from agi_emergence import GeneralIntelligence
-            self.agi = GeneralIntelligence(self)
-        
         # Genome - the "DNA" that defines behavior
         if genome is None:
             self.genome = self._create_random_genome()
         else:
-            self.genome = genome.copy()
+            # Own copy of the genes (brain included)
+            self.genome = genome.copy() if isinstance(genome, Genome) else Genome.from_dict(genome)
             self.generation = genome.get('generation', 0) + 1
-            
-            # Copy neural network if using them
-            if USE_NEURAL_NETWORKS and 'brain' in genome:
-                self.genome['brain'] = genome['brain'].copy()
+    
+    @staticmethod
+    def new_id():
+        """Hand out the next stable organism ID"""
+        organism_id = Organism._next_id
+        Organism._next_id += Organism._id_step
+        return organism_id
+    
+    @staticmethod
+    def reserve_ids(max_id):
+        """Make sure future IDs are greater than max_id (e.g. after loading)"""
+        step = Organism._id_step
+        if Organism._next_id <= max_id:
+            # Skip ahead whole strides so the ID sequence keeps its offset
+            Organism._next_id += (max_id - Organism._next_id) // step * step + step
+    
+    @staticmethod
+    def interleave_ids(offset, step):
+        """Hand out IDs offset, offset + step, ... (one ID range per shard)"""
+        Organism._next_id = offset
+        Organism._id_step = step
+    
+    def __getattr__(self, name):
+        # Only reached for attributes that are not set: create lazy ones on first use
+        lazy = LAZY_ATTRIBUTES.get(name)
+        if lazy is not None:
+            setting, create = lazy
+            if getattr(self.config, setting):
+                value = create(self)
+                setattr(self, name, value)
+                return value
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    def _reset_cognition(self):
+        """Drop the Phase 4/5 subsystems; they start afresh on next use"""
+        for name in COGNITIVE_ATTRIBUTES:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+    
+    def attributes(self):
+        """Every attribute that is set, by name (lazy ones are not created)"""
+        values = {}
+        for name, slot in _slots(type(self)):
+            try:
+                values[name] = slot.__get__(self)
+            except AttributeError:
+                pass
+        values.update(getattr(self, '__dict__', None) or {})  # Subclasses without __slots__
+        return values
+    
+    def __getstate__(self):
+        return self.attributes()
+    
+    def __setstate__(self, state):
+        """Set attributes from a dict (pickles, snapshot extras), converting old ones"""
+        state = dict(state)
+        # Saves from before organisms had IDs get fresh ones (set before
+        # children read them as their parent's ID)
+        if 'id' not in state and 'id' not in self.attributes():
+            state['id'] = Organism.new_id()
+        # Saves from before the lineage store held parent objects
+        if 'parent' in state:
+            parent = state.pop('parent')
+            if parent is not None and 'id' not in parent.attributes():
+                parent.id = Organism.new_id()  # Not unpickled yet; it keeps this ID
+            state.setdefault('parent_id', parent.id if parent is not None else None)
+        # Saves from before organisms were slotted
+        state.pop('visited_recently', None)  # Never read
+        if isinstance(state.get('memory'), list):
+            size = getattr(state.get('config'), 'MEMORY_SIZE', MEMORY_SIZE)
+            state['memory'] = RingBuffer.from_rows(state['memory'], size, 3)
+        for name, value in state.items():
+            setattr(self, name, value)
     
     def _create_random_genome(self):
         """Create random genetic code"""
         genome = {
-            'move_probability': random.random(),
-            'move_randomness': random.random(),
-            'eat_threshold': random.random() * 50,
-            'reproduce_threshold': MIN_ENERGY_TO_REPLICATE + random.random() * 100,
+            'move_probability': self.rng.mutation.random(),
+            'move_randomness': self.rng.mutation.random(),
+            'eat_threshold': self.rng.mutation.random() * 50,
+            'reproduce_threshold': self.config.MIN_ENERGY_TO_REPLICATE + self.rng.mutation.random() * 100,
             'generation': 0,
-            'color': (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
+            'color': (self.rng.mutation.randint(50, 255), self.rng.mutation.randint(50, 255), self.rng.mutation.randint(50, 255))
         }
         
         # Phase 2: Add neural network brain
-        if USE_NEURAL_NETWORKS:
+        if self.config.USE_NEURAL_NETWORKS:
             genome['brain'] = NeuralNetwork(
                 input_size=10,
-                hidden_sizes=NEURAL_HIDDEN_LAYERS,
-                output_size=6
+                hidden_sizes=self.config.NEURAL_HIDDEN_LAYERS,
+                output_size=6,
+                rng=self.rng.mutation
             )
         
         # Phase 2: Communication genes
-        if ENABLE_COMMUNICATION:
-            genome['signal_probability'] = random.random() * 0.1
-            genome['signal_response'] = random.random()
+        if self.config.ENABLE_COMMUNICATION:
+            genome['signal_probability'] = self.rng.mutation.random() * 0.1
+            genome['signal_response'] = self.rng.mutation.random()
         
         # Phase 3: Social genes
-        if ENABLE_SOCIAL:
-            genome['cooperation'] = random.random()
-            genome['aggression'] = random.random()
+        if self.config.ENABLE_SOCIAL:
+            genome['cooperation'] = self.rng.mutation.random()
+            genome['aggression'] = self.rng.mutation.random()
         
         # Phase 4: Cognitive genes
-        if ENABLE_ABSTRACT_REASONING:
-            genome['pattern_recognition'] = random.random()
-            genome['causal_reasoning'] = random.random()
+        if self.config.ENABLE_ABSTRACT_REASONING:
+            genome['pattern_recognition'] = self.rng.mutation.random()
+            genome['causal_reasoning'] = self.rng.mutation.random()
         
-        if ENABLE_LANGUAGE:
-            genome['language_ability'] = random.random()
-            genome['innovation_tendency'] = random.random()
+        if self.config.ENABLE_LANGUAGE:
+            genome['language_ability'] = self.rng.mutation.random()
+            genome['innovation_tendency'] = self.rng.mutation.random()
         
-        if ENABLE_CREATIVITY:
-            genome['curiosity'] = random.random()
-            genome['exploration_tendency'] = random.random()
+        if self.config.ENABLE_CREATIVITY:
+            genome['curiosity'] = self.rng.mutation.random()
+            genome['exploration_tendency'] = self.rng.mutation.random()
         
-        if ENABLE_SELF_AWARENESS:
-            genome['self_reflection'] = random.random()
-            genome['theory_of_mind'] = random.random()
+        if self.config.ENABLE_SELF_AWARENESS:
+            genome['self_reflection'] = self.rng.mutation.random()
+            genome['theory_of_mind'] = self.rng.mutation.random()
         
-        return genome
+        return Genome.from_dict(genome)
     
     def mutate_genome(self):
-        """Mutate genome during reproduction"""
-        mutated = self.genome.copy()
-        
-        # Mutate neural network if using them
-        if USE_NEURAL_NETWORKS and 'brain' in mutated:
-            mutated['brain'] = mutated['brain'].copy()
-            mutated['brain'].mutate(NEURAL_MUTATION_RATE, NEURAL_MUTATION_STRENGTH)
-        
-        if random.random() < MUTATION_RATE:
-            # Choose random gene to mutate
-            genes = ['move_probability', 'move_randomness', 'eat_threshold', 'reproduce_threshold']
-            
-            if ENABLE_COMMUNICATION:
-                genes.extend(['signal_probability', 'signal_response'])
-            if ENABLE_SOCIAL:
-                genes.extend(['cooperation', 'aggression'])
-            if ENABLE_ABSTRACT_REASONING:
-                genes.extend(['pattern_recognition', 'causal_reasoning'])
-            if ENABLE_LANGUAGE:
-                genes.extend(['language_ability', 'innovation_tendency'])
-            if ENABLE_CREATIVITY:
-                genes.extend(['curiosity', 'exploration_tendency'])
-            if ENABLE_SELF_AWARENESS:
-                genes.extend(['self_reflection', 'theory_of_mind'])
-            
-            gene = random.choice(genes)
-            
-            if gene in ['move_probability', 'move_randomness', 'signal_probability', 
-                       'signal_response', 'cooperation', 'aggression']:
-                mutated[gene] = max(0, min(1, mutated[gene] + random.gauss(0, MUTATION_STRENGTH)))
-            elif gene == 'eat_threshold':
-                mutated[gene] = max(0, mutated[gene] + random.gauss(0, 10))
-            elif gene == 'reproduce_threshold':
-                mutated[gene] = max(MIN_ENERGY_TO_REPLICATE, mutated[gene] + random.gauss(0, 20))
-            
-            # Mutate color slightly
-            if random.random() < 0.3:
-                r, g, b = mutated['color']
-                mutated['color'] = (
-                    max(50, min(255, r + random.randint(-20, 20))),
-                    max(50, min(255, g + random.randint(-20, 20))),
-                    max(50, min(255, b + random.randint(-20, 20)))
-                )
-        
-        return mutated
+        """Mutate genome during reproduction (see Genome.mutated)"""
+        genome = self.genome if isinstance(self.genome, Genome) else Genome.from_dict(self.genome)
+        return genome.mutated(self.config, self.rng.mutation)
     
     def sense_environment(self, universe):
         """Look around and sense nearby energy"""
         nearby_energy = []
-        vision = VISION_RANGE if ENABLE_MEMORY else 1
+        vision = self.config.sensing_range
         
-        for dx in range(-vision, vision + 1):
-            for dy in range(-vision, vision + 1):
-                if dx == 0 and dy == 0:
-                    continue
-                
-                # Phase 2: Directional sensing - only see in forward cone
-                if ENABLE_DIRECTIONAL_SENSING:
-                    if not self._is_in_vision_cone(dx, dy):
-                        continue
-                
-                energy = universe.get_energy(self.x + dx, self.y + dy)
-                nearby_energy.append((dx, dy, energy))
+        # Phase 2: Directional sensing - only see in forward cone
+        if self.config.ENABLE_DIRECTIONAL_SENSING:
+            offsets = get_vision_table(vision, self.config.VISION_CONE_ANGLE).offsets[self.direction]
+        else:
+            offsets = get_vision_table(vision, 360).offsets[0]
+        
+        # Offsets come precomputed, nearest first
+        for dx, dy, _ in offsets:
+            energy = universe.get_energy(self.x + dx, self.y + dy)
+            nearby_energy.append((dx, dy, energy))
         
         return nearby_energy
     
     def _is_in_vision_cone(self, dx, dy):
         """Check if a relative position is within the forward vision cone"""
-        if dx == 0 and dy == 0:
-            return True
-        
-        # Calculate angle to target relative to facing direction
-        import math
-        
-        # Direction vectors for each of 8 directions
-        direction_vectors = [
-            (0, -1),   # 0: North
-            (1, -1),   # 1: NE
-            (1, 0),    # 2: East
-            (1, 1),    # 3: SE
-            (0, 1),    # 4: South
-            (-1, 1),   # 5: SW
-            (-1, 0),   # 6: West
-            (-1, -1)   # 7: NW
-        ]
-        
-        facing_dx, facing_dy = direction_vectors[self.direction]
-        
-        # Calculate angle between facing direction and target
-        # Using dot product to determine if target is in front
-        dot_product = dx * facing_dx + dy * facing_dy
-        
-        # Normalize vectors
-        facing_mag = math.sqrt(facing_dx**2 + facing_dy**2)
-        target_mag = math.sqrt(dx**2 + dy**2)
-        
-        if facing_mag == 0 or target_mag == 0:
-            return True
-        
-        # Calculate angle
-        cos_angle = dot_product / (facing_mag * target_mag)
-        angle_rad = math.acos(max(-1, min(1, cos_angle)))
-        angle_deg = math.degrees(angle_rad)
-        
-        # Check if within vision cone
-        return angle_deg <= (VISION_CONE_ANGLE / 2)
+        return self.config.vision.in_cone(self.direction, dx, dy)
     
     def sense_organisms(self, universe):
         """Detect nearby organisms"""
-        if not ENABLE_SOCIAL:
+        if not self.config.ENABLE_SOCIAL:
             return []
         
         nearby = []
-        for organism in universe.organisms:
+        # Only organisms in nearby buckets are considered (wrap-aware)
+        for organism, dx, dy, distance in universe.organisms_near(self.x, self.y, self.config.VISION_RANGE):
             if organism is self:
                 continue
             
-            dx = organism.x - self.x
-            dy = organism.y - self.y
-            
-            # Handle wrap-around (find shortest path)
-            if abs(dx) > universe.width / 2:
-                dx = dx - universe.width if dx > 0 else dx + universe.width
-            if abs(dy) > universe.height / 2:
-                dy = dy - universe.height if dy > 0 else dy + universe.height
-            
-            distance = (dx ** 2 + dy ** 2) ** 0.5
+            # Phase 2: Directional sensing - only see in forward cone
+            if self.config.ENABLE_DIRECTIONAL_SENSING:
+                if not self._is_in_vision_cone(int(dx), int(dy)):
+                    continue
             
-            if distance <= VISION_RANGE:
-                # Phase 2: Directional sensing - only see in forward cone
-                if ENABLE_DIRECTIONAL_SENSING:
-                    if not self._is_in_vision_cone(int(dx), int(dy)):
-                        continue
-                
-                nearby.append((organism, distance))
+            nearby.append((organism, distance))
         
         return nearby
     
     def sense_signals(self, universe):
         """Detect nearby communication signals"""
-        if not ENABLE_COMMUNICATION or not hasattr(universe, 'signals'):
+        if not self.config.ENABLE_COMMUNICATION or not hasattr(universe, 'signals'):
             return []
         
-        nearby_signals = []
-        for signal in universe.signals:
-            strength = signal.get_strength_at(self.x, self.y)
-            if strength > 0.1:
-                nearby_signals.append((signal, strength))
-        
-        return nearby_signals
+        return universe.signals.sense(self.x, self.y, threshold=0.1)
     
     def emit_signal(self, universe, signal_type):
         """Emit a communication signal"""
-        if not ENABLE_COMMUNICATION or self.energy < SIGNAL_COST:
+        if not self.config.ENABLE_COMMUNICATION or self.energy < self.config.SIGNAL_COST:
             return
         
         if hasattr(universe, 'add_signal'):
-            from signal import Signal
+            from signals import Signal
             universe.add_signal(Signal(self.x, self.y, signal_type, 1.0))
-            self.energy -= SIGNAL_COST
+            self.energy -= self.config.SIGNAL_COST
     
     def decide_move(self, universe):
         """Decide where to move based on genome and environment"""
-        if random.random() > self.genome['move_probability']:
+        # Decision already made by the population-wide batched inference
+        prefetched = universe.neural_moves.pop(self, None)
+        if prefetched is not None:
+            return prefetched
+        
+        if self.rng.movement.random() > self.genome['move_probability']:
             return 0, 0  # Don't move
         
         # Phase 2: Use neural network for decision making
-        if USE_NEURAL_NETWORKS and 'brain' in self.genome:
+        if self.config.USE_NEURAL_NETWORKS and 'brain' in self.genome:
             return self._neural_decide_move(universe)
         
         # Phase 2: Check signals
-        if ENABLE_COMMUNICATION:
+        if self.config.ENABLE_COMMUNICATION:
             signals = self.sense_signals(universe)
             for signal, strength in signals:
                 if signal.type == 'alarm' and strength > 0.5:
@@ -312,11 +319,10 @@ class Organism:
                     return dx, dy
         
         # Phase 2: Check memory for good locations
-        if ENABLE_MEMORY and self.memory:
+        if self.config.ENABLE_MEMORY and self.memory:
             # Sometimes revisit high-energy locations
-            if random.random() < 0.3:
-                best_memory = max(self.memory, key=lambda m: m[2])
-                mx, my, _ = best_memory
+            if self.rng.movement.random() < 0.3:
+                mx, my, _ = self.memory.best(2)
                 dx = 1 if mx > self.x else -1 if mx < self.x else 0
                 dy = 1 if my > self.y else -1 if my < self.y else 0
                 return dx, dy
@@ -324,10 +330,10 @@ class Organism:
         nearby = self.sense_environment(universe)
         
         # Mix of random and energy-seeking behavior
-        if random.random() < self.genome['move_randomness']:
+        if self.rng.movement.random() < self.genome['move_randomness']:
             # Random move
-            dx = random.choice([-1, 0, 1])
-            dy = random.choice([-1, 0, 1])
+            dx = self.rng.movement.choice([-1, 0, 1])
+            dy = self.rng.movement.choice([-1, 0, 1])
         else:
             # Move toward highest energy
             if nearby:
@@ -340,19 +346,27 @@ class Organism:
     
     def _neural_decide_move(self, universe):
         """Use neural network to decide movement"""
-        # Prepare inputs
-        nearby = self.sense_environment(universe)
-        
+        outputs = self.genome['brain'].forward(self._neural_inputs(universe))
+        return self._interpret_outputs(outputs)
+    
+    def _neural_inputs(self, universe):
+        """Sensor vector fed to the neural network"""
         # Get energy in 4 directions
-        energy_n = sum(e for dx, dy, e in nearby if dy < 0) / max(1, sum(1 for dx, dy, e in nearby if dy < 0))
-        energy_s = sum(e for dx, dy, e in nearby if dy > 0) / max(1, sum(1 for dx, dy, e in nearby if dy > 0))
-        energy_e = sum(e for dx, dy, e in nearby if dx > 0) / max(1, sum(1 for dx, dy, e in nearby if dx > 0))
-        energy_w = sum(e for dx, dy, e in nearby if dx < 0) / max(1, sum(1 for dx, dy, e in nearby if dx < 0))
+        if universe.energy_fields is not None:
+            # O(1) lookup in the per-tick directional energy fields
+            direction = self.direction if self.config.ENABLE_DIRECTIONAL_SENSING else 0
+            energy_n, energy_s, energy_e, energy_w = universe.directional_energy(self.x, self.y, direction)
+        else:
+            nearby = self.sense_environment(universe)
+            energy_n = sum(e for dx, dy, e in nearby if dy < 0) / max(1, sum(1 for dx, dy, e in nearby if dy < 0))
+            energy_s = sum(e for dx, dy, e in nearby if dy > 0) / max(1, sum(1 for dx, dy, e in nearby if dy > 0))
+            energy_e = sum(e for dx, dy, e in nearby if dx > 0) / max(1, sum(1 for dx, dy, e in nearby if dx > 0))
+            energy_w = sum(e for dx, dy, e in nearby if dx < 0) / max(1, sum(1 for dx, dy, e in nearby if dx < 0))
         
         energy_here = universe.get_energy(self.x, self.y)
         
         # Phase 2: Include directional information
-        direction_input = self.direction / 7.0 if ENABLE_DIRECTIONAL_SENSING else 0.5
+        direction_input = self.direction / 7.0 if self.config.ENABLE_DIRECTIONAL_SENSING else 0.5
         
         inputs = [
             energy_n / 100, energy_s / 100, energy_e / 100, energy_w / 100,
@@ -361,12 +375,14 @@ class Organism:
             self.age / 1000,
             len(self.sense_organisms(universe)) / 10,
             direction_input,  # Current facing direction
-            random.random()   # Noise
+            self.rng.movement.random()   # Noise
         ]
         
-        # Get network output
-        outputs = self.genome['brain'].forward(inputs)
-        
+        return inputs
+    
+    @staticmethod
+    def _interpret_outputs(outputs):
+        """Turn network outputs into a (dx, dy) move"""
         # Interpret outputs: [move_n, move_s, move_e, move_w, eat, reproduce]
         move_n, move_s, move_e, move_w, eat_signal, reproduce_signal = outputs
         
@@ -392,7 +408,7 @@ class Organism:
         new_y = (self.y + dy) % universe.height
         
         # Phase 2: Directional sensing - update direction and pay turning cost
-        if ENABLE_DIRECTIONAL_SENSING and (dx != 0 or dy != 0):
+        if self.config.ENABLE_DIRECTIONAL_SENSING and (dx != 0 or dy != 0):
             # Map movement to direction (0-7)
             direction_map = {
                 (0, -1): 0,   # North
@@ -409,12 +425,13 @@ class Organism:
             
             # Pay energy cost for turning
             if new_direction != self.direction:
-                self.energy -= ENERGY_COST_TURN
+                self.energy -= self.config.ENERGY_COST_TURN
                 self.direction = new_direction
         
         self.x = new_x
         self.y = new_y
-        self.energy -= ENERGY_COST_MOVE
+        universe.spatial_index.update(self)
+        self.energy -= self.config.ENERGY_COST_MOVE
     
     def eat(self, universe):
         """Try to eat energy from current cell"""
@@ -429,127 +446,153 @@ class Organism:
         self.age += 1
         
         # Cost of living
-        self.energy -= ENERGY_COST_ALIVE
-        
-        # Phase 2: Update memory
-        if ENABLE_MEMORY:
-            energy_here = universe.get_energy(self.x, self.y)
-            if energy_here > 50:
-                # Remember this location
-                self.memory.append((self.x, self.y, energy_here))
-                if len(self.memory) > MEMORY_SIZE:
-                    self.memory.pop(0)
-        
-        # Phase 2: Emit signals occasionally
-        if ENABLE_COMMUNICATION and random.random() < self.genome.get('signal_probability', 0):
+        self.energy -= self.living_cost
+        
+        if self.act(universe):
+            # Try to eat
+            self.eat(universe)
+            
+            # Die of old age
+            if self.age > self.config.MAX_ORGANISM_AGE:
+                self.energy = 0
+    
+    def act(self, universe):
+        """Sense, think and move for one tick.
+        
+        Runs the behaviour stages switched on in this organism's config
+        (SimulationConfig.organism_stages), then decides and makes a move.
+        Returns False when a stage took over the whole turn, in which case
+        eating and dying of old age are skipped this tick. Moves and
+        utterances go through the universe, so a two-phase tick can record
+        them instead (see two_phase.py).
+        """
+        for stage in self.config.stages(type(self)):
+            if stage(self, universe) is False:
+                return False
+        
+        # Decide and execute move
+        dx, dy = self.decide_move(universe)
+        if dx != 0 or dy != 0:
+            universe.move_organism(self, dx, dy)
+        
+        return True
+    
+    def _stage_memory(self, universe):
+        """Phase 2: Update memory"""
+        energy_here = universe.get_energy(self.x, self.y)
+        if energy_here > 50:
+            # Remember this location (the ring buffer drops the oldest one)
+            self.memory.append((self.x, self.y, energy_here))
+    
+    def _stage_signals(self, universe):
+        """Phase 2: Emit signals occasionally"""
+        if self.rng.cognition.random() < self.genome.get('signal_probability', 0):
             if self.energy < 100:
                 self.emit_signal(universe, 'alarm')
             elif universe.get_energy(self.x, self.y) > 100:
                 self.emit_signal(universe, 'food')
-        
-        # Phase 3: Recognize kin
-        if ENABLE_SOCIAL and random.random() < 0.1:
+    
+    def _stage_kin(self, universe):
+        """Phase 3: Recognize kin"""
+        if self.rng.cognition.random() < 0.1:
             nearby_organisms = self.sense_organisms(universe)
             for organism, distance in nearby_organisms:
                 if self._is_kin(organism):
                     if organism not in self.kin:
                         self.kin.append(organism)
-        
-        # Phase 4: Abstract Reasoning - observe and learn patterns
-        if ENABLE_ABSTRACT_REASONING:
-            observation = {
-                'energy_here': universe.get_energy(self.x, self.y),
-                'age': self.age,
-                'energy': self.energy
-            }
+    
+    def _stage_reasoning(self, universe):
+        """Phase 4: Abstract Reasoning - observe and learn patterns"""
+        observation = {
+            'energy_here': universe.get_energy(self.x, self.y),
+            'age': self.age,
+            'energy': self.energy
+        }
+        with universe.profiler.timer('reasoning.observe'):
             self.reasoning.observe(observation)
-        
-        # Phase 4: Language - occasionally communicate
-        if ENABLE_LANGUAGE and random.random() < self.genome.get('language_ability', 0.1):
+    
+    def _stage_language(self, universe):
+        """Phase 4: Language - occasionally communicate"""
+        if self.rng.cognition.random() < self.genome.get('language_ability', 0.1):
             if self.energy < 100:
-                utterance = self.language.express('need_energy')
+                with universe.profiler.timer('language.express'):
+                    utterance = self.language.express('need_energy')
                 if utterance:
                     # Broadcast to nearby organisms
                     nearby = self.sense_organisms(universe)
                     for other, _ in nearby[:3]:
-                        if hasattr(other, 'language'):
-                            other.language.comprehend(utterance)
-        
-        # Phase 4: Self-Awareness - reflect periodically
-        if ENABLE_SELF_AWARENESS:
+                        universe.deliver_utterance(other, utterance)
+    
+    def _stage_self_awareness(self, universe):
+        """Phase 4: Self-Awareness - reflect periodically"""
+        with universe.profiler.timer('self_awareness.reflect'):
             action = self.self_awareness.reflect(universe.tick)
-            if action == 'change_strategy':
-                # Change behavior based on reflection
-                self.genome['move_randomness'] = random.random()
-        
-        # Phase 4: Creativity - explore or exploit
-        if ENABLE_CREATIVITY:
-            state = (self.x, self.y, self.energy)
+        if action == 'change_strategy':
+            # Change behavior based on reflection
+            self.set_gene('move_randomness', self.rng.cognition.random())
+    
+    def _stage_creativity(self, universe):
+        """Phase 4: Creativity - explore or exploit"""
+        state = (self.x, self.y, self.energy)
+        with universe.profiler.timer('creativity.record_state_visit'):
             self.creativity.record_state_visit(state)
-            
-            # Occasionally try novel behavior
-            if self.creativity.should_explore(state):
-                novel = self.creativity.generate_novel_behavior(state)
-                # Try novel behavior (simplified)
-                if novel and random.random() < 0.5:
-                    dx = random.choice([-1, 0, 1])
-                    dy = random.choice([-1, 0, 1])
-                    self.move(dx, dy, universe)
-                    return  # Skip normal behavior
-        
-        # Phase 4.5: Self-Modification - occasionally try to improve self
-        if ENABLE_SELF_MODIFICATION and hasattr(self, 'self_modification'):
-            if random.random() < 0.001:  # Rare
-                modification = self.self_modification.propose_modification()
-                if modification:
-                    if self.self_modification.test_modification(modification):
-                        self.self_modification.apply_modification(modification)
-        
-        # Phase 5: AGI - pursue autonomous goals
-        if ENABLE_GENERAL_INTELLIGENCE and hasattr(self, 'agi'):
-            # Measure consciousness
-            if CALCULATE_PHI and random.random() < 0.01:
-                self.agi.measure_consciousness()
-            
-            # Pursue current goal
-            if ENABLE_AUTONOMOUS_GOALS:
+        
+        # Occasionally try novel behavior
+        if self.creativity.should_explore(state):
+            novel = self.creativity.generate_novel_behavior(state)
+            # Try novel behavior (simplified)
+            if novel and self.rng.cognition.random() < 0.5:
+                dx = self.rng.movement.choice([-1, 0, 1])
+                dy = self.rng.movement.choice([-1, 0, 1])
+                universe.move_organism(self, dx, dy)
+                return False  # Skip normal behavior
+    
+    def _stage_self_modification(self, universe):
+        """Phase 4.5: Self-Modification - occasionally try to improve self"""
+        if self.rng.cognition.random() < 0.001:  # Rare
+            modification = self.self_modification.propose_modification()
+            if modification:
+                if self.self_modification.test_modification(modification):
+                    self.self_modification.apply_modification(modification)
+    
+    def _stage_agi(self, universe):
+        """Phase 5: AGI - pursue autonomous goals"""
+        # Measure consciousness
+        if self.config.CALCULATE_PHI and self.rng.cognition.random() < 0.01:
+            self.agi.measure_consciousness()
+        
+        # Pursue current goal
+        if self.config.ENABLE_AUTONOMOUS_GOALS:
+            with universe.profiler.timer('agi.pursue_goal'):
                 goal = self.agi.pursue_goal()
-                
-                # Goal might influence behavior
-                if goal and goal.description == 'explore_environment':
-                    # Exploration behavior
-                    if random.random() < 0.3:
-                        dx = random.choice([-1, 0, 1])
-                        dy = random.choice([-1, 0, 1])
-                        self.move(dx, dy, universe)
-                        return
             
-            # Novelty search
-            if ENABLE_NOVELTY_SEARCH:
-                current_behavior = (self.x, self.y, self.age)
-                novelty = self.agi.calculate_novelty(current_behavior)
-                
-                if novelty > 0.7:
-                    # Novel behavior! Archive it
-                    self.agi.archive_behavior(current_behavior)
-                    # Reward novelty
-                    self.energy += NOVELTY_REWARD_MULTIPLIER
-        
-        # Decide and execute move
-        dx, dy = self.decide_move(universe)
-        if dx != 0 or dy != 0:
-            self.move(dx, dy, universe)
-        
-        # Try to eat
-        self.eat(universe)
-        
-        # Die of old age
-        if self.age > MAX_ORGANISM_AGE:
-            self.energy = 0
+            # Goal might influence behavior
+            if goal and goal.description == 'explore_environment':
+                # Exploration behavior
+                if self.rng.cognition.random() < 0.3:
+                    dx = self.rng.movement.choice([-1, 0, 1])
+                    dy = self.rng.movement.choice([-1, 0, 1])
+                    universe.move_organism(self, dx, dy)
+                    return False
+        
+        # Novelty search
+        if self.config.ENABLE_NOVELTY_SEARCH:
+            current_behavior = (self.x, self.y, self.age)
+            novelty = self.agi.calculate_novelty(current_behavior)
+            
+            if novelty > 0.7:
+                # Novel behavior! Archive it
+                self.agi.archive_behavior(current_behavior)
+                # Reward novelty
+                self.energy += self.config.NOVELTY_REWARD_MULTIPLIER
+    
+    def set_gene(self, gene, value):
+        """Change a gene during the organism's lifetime"""
+        self.genome[gene] = value
     
     def _is_kin(self, other):
         """Check if another organism is kin (similar genome)"""
-        if not ENABLE_SOCIAL:
+        if not self.config.ENABLE_SOCIAL:
             return False
         
         # Simple kin recognition based on color similarity
@@ -561,29 +604,33 @@ class Organism:
         
         similarity = 1 - (color_distance / max_distance)
         
-        return similarity > KIN_RECOGNITION_THRESHOLD
+        return similarity > self.config.KIN_RECOGNITION_THRESHOLD
     
     def try_reproduce(self, universe):
         """Try to create offspring"""
         if self.energy >= self.genome['reproduce_threshold']:
-            if len(universe.organisms) < MAX_POPULATION:
+            if len(universe.organisms) < self.config.MAX_POPULATION:
                 # Pay reproduction cost
-                self.energy -= ENERGY_COST_REPLICATE
+                self.energy -= self.config.ENERGY_COST_REPLICATE
                 
-                # Create offspring with mutated genome
-                mutated_genome = self.mutate_genome()
+                # Create offspring with mutated genome (with a genome pool the
+                # universe mutates a tick's offspring together as they join it)
+                if getattr(universe, 'genome_pool', None) is not None:
+                    mutated_genome = self.genome
+                else:
+                    mutated_genome = self.mutate_genome()
                 
                 # Offspring spawns nearby
-                offset_x = random.choice([-1, 0, 1])
-                offset_y = random.choice([-1, 0, 1])
+                offset_x = self.rng.movement.choice([-1, 0, 1])
+                offset_y = self.rng.movement.choice([-1, 0, 1])
                 child_x = (self.x + offset_x) % universe.width
                 child_y = (self.y + offset_y) % universe.height
                 
                 offspring = Organism(child_x, child_y, mutated_genome, parent=self)
                 
                 # Phase 3: Multi-cellular - chance to stay attached
-                if ENABLE_MULTICELLULAR and random.random() < CELL_ADHESION_CHANCE:
-                    if len(self.cells) < MAX_ORGANISM_SIZE:
+                if self.config.ENABLE_MULTICELLULAR and self.rng.mutation.random() < self.config.CELL_ADHESION_CHANCE:
+                    if len(self.cells) < self.config.MAX_ORGANISM_SIZE:
                         self.cells.append(offspring)
                         offspring.cells = self.cells
                         self.is_multicellular = True
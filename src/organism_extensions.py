@@ -69,10 +69,9 @@ def add_problem_solving_methods(organism_class):
                     break
         else:
             # Trial and error
-            import random
             possible_steps = ['north', 'south', 'east', 'west', 'find_key', 'use_key', 
                             'activate_a', 'activate_b', 'activate_c']
-            step = random.choice(possible_steps)
+            step = self.rng.cognition.choice(possible_steps)
             success = puzzle.attempt_step(step)
             
             if success:
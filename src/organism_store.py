@@ -0,0 +1,190 @@
+"""
+Structure-of-Arrays Organism Store
+Keeps the hot scalar state of every organism in contiguous NumPy arrays
+"""
+
+import numpy as np
+
+# Per-organism state held in the store and exposed back through the
+# Organism API.  name -> (dtype, python type returned to callers)
+STATE_COLUMNS = {
+    'x': (np.int64, int),
+    'y': (np.int64, int),
+    'energy': (np.float64, float),
+    'age': (np.int64, int),
+    'direction': (np.int64, int),
+}
+
+# Scalar genes mirrored into columns so batched checks can read them
+GENE_COLUMNS = ('move_probability', 'move_randomness', 'eat_threshold', 'reproduce_threshold')
+
+
+class OrganismStore:
+    """Contiguous arrays of organism state ("array mode").
+
+    Live organisms occupy slots [0, count) in attach order; removal
+    swaps the last slot into the hole so the arrays stay dense.  An
+    attached organism becomes a thin view: reads and writes of x, y,
+    energy, age and direction go straight to its slot, so existing
+    cognitive modules keep using the plain Organism API.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.members = []  # organism occupying each slot
+
+        self.columns = {}
+        for name, (dtype, _) in STATE_COLUMNS.items():
+            self.columns[name] = np.zeros(self.capacity, dtype=dtype)
+        for gene in GENE_COLUMNS:
+            self.columns[gene] = np.zeros(self.capacity, dtype=np.float64)
+        self.columns['living_cost'] = np.zeros(self.capacity, dtype=np.float64)
+
+    def __len__(self):
+        return self.count
+
+    def __getattr__(self, name):
+        # Convenience access: store.energy, store.x, ...
+        columns = self.__dict__.get('columns')
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def _grow(self):
+        """Double capacity, keeping existing rows"""
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
+    def attach(self, organism):
+        """Move an organism's state into the store and turn it into a view"""
+        if getattr(organism, '_store', None) is not None:
+            return
+        if self.count == self.capacity:
+            self._grow()
+
+        slot = self.count
+        for name in STATE_COLUMNS:
+            self.columns[name][slot] = getattr(organism, name, 0)
+        self.columns['living_cost'][slot] = organism.living_cost
+
+        for name in STATE_COLUMNS:
+            try:
+                delattr(organism, name)  # The column holds it from now on
+            except AttributeError:
+                pass
+        organism.__class__ = _view_class(type(organism))
+        organism._store = self
+        organism._slot = slot
+        self.sync_genes(organism)
+
+        self.members.append(organism)
+        self.count += 1
+
+    def detach(self, organism):
+        """Copy an organism's state back onto the object and free its slot"""
+        if getattr(organism, '_store', None) is not self:
+            return
+        slot = organism._slot
+        values = {name: getattr(organism, name) for name in type(organism)._stored_fields}
+
+        organism.__class__ = type(organism)._base_class
+        del organism._store
+        del organism._slot
+        for name, value in values.items():
+            setattr(organism, name, value)
+
+        # Swap the last slot into the hole
+        last = self.count - 1
+        if slot != last:
+            for column in self.columns.values():
+                column[slot] = column[last]
+            moved = self.members[last]
+            moved._slot = slot
+            self.members[slot] = moved
+        self.members.pop()
+        self.count -= 1
+
+    def clear(self):
+        """Detach every organism"""
+        while self.members:
+            self.detach(self.members[-1])
+
+    def sync_genes(self, organism):
+        """Refresh an organism's gene columns from its genome"""
+        genome = organism.genome
+        slot = organism._slot
+        for gene in GENE_COLUMNS:
+            self.columns[gene][slot] = genome.get(gene, 0)
+
+
+def _column_property(name, cast):
+    """Property reading/writing one column at the organism's slot"""
+    def get(self):
+        return cast(self._store.columns[name][self._slot])
+
+    def set(self, value):
+        self._store.columns[name][self._slot] = value
+
+    return property(get, set)
+
+
+def _genome_property(slot):
+    """Property over the organism's own genome slot that keeps gene columns in sync"""
+    def set(self, genome):
+        slot.__set__(self, genome)
+        self._store.sync_genes(self)
+
+    return property(slot.__get__, set)
+
+
+def _set_gene(self, gene, value):
+    self.genome[gene] = value
+    if gene in GENE_COLUMNS:
+        self._store.columns[gene][self._slot] = self.genome[gene]
+
+
+def _reduce_view(self, protocol):
+    """Pickle an attached organism as a plain, detached one"""
+    state = self.__getstate__()
+    state.pop('_store', None)
+    state.pop('_slot', None)
+    for name in type(self)._stored_fields:
+        state[name] = getattr(self, name)
+    return (_new_detached, (type(self)._base_class,), state)
+
+
+def _new_detached(cls):
+    """Unpickling helper: empty instance of the plain organism class"""
+    return cls.__new__(cls)
+
+
+_VIEW_CLASSES = {}
+
+
+def _view_class(cls):
+    """Subclass of `cls` whose scalar state lives in an OrganismStore"""
+    view = _VIEW_CLASSES.get(cls)
+    if view is None:
+        # Only mirror attributes the organism class actually uses
+        from config import ENABLE_DIRECTIONAL_SENSING
+        fields = [name for name in STATE_COLUMNS
+                  if name != 'direction' or ENABLE_DIRECTIONAL_SENSING]
+
+        namespace = {name: _column_property(name, STATE_COLUMNS[name][1]) for name in fields}
+        namespace.update({
+            '__slots__': (),
+            '__module__': cls.__module__,
+            '__reduce_ex__': _reduce_view,
+            '_base_class': cls,
+            '_stored_fields': tuple(fields),
+            'genome': _genome_property(next(vars(klass)['genome'] for klass in cls.__mro__
+                                            if 'genome' in vars(klass))),
+            'set_gene': _set_gene,
+        })
+        view = type(cls.__name__, (cls,), namespace)
+        _VIEW_CLASSES[cls] = view
+    return view
@@ -1,126 +1,356 @@
 """
 Save and Load System
 Allows simulation to persist across sessions
+
+Saves are columnar snapshots (see snapshot.py): a directory per save plus a
+small <name>_meta.json sidecar for listing. Older single-file .pkl saves can
+still be loaded. Autosaves copy arrays and object references on the
+simulation thread; pickling and writing happen in a forked child process
+(a copy-on-write view of the world as it was) or, where fork is not
+available, the pickling stays on the simulation thread and only the write
+goes to a background thread. Between periodic full snapshots autosaves are
+delta checkpoints that only record what changed.
 """
 
 import pickle
 import json
 import os
+import shutil
+import sys
+import threading
+import time
+import traceback
 from datetime import datetime
+from genome import Genome
+from config import ASYNC_AUTOSAVE, AUTOSAVE_FORK, AUTOSAVE_FULL_EVERY, KEEP_AUTOSAVES
+from snapshot import (Snapshot, CheckpointChain, SnapshotError, capture_snapshot, capture_delta,
+                      open_checkpoint, VERSION, TEMP_SUFFIX, OLD_SUFFIX)
+
+LEGACY_SUFFIX = '.pkl'
+META_SUFFIX = '_meta.json'
+
+# Classes that moved since legacy .pkl saves were written: (module, name) -> (module, name)
+MOVED_CLASSES = {
+    ('signal', 'Signal'): ('signals', 'Signal'),  # signal.py shadowed the stdlib module
+}
+
+
+class LegacyUnpickler(pickle.Unpickler):
+    """Unpickler for legacy .pkl saves that follows moved classes"""
+
+    def find_class(self, module, name):
+        module, name = MOVED_CLASSES.get((module, name), (module, name))
+        return super().find_class(module, name)
+
 
 class SimulationSaver:
     """Save and load simulation state"""
-    
-    def __init__(self, save_dir="saves"):
+
+    def __init__(self, save_dir="saves", background=ASYNC_AUTOSAVE, full_every=AUTOSAVE_FULL_EVERY,
+                 fork=AUTOSAVE_FORK):
         self.save_dir = save_dir
         if not os.path.exists(save_dir):
             os.makedirs(save_dir)
-    
-    def save(self, universe, filename=None):
-        """Save entire universe state"""
+
+        # Background autosave: at most one write in flight, pickled in a
+        # forked child where the platform has fork()
+        self.background = background
+        self.fork = fork and hasattr(os, 'fork')
+        self._writer = None
+        self.last_error = None
+        self.autosave_stats = {'saves': 0, 'blocked_seconds': 0.0, 'capture_seconds': 0.0}
+
+        # Delta checkpoints: every full_every-th autosave is a full snapshot
+        self.full_every = full_every
+        self._baseline = None
+
+    def _save_name(self, filename):
+        """Save name without a legacy .pkl suffix"""
+        if filename.endswith(LEGACY_SUFFIX):
+            filename = filename[:-len(LEGACY_SUFFIX)]
+        return filename
+
+    def save(self, universe, filename=None, include_cognition=True):
+        """Save entire universe state as a snapshot directory"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"genesis_save_{timestamp}.pkl"
-        
-        filepath = os.path.join(self.save_dir, filename)
-        
-        # Save universe state
-        save_data = {
-            'tick': universe.tick,
-            'energy_grid': universe.energy_grid,
-            'organisms': universe.organisms,
-            'stats': universe.stats,
-            'signals': getattr(universe, 'signals', []),
-            'structures': getattr(universe, 'structures', []),
-            'puzzles': getattr(universe, 'puzzles', [])
-        }
-        
-        with open(filepath, 'wb') as f:
-            pickle.dump(save_data, f)
-        
+            filename = f"genesis_save_{timestamp}"
+
+        captured = capture_snapshot(universe, include_cognition=include_cognition)
+        return self._write(captured, self._save_name(filename))
+
+    def _write(self, captured, name, keep=None):
+        """Write a captured snapshot and its metadata (any thread)"""
+        filepath = os.path.join(self.save_dir, name)
+        header = captured.write(filepath)
+
         # Also save metadata as JSON
+        sizes = {section: info['bytes'] for section, info in header['sections'].items()}
         metadata = {
-            'tick': universe.tick,
-            'population': len(universe.organisms),
+            'tick': header['tick'],
+            'population': header['population'],
             'timestamp': datetime.now().isoformat(),
-            'stats': {k: v for k, v in universe.stats.items() if isinstance(v, (int, float, str))}
+            'stats': header['stats'],
+            'format': header['format'],
+            'version': VERSION,
+            'base': header.get('base'),
+            'parent': header.get('parent'),
+            'bytes': sum(sizes.values()),
+            'section_bytes': sizes,
+            'save_seconds': header['save_seconds']
         }
-        
-        meta_filepath = filepath.replace('.pkl', '_meta.json')
-        with open(meta_filepath, 'w') as f:
+
+        meta_filepath = os.path.join(self.save_dir, name + META_SUFFIX)
+        with open(meta_filepath + TEMP_SUFFIX, 'w') as f:
             json.dump(metadata, f, indent=2)
-        
-        print(f"✅ Saved to: {filepath}")
+        os.replace(meta_filepath + TEMP_SUFFIX, meta_filepath)
+
+        if keep is not None:
+            self.cleanup_old_autosaves(keep=keep)
+
+        print(f"✅ Saved to: {filepath} ({metadata['bytes'] / 1024:.0f} KB "
+              f"in {header['save_seconds']:.2f}s)")
         return filepath
-    
+
     def load(self, filename):
-        """Load universe state"""
+        """Open a save.
+
+        Snapshots come back as a Snapshot or CheckpointChain that has only
+        read its header; restore_universe() or read_organisms() load the
+        rest. Legacy .pkl saves are unpickled into a dict.
+        """
         filepath = os.path.join(self.save_dir, filename)
-        
+        if not os.path.exists(filepath):
+            # Names of snapshots that replaced .pkl saves still resolve
+            name = os.path.join(self.save_dir, self._save_name(filename))
+            filepath = name if os.path.isdir(name) else name + LEGACY_SUFFIX
+
         if not os.path.exists(filepath):
             print(f"❌ Save file not found: {filepath}")
             return None
-        
-        with open(filepath, 'rb') as f:
-            save_data = pickle.load(f)
-        
+
+        if os.path.isdir(filepath):
+            save_data = open_checkpoint(filepath)
+            tick, population = save_data.tick, save_data.population
+        else:
+            with open(filepath, 'rb') as f:
+                save_data = LegacyUnpickler(f).load()
+            tick, population = save_data['tick'], len(save_data['organisms'])
+
         print(f"✅ Loaded from: {filepath}")
-        print(f"   Tick: {save_data['tick']}")
-        print(f"   Population: {len(save_data['organisms'])}")
-        
+        print(f"   Tick: {tick}")
+        print(f"   Population: {population}")
+
         return save_data
-    
+
+    def _save_entries(self):
+        """Names of all saves (snapshot directories and legacy .pkl files)"""
+        entries = []
+        for filename in os.listdir(self.save_dir):
+            filepath = os.path.join(self.save_dir, filename)
+            if filename.endswith((TEMP_SUFFIX, OLD_SUFFIX)):
+                continue  # Unfinished or replaced writes
+            if os.path.isdir(filepath) or filename.endswith(LEGACY_SUFFIX):
+                entries.append(filename)
+        return entries
+
+    def _metadata(self, filename):
+        """Listing metadata for a save, read without touching its payload.
+
+        Uses the _meta.json sidecar, falling back to a snapshot's header.
+        """
+        meta_filepath = os.path.join(self.save_dir, self._save_name(filename) + META_SUFFIX)
+        if os.path.exists(meta_filepath):
+            with open(meta_filepath, 'r') as f:
+                return json.load(f)
+
+        filepath = os.path.join(self.save_dir, filename)
+        if not os.path.isdir(filepath):
+            return None
+        try:
+            header = Snapshot(filepath).header
+        except SnapshotError:
+            return None
+        return {
+            'tick': header['tick'],
+            'population': header['population'],
+            'timestamp': datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat(),
+            'stats': header['stats'],
+            'format': header['format'],
+            'version': header['version'],
+            'base': header.get('base'),
+            'parent': header.get('parent'),
+            'bytes': sum(info['bytes'] for info in header['sections'].values())
+        }
+
     def list_saves(self):
         """List all save files"""
         saves = []
-        for filename in os.listdir(self.save_dir):
-            if filename.endswith('.pkl'):
-                filepath = os.path.join(self.save_dir, filename)
-                meta_filepath = filepath.replace('.pkl', '_meta.json')
-                
-                if os.path.exists(meta_filepath):
-                    with open(meta_filepath, 'r') as f:
-                        metadata = json.load(f)
-                    saves.append({
-                        'filename': filename,
-                        'metadata': metadata
-                    })
-        
+        for filename in self._save_entries():
+            metadata = self._metadata(filename)
+            if metadata is not None:
+                saves.append({
+                    'filename': filename,
+                    'metadata': metadata
+                })
+
         return sorted(saves, key=lambda x: x['metadata']['timestamp'], reverse=True)
-    
-    def autosave(self, universe, interval=1000):
-        """Auto-save every N ticks"""
-        if universe.tick % interval == 0:
-            filename = f"autosave_tick_{universe.tick}.pkl"
-            self.save(universe, filename)
-            
-            # Keep only last 5 autosaves
-            self.cleanup_old_autosaves(keep=5)
-    
-    def cleanup_old_autosaves(self, keep=5):
-        """Remove old autosaves, keep only recent ones"""
-        autosaves = [f for f in os.listdir(self.save_dir) if f.startswith('autosave_')]
-        autosaves.sort(reverse=True)
-        
-        for old_save in autosaves[keep:]:
-            filepath = os.path.join(self.save_dir, old_save)
+
+    def autosave(self, universe, interval=1000, keep=KEEP_AUTOSAVES):
+        """Auto-save every N ticks, keeping the newest `keep` autosaves.
+
+        In background mode only arrays and object references are copied
+        here. With fork the child process pickles and writes them while this
+        process carries on; otherwise they are pickled here and written on a
+        worker thread. If the previous autosave is still being written, this
+        waits for it first, so at most one copy is ever held in memory.
+        """
+        if universe.tick % interval != 0:
+            return None
+
+        name = f"autosave_tick_{universe.tick}"
+        if not self.background:
+            return self._write(self._capture_checkpoint(universe, name), name, keep=keep)
+
+        # Backpressure: never queue a second copy behind an unfinished write
+        start = time.perf_counter()
+        self.flush()
+        self.autosave_stats['blocked_seconds'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        captured = self._capture_checkpoint(universe, name)
+        if self.fork:
+            sys.stdout.flush()  # Or the child repeats whatever is still buffered
+            pid = os.fork()
+            if pid == 0:
+                self._child_write(captured, name)
+            target, args = self._wait_for_child, (pid, name, keep)
+        else:
+            captured.serialize()
+            target, args = self._background_write, (captured, name, keep)
+        self.autosave_stats['capture_seconds'] += time.perf_counter() - start
+        self.autosave_stats['saves'] += 1
+        self._writer = threading.Thread(target=target, args=args,
+                                        name="genesis-autosave", daemon=True)
+        self._writer.start()
+        return os.path.join(self.save_dir, name)
+
+    def _capture_checkpoint(self, universe, name):
+        """A delta against the previous autosave, or a full snapshot to start a chain"""
+        captured = None
+        if self._baseline is not None and self._baseline.depth + 1 < self.full_every:
+            captured = capture_delta(universe, self._baseline, name=name)
+        if captured is None:
+            captured = capture_snapshot(universe, name=name)
+        self._baseline = captured.baseline
+        return captured
+
+    def _background_write(self, captured, name, keep):
+        try:
+            self._write(captured, name, keep=keep)
+        except Exception as error:
+            self.last_error = error
+            self._baseline = None  # Never build deltas on a checkpoint that was not written
+            print(f"❌ Autosave {name} failed: {error}")
+
+    def _child_write(self, captured, name):
+        """Forked child: pickle and write the checkpoint, then exit (never returns)"""
+        status = 1
+        try:
+            self._write(captured, name)
+            status = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+    def _wait_for_child(self, pid, name, keep):
+        _, status = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(status) != 0:
+            self.last_error = RuntimeError(f"autosave process exited with status {status}")
+            self._baseline = None  # Never build deltas on a checkpoint that was not written
+            print(f"❌ Autosave {name} failed: {self.last_error}")
+        else:
+            self.cleanup_old_autosaves(keep=keep)
+
+    def flush(self):
+        """Wait for an in-flight background autosave to finish"""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+
+    def _remove(self, filename):
+        """Delete one save and its metadata"""
+        filepath = os.path.join(self.save_dir, filename)
+        if os.path.isdir(filepath):
+            shutil.rmtree(filepath)
+        elif os.path.exists(filepath):
             os.remove(filepath)
-            meta_filepath = filepath.replace('.pkl', '_meta.json')
-            if os.path.exists(meta_filepath):
-                os.remove(meta_filepath)
+        meta_filepath = os.path.join(self.save_dir, self._save_name(filename) + META_SUFFIX)
+        if os.path.exists(meta_filepath):
+            os.remove(meta_filepath)
+
+    def _parent(self, filename):
+        """Checkpoint a delta autosave builds on (None for full saves)"""
+        metadata = self._metadata(filename)
+        return metadata.get('parent') if metadata else None
+
+    def cleanup_old_autosaves(self, keep=KEEP_AUTOSAVES):
+        """Remove old autosaves, keep only recent ones.
+
+        Older checkpoints that a kept delta is replayed from are kept too.
+        """
+        autosaves = [f for f in self._save_entries() if f.startswith('autosave_tick_')]
+        # Newest first by tick number (plain string order puts tick 999 after 1000)
+        autosaves.sort(key=lambda f: int(self._save_name(f)[len('autosave_tick_'):]), reverse=True)
+
+        needed = set()
+        for filename in autosaves[:keep]:
+            while filename is not None and filename not in needed:
+                needed.add(filename)
+                filename = self._parent(filename)
+
+        for old_save in autosaves[keep:]:
+            if old_save not in needed:
+                self._remove(old_save)
 
 def restore_universe(save_data, universe):
-    """Restore universe from save data"""
+    """Restore universe from save data (a Snapshot, a CheckpointChain or a legacy save dict)"""
+    if isinstance(save_data, (Snapshot, CheckpointChain)):
+        return save_data.restore(universe)
+
     universe.tick = save_data['tick']
     universe.energy_grid = save_data['energy_grid']
-    universe.organisms = save_data['organisms']
+    rng = save_data.get('rng', universe.rng)
+    for organism in save_data['organisms']:
+        organism.config = universe.config
+        # Saves from before seeded random streams
+        if 'rng' not in organism.attributes():
+            organism.rng = rng
+        # Saves from before flat genomes held dicts
+        if not isinstance(organism.genome, Genome):
+            organism.genome = Genome.from_dict(organism.genome)
+    universe.set_organisms(save_data['organisms'])
+    if universe.lineage is not None:
+        from lineage import LineageStore
+        universe.lineage = LineageStore.from_organisms(save_data['organisms'])
     universe.stats = save_data['stats']
-    
+    if 'rng' in save_data:
+        universe.rng = save_data['rng']
+    universe.stats_tracker.resync(universe)
+
     if 'signals' in save_data:
-        universe.signals = save_data['signals']
+        signals = save_data['signals']
+        if isinstance(signals, list):
+            # Saves from before the signal field stored Signal objects
+            from signals import SignalField
+            signals = SignalField.from_signals(signals)
+        universe.signals = signals
     if 'structures' in save_data:
         universe.structures = save_data['structures']
     if 'puzzles' in save_data:
         universe.puzzles = save_data['puzzles']
-    
+
     return universe
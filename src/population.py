@@ -0,0 +1,77 @@
+"""
+Population Container
+Organisms of a universe, indexed by their stable integer ID
+"""
+
+
+class Population:
+    """Ordered collection of organisms with O(1) lookup and removal by ID.
+
+    Behaves like a read-only list for iteration, len() and indexing.
+    remove() swaps the last organism into the hole; remove_many() drops a
+    whole batch in one sweep and keeps the survivors' order.
+    """
+
+    def __init__(self, organisms=()):
+        self._items = []
+        self._positions = {}  # organism id -> index in _items
+        for organism in organisms:
+            self.add(organism)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __contains__(self, organism):
+        position = self._positions.get(getattr(organism, 'id', None))
+        return position is not None and self._items[position] is organism
+
+    def __repr__(self):
+        return f"Population({len(self._items)} organisms)"
+
+    def get(self, organism_id, default=None):
+        """Organism with the given ID, if it is alive in this population"""
+        position = self._positions.get(organism_id)
+        if position is None:
+            return default
+        return self._items[position]
+
+    def ids(self):
+        """IDs of all organisms, in population order"""
+        return [organism.id for organism in self._items]
+
+    def add(self, organism):
+        """Append an organism"""
+        if organism.id in self._positions:
+            raise ValueError(f"Organism {organism.id} is already in the population")
+        self._positions[organism.id] = len(self._items)
+        self._items.append(organism)
+
+    def remove(self, organism):
+        """Remove one organism in O(1) by swapping the last one into its place"""
+        position = self._positions.pop(organism.id)
+        last = self._items.pop()
+        if last is not organism:
+            self._items[position] = last
+            self._positions[last.id] = position
+
+    def remove_many(self, organisms):
+        """Remove a batch of organisms in a single sweep.
+
+        Returns the organisms that were actually present.
+        """
+        doomed = {}
+        for organism in organisms:
+            if organism in self:
+                doomed[organism.id] = organism
+        if not doomed:
+            return []
+
+        self._items = [o for o in self._items if o.id not in doomed]
+        self._positions = {o.id: i for i, o in enumerate(self._items)}
+        return list(doomed.values())
@@ -3,7 +3,6 @@ Predator Organism
 Can hunt and consume other organisms for energy
 """
 
-import random
 import numpy as np
 from organism import Organism
 from config import *
@@ -11,8 +10,12 @@ from config import *
 class Predator(Organism):
     """Predator organism that hunts prey"""
     
-    def __init__(self, x, y, genome=None):
-        super().__init__(x, y, genome)
+    __slots__ = ()
+    
+    living_cost = ENERGY_COST_ALIVE * 1.5  # Predators cost more energy
+    
+    def __init__(self, x, y, genome=None, rng=None, config=None):
+        super().__init__(x, y, genome, rng=rng, config=config)
         self.is_predator = True
         
         # Predators have different color scheme (red tones)
@@ -25,40 +28,28 @@ class Predator(Organism):
         nearby_prey = []
         vision_range = 5
         
-        for organism in universe.organisms:
+        for organism, dx, dy, distance in universe.organisms_near(self.x, self.y, vision_range):
             if organism is self or getattr(organism, 'is_predator', False):
                 continue
             
-            dx = organism.x - self.x
-            dy = organism.y - self.y
-            
-            # Handle wrap-around (find shortest path)
-            if abs(dx) > universe.width / 2:
-                dx = dx - universe.width if dx > 0 else dx + universe.width
-            if abs(dy) > universe.height / 2:
-                dy = dy - universe.height if dy > 0 else dy + universe.height
-            
-            distance = (dx ** 2 + dy ** 2) ** 0.5
+            # Phase 2: Directional sensing - only see in forward cone
+            if self.config.ENABLE_DIRECTIONAL_SENSING:
+                if not self._is_in_vision_cone(int(dx), int(dy)):
+                    continue
             
-            if distance <= vision_range:
-                # Phase 2: Directional sensing - only see in forward cone
-                if ENABLE_DIRECTIONAL_SENSING:
-                    if not self._is_in_vision_cone(int(dx), int(dy)):
-                        continue
-                
-                nearby_prey.append((organism, dx, dy, distance))
+            nearby_prey.append((organism, dx, dy, distance))
         
         return nearby_prey
     
     def decide_move(self, universe):
         """Decide where to move - hunt prey or seek energy"""
-        if random.random() > self.genome['move_probability']:
+        if self.rng.movement.random() > self.genome['move_probability']:
             return 0, 0
         
         # First priority: hunt nearby prey
         nearby_prey = self.sense_prey(universe)
         
-        if nearby_prey and random.random() < 0.7:  # 70% chance to hunt
+        if nearby_prey and self.rng.movement.random() < 0.7:  # 70% chance to hunt
             # Move toward closest prey
             target, dx, dy, distance = min(nearby_prey, key=lambda x: x[3])
             
@@ -72,42 +63,33 @@ class Predator(Organism):
     
     def try_hunt(self, universe):
         """Try to catch and eat prey at current location"""
-        for organism in universe.organisms:
+        # Only organisms on the same cell can be caught
+        for organism in universe.organisms_at(self.x, self.y):
             if organism is self or getattr(organism, 'is_predator', False):
                 continue
             
-            # Check if prey is at same location
-            if organism.x == self.x and organism.y == self.y:
-                # Successful hunt!
-                energy_gained = organism.energy * 0.5  # Get 50% of prey's energy
-                self.energy += energy_gained
-                organism.energy = 0  # Kill the prey
-                
-                # Emit alarm signal
-                if hasattr(universe, 'signals'):
-                    from signal import Signal
-                    universe.add_signal(Signal(self.x, self.y, 'alarm', 2.0))
-                
-                return True
+            # Successful hunt!
+            energy_gained = organism.energy * 0.5  # Get 50% of prey's energy
+            self.energy += energy_gained
+            organism.energy = 0  # Kill the prey
+            
+            # Emit alarm signal
+            if hasattr(universe, 'signals'):
+                from signals import Signal
+                universe.add_signal(Signal(self.x, self.y, 'alarm', 2.0))
+            
+            return True
         
         return False
     
-    def update(self, universe):
-        """Update predator - hunt then normal update"""
-        self.age += 1
-        self.energy -= ENERGY_COST_ALIVE * 1.5  # Predators cost more energy
-        
+    def act(self, universe):
+        """Hunt, then move"""
         # Try to hunt
-        self.try_hunt(universe)
+        universe.hunt(self)
         
         # Decide and execute move
         dx, dy = self.decide_move(universe)
         if dx != 0 or dy != 0:
-            self.move(dx, dy, universe)
-        
-        # Try to eat energy (predators can also eat plants)
-        self.eat(universe)
+            universe.move_organism(self, dx, dy)
         
-        # Die of old age
-        if self.age > MAX_ORGANISM_AGE:
-            self.energy = 0
+        return True
@@ -3,7 +3,6 @@ Problem Solving Challenges
 Puzzles and challenges for organisms to solve
 """
 
-import random
 
 class Puzzle:
     """A puzzle environment"""
@@ -86,4 +85,4 @@ class ProblemSolver:
             return puzzle.required_steps.copy()
         else:
             # Trial and error
-            return [random.choice(['north', 'south', 'east', 'west', 'find_key', 'use_key', 'activate_a', 'activate_b', 'activate_c'])]
+            return [self.rng.cognition.choice(['north', 'south', 'east', 'west', 'find_key', 'use_key', 'activate_a', 'activate_b', 'activate_c'])]
@@ -0,0 +1,127 @@
+"""
+Tick Profiler
+Low-overhead timers and counters for the phases of a universe tick
+"""
+
+import time
+from config import ENABLE_PROFILING
+
+
+class _Timer:
+    """Context manager adding its elapsed time to one profiler entry"""
+    __slots__ = ('totals', 'calls', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.totals = profiler.totals
+        self.calls = profiler.calls
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.totals[self.name] = self.totals.get(self.name, 0.0) + time.perf_counter() - self.start
+        self.calls[self.name] = self.calls.get(self.name, 0) + 1
+        return False
+
+
+class _NullTimer:
+    """Shared do-nothing timer handed out while profiling is off"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class TickProfiler:
+    """Accumulates wall-clock time and call counts per named section.
+    
+    Usage:  with universe.profiler.timer('signals'): ...
+    
+    Sections may nest (times are inclusive), but a section must not be
+    re-entered inside itself, or from another thread: code running in
+    parallel times itself on its own profiler and merge()s it. While disabled, timer() returns a shared
+    no-op context manager and count() returns immediately.
+    """
+    
+    def __init__(self, enabled=ENABLE_PROFILING):
+        self.enabled = enabled
+        self.reset()
+    
+    def reset(self):
+        """Forget everything measured so far"""
+        self.ticks = 0
+        self.totals = {}  # section -> seconds
+        self.calls = {}  # section -> number of timed calls
+        self.counters = {}  # counter -> total
+        self._timers = {}
+    
+    def timer(self, name):
+        """Context manager timing one section"""
+        if not self.enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _Timer(self, name)
+        return timer
+    
+    def count(self, name, amount=1):
+        """Add to a named counter"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def merge(self, other):
+        """Add another profiler's sections and counters (not its ticks) to this one.
+        
+        Lets work running in parallel time itself on separate profilers;
+        sections timed in parallel add up, so they can exceed the wall
+        time of the phase they ran in.
+        """
+        for name, seconds in other.totals.items():
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+        for name, calls in other.calls.items():
+            self.calls[name] = self.calls.get(name, 0) + calls
+        for name, total in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + total
+    
+    def tick(self):
+        """Mark the end of one universe tick"""
+        if self.enabled:
+            self.ticks += 1
+    
+    def summary(self):
+        """Per-section ms per tick, calls and us per call, plus counters"""
+        ticks = max(1, self.ticks)
+        sections = {}
+        for name, seconds in self.totals.items():
+            calls = self.calls.get(name, 0)
+            sections[name] = {
+                'ms_per_tick': seconds * 1000 / ticks,
+                'calls_per_tick': calls / ticks,
+                'us_per_call': seconds * 1e6 / calls if calls else 0.0
+            }
+        return {
+            'ticks': self.ticks,
+            'sections': sections,
+            'counters': {name: total / ticks for name, total in self.counters.items()}
+        }
+    
+    def report(self):
+        """Human-readable summary, slowest sections first"""
+        summary = self.summary()
+        lines = [f"Profile over {summary['ticks']} ticks (ms/tick, calls/tick, us/call):"]
+        sections = sorted(summary['sections'].items(), key=lambda item: -item[1]['ms_per_tick'])
+        for name, section in sections:
+            lines.append(f"  {name:<32} {section['ms_per_tick']:9.2f} "
+                         f"{section['calls_per_tick']:9.1f} {section['us_per_call']:9.1f}")
+        for name, per_tick in sorted(summary['counters'].items()):
+            lines.append(f"  {name:<32} {per_tick:9.1f} per tick")
+        return '\n'.join(lines)
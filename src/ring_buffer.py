@@ -0,0 +1,70 @@
+"""
+Ring Buffer
+Fixed-size record of the most recent rows, in one small NumPy array
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """The last `capacity` rows of `width` numbers, oldest first.
+
+    Appending to a full buffer overwrites the oldest row. The array is
+    only allocated by the first append, so empty buffers cost almost
+    nothing. Iterating yields rows as tuples, like the list it replaces.
+    """
+
+    __slots__ = ('capacity', 'width', 'dtype', 'rows', 'start', 'count')
+
+    def __init__(self, capacity, width, dtype=np.float32):
+        self.capacity = capacity
+        self.width = width
+        self.dtype = dtype
+        self.rows = None  # (capacity, width) array, allocated by the first append
+        self.start = 0  # Index of the oldest row
+        self.count = 0
+
+    @classmethod
+    def from_rows(cls, rows, capacity, width, dtype=np.float32):
+        """Buffer holding the last `capacity` of these rows"""
+        buffer = cls(capacity, width, dtype)
+        for row in list(rows)[-capacity:]:
+            buffer.append(row)
+        return buffer
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def append(self, row):
+        if self.rows is None:
+            self.rows = np.zeros((self.capacity, self.width), dtype=self.dtype)
+        if self.count < self.capacity:
+            self.rows[(self.start + self.count) % self.capacity] = row
+            self.count += 1
+        else:
+            self.rows[self.start] = row
+            self.start = (self.start + 1) % self.capacity
+
+    def array(self):
+        """The rows in order, oldest first (a copy)"""
+        if not self.count:
+            return np.zeros((0, self.width), dtype=self.dtype)
+        return np.roll(self.rows, -self.start, axis=0)[:self.count]
+
+    def __iter__(self):
+        return iter([tuple(row) for row in self.array().tolist()])
+
+    def __getitem__(self, index):
+        rows = self.array()[index]
+        return tuple(rows.tolist()) if rows.ndim == 1 else [tuple(row) for row in rows.tolist()]
+
+    def best(self, column):
+        """Oldest of the rows with the largest value in `column`, as a tuple"""
+        rows = self.array()
+        return tuple(rows[int(np.argmax(rows[:, column]))].tolist())
+
+    def __repr__(self):
+        return f"RingBuffer({list(self)!r}, capacity={self.capacity})"
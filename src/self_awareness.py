@@ -242,7 +242,7 @@ class SelfAwareness:
         self.organism = organism
         
         # Self-recognition
-        self.self_id = id(organism)
+        self.self_id = organism.id
         self.recognizes_self = False
         
         # Self-model
@@ -260,7 +260,7 @@ class SelfAwareness:
     
     def recognize_self(self, organism):
         """Check if organism is self"""
-        is_self = id(organism) == self.self_id
+        is_self = organism.id == self.self_id
         
         if is_self and not self.recognizes_self:
             # First time recognizing self!
@@ -278,7 +278,7 @@ class SelfAwareness:
     
     def get_other_model(self, other_organism):
         """Get or create model of other"""
-        other_id = id(other_organism)
+        other_id = other_organism.id
         
         if other_id not in self.other_models:
             self.other_models[other_id] = OtherModel(other_organism)
@@ -4,7 +4,6 @@ EXPERIMENTAL: Allows organisms to modify their own decision-making code
 WARNING: This is potentially dangerous and disabled by default
 """
 
-import random
 import copy
 from collections import deque
 
@@ -98,8 +97,8 @@ class SafetySandbox:
         if modification.target == 'decision_weights':
             # Modify decision-making weights
             if 'move_probability' in organism.genome:
-                organism.genome['move_probability'] *= modification.parameters.get('factor', 1.0)
-                organism.genome['move_probability'] = max(0.0, min(1.0, organism.genome['move_probability']))
+                move_probability = organism.genome['move_probability'] * modification.parameters.get('factor', 1.0)
+                organism.set_gene('move_probability', max(0.0, min(1.0, move_probability)))
     
     def _measure_performance(self, organism):
         """Measure organism performance"""
@@ -154,7 +153,7 @@ class SelfModificationSystem:
             mod_id=mod_id,
             target='decision_weights',
             change_type='adjust',
-            parameters={'factor': random.uniform(0.8, 1.2)}
+            parameters={'factor': self.organism.rng.cognition.uniform(0.8, 1.2)}
         )
         
         self.proposed_modifications.append(modification)
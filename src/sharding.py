@@ -0,0 +1,434 @@
+"""
+Sharded Worlds
+Split the toroidal grid into tiles, each simulated by its own worker process
+
+Every worker runs an ordinary Universe the size of its tile plus a halo
+of width VISION_RANGE on each side, in coordinates local to that window:
+energy, puzzles and predators spawn only inside the tile, and only
+organisms standing on the tile live there. A worker's grid, energy fields
+and spatial index therefore shrink as workers are added. (A tile that
+spans the whole world along an axis gets the whole axis, which wraps as
+usual.) The energy grid of the world is one array in shared memory. Each
+tick a worker copies its window out of it (the halo exchange), waits
+until every worker has done the same, runs the tick, and writes its tile
+back. Energy its organisms took from halo cells is sent to the
+coordinator and subtracted from the owning tile. Organisms that moved
+off the tile are handed to the tile they moved onto (migration); they
+travel in world coordinates, remembered places included.
+
+Organisms interact (kin, predation, signals, structures) only with
+organisms on the same tile, and references to organisms on other tiles
+(kin, cell lists) resolve to None after a migration.
+"""
+
+import io
+import math
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+import numpy as np
+from config import *
+from rng import RandomStreams
+from simulation_config import SimulationConfig, default_config
+from snapshot import _ReferencePickler, _ReferenceUnpickler
+
+
+class TileLayout:
+    """A tiles_x by tiles_y split of a width by height toroidal grid"""
+
+    def __init__(self, width, height, tiles_x, tiles_y):
+        self.width = width
+        self.height = height
+        self.tiles_x = tiles_x
+        self.tiles_y = tiles_y
+        # Tile edges; tiles differ in size by at most one cell
+        self.x_edges = [width * i // tiles_x for i in range(tiles_x + 1)]
+        self.y_edges = [height * i // tiles_y for i in range(tiles_y + 1)]
+
+    @classmethod
+    def for_workers(cls, width, height, workers):
+        """Layout with `workers` tiles, as close to square tiles as possible"""
+        best = None
+        for tiles_x in range(1, workers + 1):
+            if workers % tiles_x:
+                continue
+            tiles_y = workers // tiles_x
+            aspect = abs(math.log((width / tiles_x) / (height / tiles_y)))
+            if best is None or aspect < best[0]:
+                best = (aspect, tiles_x, tiles_y)
+        return cls(width, height, best[1], best[2])
+
+    def __len__(self):
+        return self.tiles_x * self.tiles_y
+
+    def bounds(self, index):
+        """(x0, y0, x1, y1) of tile `index` (half-open)"""
+        tx, ty = index % self.tiles_x, index // self.tiles_x
+        return self.x_edges[tx], self.y_edges[ty], self.x_edges[tx + 1], self.y_edges[ty + 1]
+
+    def owner(self, x, y):
+        """Index of the tile containing cell (x, y)"""
+        tx = int(np.searchsorted(self.x_edges, x % self.width, side='right')) - 1
+        ty = int(np.searchsorted(self.y_edges, y % self.height, side='right')) - 1
+        return ty * self.tiles_x + tx
+
+    def halo(self, index, width):
+        """Wrapped row and column indices of tile `index` grown by `width` cells"""
+        x0, y0, x1, y1 = self.bounds(index)
+        rows = np.arange(y0 - width, y1 + width) % self.height
+        cols = np.arange(x0 - width, x1 + width) % self.width
+        return np.unique(rows), np.unique(cols)
+
+
+class _MigrationPickler(_ReferencePickler):
+    """Pickles migrating organisms whole; other organisms, streams and settings by reference"""
+
+    def __init__(self, file, migrants, rng):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.migrants = {id(organism) for organism in migrants}
+        self.rng = rng
+
+    def persistent_id(self, obj):
+        if obj is self.rng:
+            return ('rng', 0)
+        if isinstance(obj, SimulationConfig):
+            return ('config', 0)
+        if id(obj) in self.migrants:
+            return None
+        return super().persistent_id(obj)
+
+
+class _MigrationUnpickler(_ReferenceUnpickler):
+    """Resolves references against the receiving shard's organisms and streams"""
+
+    def __init__(self, file, organisms, rng, config=default_config):
+        super().__init__(file, organisms)
+        self.rng = rng
+        self.config = config
+
+    def persistent_load(self, pid):
+        if pid[0] == 'rng':
+            return self.rng
+        if pid[0] == 'config':
+            return self.config
+        return super().persistent_load(pid)
+
+
+def _pack(organisms, rng):
+    buffer = io.BytesIO()
+    _MigrationPickler(buffer, organisms, rng).dump(list(organisms))
+    return buffer.getvalue()
+
+
+def _unpack(data, organisms, rng, config=default_config):
+    return _MigrationUnpickler(io.BytesIO(data), organisms, rng, config).load()
+
+
+def _window(start, stop, size, halo):
+    """(offset, length) of the tile axis [start, stop) grown by `halo` cells on a torus of `size`.
+
+    The whole axis when the grown tile would cover it.
+    """
+    if stop - start + 2 * halo >= size:
+        return 0, size
+    return start - halo, stop - start + 2 * halo
+
+
+def _shift(organisms, dx, dy, width, height):
+    """Move organisms, and the places they remember, by (dx, dy) on a width by height torus"""
+    for organism in organisms:
+        organism.x = (organism.x + dx) % width
+        organism.y = (organism.y + dy) % height
+        memory = organism.attributes().get('memory')
+        if memory is not None and memory.rows is not None:
+            memory.rows[:, 0] = (memory.rows[:, 0] + dx) % width
+            memory.rows[:, 1] = (memory.rows[:, 1] + dy) % height
+
+
+class _LivingById:
+    """ID lookup over a universe's population, as the unpicklers expect"""
+
+    def __init__(self, universe):
+        self.universe = universe
+
+    def get(self, organism_id, default=None):
+        return self.universe.get_organism(organism_id) or default
+
+
+class _Shard:
+    """One tile's simulation, living in a worker process"""
+
+    def __init__(self, index, layout, halo, seed, grid_name, id_offset, id_step, config=default_config):
+        from universe import Universe
+        from organism import Organism
+
+        self.index = index
+        self.layout = layout
+        self.bounds = layout.bounds(index)
+
+        # Local window: tile plus halo; local cell (r, c) is world cell (rows[r], cols[c])
+        x0, y0, x1, y1 = self.bounds
+        self.x_offset, width = _window(x0, x1, layout.width, halo)
+        self.y_offset, height = _window(y0, y1, layout.height, halo)
+        self.rows = (np.arange(height) + self.y_offset) % layout.height
+        self.cols = (np.arange(width) + self.x_offset) % layout.width
+        self.local_bounds = (x0 - self.x_offset, y0 - self.y_offset,
+                             x1 - self.x_offset, y1 - self.y_offset)
+
+        Organism.interleave_ids(id_offset, id_step)
+        self.universe = Universe(seed=seed, config=config.replace(GRID_WIDTH=width, GRID_HEIGHT=height))
+        self.universe.spawn_region = self.local_bounds
+        self.universe.energy_grid[:] = 0
+        self.living = _LivingById(self.universe)
+
+        # Workers share the coordinator's resource tracker, which unlinks the block once
+        self.shm = shared_memory.SharedMemory(name=grid_name)
+        self.shared_grid = np.ndarray((layout.height, layout.width), dtype=np.float64,
+                                      buffer=self.shm.buf)
+
+        # Halo cells that belong to other tiles
+        inside_rows = (self.rows >= y0) & (self.rows < y1)
+        inside_cols = (self.cols >= x0) & (self.cols < x1)
+        self.foreign = ~np.outer(inside_rows, inside_cols)
+
+    def read_halo(self):
+        """Copy the tile and its halo out of shared memory"""
+        self.before = self.shared_grid[np.ix_(self.rows, self.cols)]
+        self.universe.energy_grid[:] = self.before
+
+    def to_local(self, organisms):
+        _shift(organisms, -self.x_offset, -self.y_offset, self.layout.width, self.layout.height)
+
+    def to_world(self, organisms):
+        _shift(organisms, self.x_offset, self.y_offset, self.layout.width, self.layout.height)
+
+    def pack(self, organisms):
+        """Pickle organisms for the coordinator or another tile, in world coordinates"""
+        self.to_world(organisms)
+        data = _pack(organisms, self.universe.rng)
+        self.to_local(organisms)
+        return data
+
+    def step(self, arrivals):
+        """Run one tick; returns (emigrants by tile, halo deltas, stats, ok)
+
+        Emigrants are (pickled organisms, count) per receiving tile; halo
+        deltas are flat grid indices and the energy change at each.
+        """
+        universe = self.universe
+        for data in arrivals:
+            organisms = _unpack(data, self.living, universe.rng, universe.config)
+            self.to_local(organisms)
+            for organism in organisms:
+                universe.add_organism(organism, birth=False)
+
+        ok = universe.update()
+
+        # Own tile back to shared memory; energy taken from halo cells as deltas
+        x0, y0, x1, y1 = self.bounds
+        lx0, ly0, lx1, ly1 = self.local_bounds
+        self.shared_grid[y0:y1, x0:x1] = universe.energy_grid[ly0:ly1, lx0:lx1]
+        change = (universe.energy_grid - self.before) * self.foreign
+        changed = np.nonzero(change)
+        halo_delta = (self.rows[changed[0]] * self.layout.width + self.cols[changed[1]],
+                      change[changed])
+
+        # Organisms that left the tile move to the tile they are now on
+        leaving = {}
+        for organism in universe.organisms:
+            if not (lx0 <= organism.x < lx1 and ly0 <= organism.y < ly1):
+                owner = self.layout.owner(self.cols[organism.x], self.rows[organism.y])
+                leaving.setdefault(owner, []).append(organism)
+        emigrants = {}
+        for owner, organisms in leaving.items():
+            universe.remove_organisms(organisms, death=False)
+            emigrants[owner] = (self.pack(organisms), len(organisms))
+
+        return emigrants, halo_delta, self.stats(), ok
+
+    def stats(self):
+        stats = {key: value for key, value in self.universe.stats.items()
+                 if isinstance(value, (int, float))}
+        stats['population'] = len(self.universe.organisms)
+        stats['organism_energy'] = self.universe.stats_tracker.organism_energy
+        return stats
+
+    def gather(self):
+        return self.pack(list(self.universe.organisms))
+
+
+def _worker(index, layout, halo, seed, grid_name, id_offset, id_step, config, barrier, conn):
+    """Worker process: build the shard with the coordinator's config, then serve commands"""
+    shard = _Shard(index, layout, halo, seed, grid_name, id_offset, id_step, config)
+
+    while True:
+        command, payload = conn.recv()
+        if command == 'step':
+            shard.read_halo()
+            barrier.wait()  # Nobody writes its tile until every halo is read
+            conn.send(shard.step(payload))
+        elif command == 'gather':
+            conn.send(shard.gather())
+        elif command == 'stop':
+            shard.shm.close()
+            conn.close()
+            return
+
+
+class ShardedUniverse:
+    """Coordinator for a world split into tiles simulated in parallel.
+
+    Build it, add the initial organisms with add_organism(), then call
+    update() once per tick. close() (or a with-block) stops the workers.
+    Every tile runs with `config` (a SimulationConfig; default_config if
+    not given), sized down to the tile's window.
+    """
+
+    def __init__(self, workers=SHARD_WORKERS, seed=None, halo=None, config=None):
+        from organism import Organism
+
+        self.config = default_config if config is None else config
+        self.width = self.config.GRID_WIDTH
+        self.height = self.config.GRID_HEIGHT
+        self.tick = 0
+        self.layout = TileLayout.for_workers(self.width, self.height, workers)
+        self.halo = max(self.config.VISION_RANGE, 1) if halo is None else halo
+
+        # Initial energy for the whole world, drawn like Universe does
+        self.rng = RandomStreams(seed)
+        self._shm = shared_memory.SharedMemory(create=True, size=self.width * self.height * 8)
+        self.energy_grid = np.ndarray((self.height, self.width), dtype=np.float64, buffer=self._shm.buf)
+        self.energy_grid[:] = 0
+        mask = self.rng.energy.np.random(self.energy_grid.shape) < self.config.INITIAL_ENERGY_DISTRIBUTION
+        self.energy_grid[mask] = self.config.ENERGY_AMOUNT
+
+        # IDs interleave: worker k hands out base + k + n * step, the coordinator base + workers
+        self._saved_ids = (Organism._next_id, Organism._id_step)
+        step = len(self.layout) + 1
+        base = Organism._next_id
+        Organism.interleave_ids(base + len(self.layout), step)
+
+        barrier = multiprocessing.Barrier(len(self.layout))
+        self._connections = []
+        self._processes = []
+        for index in range(len(self.layout)):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            tile_seed = [int(part) for part in np.atleast_1d(self.rng.seed)] + [index + 1]
+            process = multiprocessing.Process(
+                target=_worker, name=f"genesis-shard-{index}", daemon=True,
+                args=(index, self.layout, self.halo, tile_seed, self._shm.name,
+                      base + index, step, self.config, barrier, child_conn))
+            process.start()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+
+        self._arrivals = [[] for _ in self._connections]
+        self._pending = [[] for _ in self._connections]
+        self._migrating = 0
+        self._births = 0  # Initial organisms join shards as arrivals, not births
+        self.shard_stats = [{} for _ in self._connections]
+        self.peak_population = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add_organism(self, organism):
+        """Queue an organism for the tile it stands on (joins at the next update)"""
+        self._pending[self.layout.owner(organism.x, organism.y)].append(organism)
+        self._births += 1
+
+    def update(self):
+        """Advance every tile one tick in parallel"""
+        self.tick += 1
+        for index, organisms in enumerate(self._pending):
+            if organisms:
+                self._arrivals[index].append(_pack(organisms, self.rng))
+        self._pending = [[] for _ in self._connections]
+
+        for conn, arrivals in zip(self._connections, self._arrivals):
+            conn.send(('step', arrivals))
+        results = [conn.recv() for conn in self._connections]
+
+        # Energy taken across tile edges, then migrants for the next tick
+        self._arrivals = [[] for _ in self._connections]
+        self._migrating = 0
+        flat = self.energy_grid.reshape(-1)
+        ok = True
+        for index, (emigrants, (cells, deltas), stats, shard_ok) in enumerate(results):
+            np.add.at(flat, cells, deltas)
+            for owner, (data, count) in emigrants.items():
+                self._arrivals[owner].append(data)
+                self._migrating += count
+            self.shard_stats[index] = stats
+            ok = ok and shard_ok
+        np.maximum(flat, 0, out=flat)
+
+        population = self.population
+        self.peak_population = max(self.peak_population, population)
+        if population > self.config.EMERGENCY_STOP_POPULATION:
+            print(f"⚠️ EMERGENCY STOP: Population exceeded {self.config.EMERGENCY_STOP_POPULATION}")
+            return False
+        return ok
+
+    @property
+    def population(self):
+        """Organisms on all tiles (including migrants between tiles)"""
+        queued = sum(len(organisms) for organisms in self._pending)
+        settled = sum(stats.get('population', 0) for stats in self.shard_stats)
+        return settled + self._migrating + queued
+
+    def get_stats(self):
+        """World statistics summed over the tiles"""
+        totals = {}
+        for stats in self.shard_stats:
+            for key, value in stats.items():
+                totals[key] = totals.get(key, 0) + value
+        population = self.population
+        return {
+            'tick': self.tick,
+            'population': population,
+            'total_births': totals.get('total_births', 0) + self._births,
+            'total_deaths': totals.get('total_deaths', 0),
+            'total_energy_consumed': totals.get('total_energy_consumed', 0),
+            'peak_population': self.peak_population,
+            'predator_count': totals.get('predator_count', 0),
+            'prey_count': totals.get('prey_count', 0),
+            'total_grid_energy': float(self.energy_grid.sum()),
+            'avg_organism_energy': totals.get('organism_energy', 0) / population if population else 0,
+            'shard_populations': [stats.get('population', 0) for stats in self.shard_stats],
+        }
+
+    def gather_organisms(self):
+        """Copies of every organism on every tile (for inspection; not kept in sync)"""
+        for conn in self._connections:
+            conn.send(('gather', None))
+        batches = [conn.recv() for conn in self._connections]
+        batches += [data for arrivals in self._arrivals for data in arrivals]
+        organisms = [organism for data in batches for organism in _unpack(data, {}, self.rng, self.config)]
+        return organisms + [organism for pending in self._pending for organism in pending]
+
+    def close(self):
+        """Stop the workers and free the shared grid"""
+        from organism import Organism
+        if not self._processes:
+            return
+        for conn in self._connections:
+            try:
+                conn.send(('stop', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+        self.energy_grid = np.array(self.energy_grid)
+        self._shm.close()
+        self._shm.unlink()
+
+        next_id, step = self._saved_ids
+        Organism.interleave_ids(max(next_id, Organism._next_id), step)
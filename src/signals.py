@@ -0,0 +1,136 @@
+"""
+Communication Signal System
+Organisms can emit and detect signals for communication
+"""
+
+import numpy as np
+from config import MAX_SIGNALS
+
+SIGNAL_RANGE = 10  # Signals are felt up to this distance from their source
+SIGNAL_TYPES = ('alarm', 'food', 'mating')
+
+class Signal:
+    """A communication signal emitted by an organism"""
+    
+    def __init__(self, x, y, signal_type, strength=1.0):
+        self.x = x
+        self.y = y
+        self.type = signal_type  # 'alarm', 'food', 'mating'
+        self.strength = strength
+        self.age = 0
+    
+    def update(self):
+        """Age the signal and decay its strength"""
+        self.age += 1
+        self.strength *= 0.9  # Decay by 10% per tick
+    
+    def is_expired(self):
+        """Check if signal has decayed too much"""
+        return self.strength < 0.1 or self.age > 50
+    
+    def get_strength_at(self, x, y):
+        """Get signal strength at a given position"""
+        distance = ((self.x - x) ** 2 + (self.y - y) ** 2) ** 0.5
+        if distance > SIGNAL_RANGE:  # Max range
+            return 0
+        return self.strength * (1 - distance / SIGNAL_RANGE)
+
+
+class SignalField:
+    """All live signals of a universe, stored as arrays and bucketed by position.
+    
+    Decay and expiry run over the whole field at once (same rules as
+    Signal.update/is_expired) and keep emission order. Buckets are
+    SIGNAL_RANGE cells wide, so sensing only looks at the 3x3 buckets
+    around the organism. Iterating yields Signal objects for display and
+    saving; sense() builds them only for the signals actually felt.
+    """
+    
+    def __init__(self, capacity=MAX_SIGNALS):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.int64)
+        self.type = np.zeros(capacity, dtype=np.int8)
+        self.strength = np.zeros(capacity)
+        self.age = np.zeros(capacity, dtype=np.int64)
+        self.buckets = {}  # (bx, by) -> slots, in emission order
+    
+    @classmethod
+    def from_signals(cls, signals, capacity=MAX_SIGNALS):
+        """Field holding existing Signal objects (e.g. from an old save)"""
+        field = cls(capacity)
+        for signal in signals:
+            field.add(signal)
+        return field
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        for slot in range(self.count):
+            yield self.signal(slot)
+    
+    def signal(self, slot):
+        """Signal object for one slot"""
+        signal = Signal(int(self.x[slot]), int(self.y[slot]),
+                        SIGNAL_TYPES[self.type[slot]], float(self.strength[slot]))
+        signal.age = int(self.age[slot])
+        return signal
+    
+    def add(self, signal):
+        """Store a signal; returns False if the field is full"""
+        if self.count >= self.capacity:
+            return False
+        slot = self.count
+        self.x[slot] = signal.x
+        self.y[slot] = signal.y
+        self.type[slot] = SIGNAL_TYPES.index(signal.type)
+        self.strength[slot] = signal.strength
+        self.age[slot] = signal.age
+        self.count += 1
+        key = (signal.x // SIGNAL_RANGE, signal.y // SIGNAL_RANGE)
+        self.buckets.setdefault(key, []).append(slot)
+        return True
+    
+    def update(self):
+        """Age and decay every signal, then drop the expired ones in bulk"""
+        n = self.count
+        self.age[:n] += 1
+        self.strength[:n] *= 0.9  # Decay by 10% per tick
+        
+        alive = (self.strength[:n] >= 0.1) & (self.age[:n] <= 50)
+        if alive.all():
+            return
+        
+        keep = np.flatnonzero(alive)
+        for column in (self.x, self.y, self.type, self.strength, self.age):
+            column[:len(keep)] = column[keep]
+        self.count = len(keep)
+        self._rebuild_buckets()
+    
+    def _rebuild_buckets(self):
+        self.buckets = {}
+        bxs = (self.x[:self.count] // SIGNAL_RANGE).tolist()
+        bys = (self.y[:self.count] // SIGNAL_RANGE).tolist()
+        for slot, key in enumerate(zip(bxs, bys)):
+            self.buckets.setdefault(key, []).append(slot)
+    
+    def sense(self, x, y, threshold=0.1):
+        """Signals felt at (x, y) above threshold, as (Signal, strength) in emission order"""
+        bx = x // SIGNAL_RANGE
+        by = y // SIGNAL_RANGE
+        slots = []
+        for key in ((bx + i, by + j) for i in (-1, 0, 1) for j in (-1, 0, 1)):
+            bucket = self.buckets.get(key)
+            if bucket:
+                slots.extend(bucket)
+        if not slots:
+            return []
+        
+        slots = np.array(sorted(slots))
+        distance = np.hypot(self.x[slots] - x, self.y[slots] - y)
+        strength = self.strength[slots] * (1 - distance / SIGNAL_RANGE)
+        felt = (distance <= SIGNAL_RANGE) & (strength > threshold)
+        return [(self.signal(slot), float(s))
+                for slot, s in zip(slots[felt].tolist(), strength[felt].tolist())]
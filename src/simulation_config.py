@@ -0,0 +1,100 @@
+"""
+Simulation Configuration
+The settings one simulation runs with, as an object instead of module constants
+
+A SimulationConfig copies every setting in config.py, applies overrides
+and precomputes what the per-tick code would otherwise branch on, most
+importantly the list of organism behaviour stages that are switched on.
+Universe and Organism read their settings from it, so two universes in
+one process can run with different settings (in-process sweeps).
+Subsystems outside Universe, Organism and Predator (signals, cognitive
+modules, ...) still read config.py directly.
+"""
+
+import config
+from vision import get_table as get_vision_table
+
+# Organism behaviour stages in the order Organism.act runs them, each with
+# the setting that switches it on. Stage `name` is Organism._stage_<name>.
+ORGANISM_STAGES = (
+    ('memory', 'ENABLE_MEMORY'),
+    ('signals', 'ENABLE_COMMUNICATION'),
+    ('kin', 'ENABLE_SOCIAL'),
+    ('reasoning', 'ENABLE_ABSTRACT_REASONING'),
+    ('language', 'ENABLE_LANGUAGE'),
+    ('self_awareness', 'ENABLE_SELF_AWARENESS'),
+    ('creativity', 'ENABLE_CREATIVITY'),
+    ('self_modification', 'ENABLE_SELF_MODIFICATION'),
+    ('agi', 'ENABLE_GENERAL_INTELLIGENCE'),
+)
+
+
+class SimulationConfig:
+    """Settings for one simulation: config.py's values plus overrides.
+
+    Settings are attributes with their config.py names
+    (config.ENABLE_LANGUAGE). Overrides must name existing settings;
+    PERFORMANCE_MODE=True applies PERFORMANCE_OVERRIDES first, as
+    config.py does.
+    """
+
+    def __init__(self, **overrides):
+        settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+        unknown = set(overrides) - set(settings)
+        if unknown:
+            raise ValueError(f"Unknown config settings: {', '.join(sorted(unknown))}")
+        if overrides.get('PERFORMANCE_MODE') and not settings['PERFORMANCE_MODE']:
+            settings.update(settings['PERFORMANCE_OVERRIDES'])
+        settings.update(overrides)
+        self.__dict__.update(settings)
+        self.overrides = dict(overrides)
+
+        # Precomputed from the settings above
+        self.organism_stages = tuple(name for name, setting in ORGANISM_STAGES if settings[setting])
+        self.sensing_range = self.VISION_RANGE if self.ENABLE_MEMORY else 1
+        self.vision = get_vision_table(self.VISION_RANGE, self.VISION_CONE_ANGLE)
+        self.mutable_genes = self._mutable_genes()
+        self._stage_functions = {}
+
+    def _mutable_genes(self):
+        """Genes a mutation may pick, for the enabled features"""
+        genes = ['move_probability', 'move_randomness', 'eat_threshold', 'reproduce_threshold']
+        if self.ENABLE_COMMUNICATION:
+            genes.extend(['signal_probability', 'signal_response'])
+        if self.ENABLE_SOCIAL:
+            genes.extend(['cooperation', 'aggression'])
+        if self.ENABLE_ABSTRACT_REASONING:
+            genes.extend(['pattern_recognition', 'causal_reasoning'])
+        if self.ENABLE_LANGUAGE:
+            genes.extend(['language_ability', 'innovation_tendency'])
+        if self.ENABLE_CREATIVITY:
+            genes.extend(['curiosity', 'exploration_tendency'])
+        if self.ENABLE_SELF_AWARENESS:
+            genes.extend(['self_reflection', 'theory_of_mind'])
+        return genes
+
+    def stages(self, cls):
+        """The enabled stage functions of an organism class, in order"""
+        functions = self._stage_functions.get(cls)
+        if functions is None:
+            functions = tuple(getattr(cls, '_stage_' + name) for name in self.organism_stages)
+            self._stage_functions[cls] = functions
+        return functions
+
+    def replace(self, **overrides):
+        """A new config with these overrides on top of this one's"""
+        return SimulationConfig(**{**self.overrides, **overrides})
+
+    def __getstate__(self):
+        return self.overrides
+
+    def __setstate__(self, overrides):
+        self.__init__(**overrides)
+
+    def __repr__(self):
+        settings = ', '.join(f"{name}={value!r}" for name, value in sorted(self.overrides.items()))
+        return f"SimulationConfig({settings})"
+
+
+# Config of organisms and universes that are not given one
+default_config = SimulationConfig()
@@ -0,0 +1,978 @@
+"""
+Columnar Snapshots
+Versioned on-disk format for saved universes
+
+A snapshot is a directory holding a header.json and one file per section:
+NumPy arrays (.npy) for the energy grid, scalar organism state, genes,
+packed brain weights and signals, and pickles for the small irregular
+parts (organism extras, optional cognitive state, world objects).
+Organisms referenced from pickled objects are stored by ID, so a save
+never drags in parent chains or dead organisms.
+
+A delta checkpoint uses the same layout but only records what changed
+since the previous checkpoint (survivors' genomes and brains are not
+repeated); a chain of deltas sits on top of a full snapshot and is
+replayed in order (see CheckpointChain).
+"""
+
+import importlib
+import io
+import json
+import os
+import pickle
+import shutil
+import time
+import numpy as np
+from genome import Genome
+from organism import Organism
+
+FORMAT = 'genesis-snapshot'
+DELTA_FORMAT = 'genesis-delta'
+VERSION = 2
+HEADER_FILE = 'header.json'
+TEMP_SUFFIX = '.tmp'
+OLD_SUFFIX = '.old'
+
+# Scalar organism state saved as columns: name -> dtype
+ORGANISM_COLUMNS = {
+    'id': np.int64,
+    'kind': np.int8,
+    'parent_id': np.int64,
+    'x': np.int64,
+    'y': np.int64,
+    'energy': np.float64,
+    'age': np.int64,
+    'generation': np.int64,
+    'direction': np.int8,
+    'is_predator': np.bool_,
+}
+
+# Scalar state that changes during an organism's life (recorded in deltas)
+DELTA_COLUMNS = ('x', 'y', 'energy', 'age', 'direction')
+
+# Attributes holding the Phase 4/5 subsystems (optional 'cognition' section)
+COGNITIVE_ATTRIBUTES = ('reasoning', 'language', 'self_awareness', 'creativity',
+                        'self_modification', 'agi')
+
+# Attributes that are never pickled into the 'extras' section
+_COLUMN_ATTRIBUTES = {'id', 'x', 'y', 'energy', 'age', 'generation', 'direction',
+                      'is_predator', 'parent', 'parent_id', 'genome', 'rng', 'config',
+                      '_store', '_slot', 'cells'}
+
+# Side of the square cells that the region index buckets organisms into
+INDEX_CELL_SIZE = 16
+
+
+class SnapshotError(Exception):
+    """Raised for unreadable or incompatible snapshots"""
+
+
+_IS_ORGANISM = {}  # type -> whether it is an organism class (persistent_id runs per pickled object)
+
+
+class _ReferencePickler(pickle.Pickler):
+    """Pickles organisms reached from other objects as ('organism', id)"""
+
+    def persistent_id(self, obj):
+        kind = type(obj)
+        is_organism = _IS_ORGANISM.get(kind)
+        if is_organism is None:
+            is_organism = _IS_ORGANISM[kind] = issubclass(kind, Organism)
+        return ('organism', obj.id) if is_organism else None
+
+
+class _ReferenceUnpickler(pickle.Unpickler):
+    """Resolves organism references against the restored organisms.
+
+    References to organisms that were not alive at save time load as None.
+    """
+
+    def __init__(self, file, organisms):
+        super().__init__(file)
+        self.organisms = organisms
+
+    def persistent_load(self, pid):
+        kind, organism_id = pid
+        if kind != 'organism':
+            raise pickle.UnpicklingError(f"Unknown reference: {pid!r}")
+        return self.organisms.get(organism_id)
+
+
+def _class_path(organism):
+    """Importable path of an organism's class (ignoring array-mode views)"""
+    cls = getattr(type(organism), '_base_class', type(organism))
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _import_class(path):
+    module, name = path.rsplit('.', 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+class _Records(bytes):
+    """Concatenated, independently unpicklable per-organism pickles"""
+
+
+class CapturedSnapshot:
+    """In-memory copy of everything a snapshot writes.
+
+    capture_snapshot() builds it on the simulation thread: array copies,
+    plus references to the objects that get pickled. Pickling them is the
+    expensive part and is left to serialize(), which write() calls. Until
+    then the referenced objects must not change, so serialize() either runs
+    before the simulation carries on or in a forked copy of the process
+    (see SimulationSaver.autosave); write() can then run anywhere.
+    """
+
+    def __init__(self):
+        self.sections = {}  # name -> ndarray, pickled bytes or _Records
+        self.pending = {}  # name -> (kind, object), pickled by serialize()
+        self.header = {}
+        self.capture_seconds = 0.0
+
+    def array(self, name, array):
+        self.sections[name] = np.ascontiguousarray(array)
+
+    def pickle(self, name, obj):
+        self.pending[name] = ('pickle', obj)
+
+    def records(self, name, objects):
+        """One pickle per object, so a reader can load any subset of them"""
+        self.pending[name] = ('records', objects)
+
+    def serialize(self):
+        """Pickle the referenced objects; returns the seconds it took"""
+        start = time.perf_counter()
+        for name, (kind, obj) in self.pending.items():
+            buffer = io.BytesIO()
+            if kind == 'pickle':
+                _ReferencePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+                self.sections[name] = buffer.getvalue()
+                continue
+            offsets = [0]
+            for record in obj:
+                _ReferencePickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(record)
+                offsets.append(buffer.tell())
+            self.sections[name] = _Records(buffer.getvalue())
+            self.array(f"{name}.offsets", np.array(offsets, dtype=np.int64))
+        self.pending = {}
+        return time.perf_counter() - start
+
+    def write(self, path):
+        """Write to directory `path` atomically; returns the header.
+
+        Sections go into a temporary sibling directory that is renamed into
+        place once complete, so a crash never leaves a half-written save
+        under the final name.
+        """
+        start = time.perf_counter()
+        self.serialize()
+        temp_path = path + TEMP_SUFFIX
+        if os.path.isdir(temp_path):
+            shutil.rmtree(temp_path)
+        os.makedirs(temp_path)
+
+        sections = {}
+        for name, data in self.sections.items():
+            if isinstance(data, np.ndarray):
+                filename = f"{name}.npy"
+                np.save(os.path.join(temp_path, filename), data)
+                sections[name] = {'file': filename, 'kind': 'array',
+                                  'dtype': str(data.dtype), 'shape': list(data.shape)}
+            else:
+                filename = f"{name}.pkl"
+                with open(os.path.join(temp_path, filename), 'wb') as f:
+                    f.write(data)
+                kind = 'records' if isinstance(data, _Records) else 'pickle'
+                sections[name] = {'file': filename, 'kind': kind}
+            sections[name]['bytes'] = os.path.getsize(os.path.join(temp_path, filename))
+
+        header = dict(self.header, sections=sections)
+        with open(os.path.join(temp_path, HEADER_FILE), 'w') as f:
+            json.dump(header, f, indent=2)
+
+        # Swap into place (directories cannot be replaced in one rename)
+        old_path = path + OLD_SUFFIX
+        if os.path.isdir(path):
+            os.rename(path, old_path)
+        os.rename(temp_path, path)
+        if os.path.isdir(old_path):
+            shutil.rmtree(old_path)
+
+        header['save_seconds'] = self.capture_seconds + time.perf_counter() - start
+        return header
+
+
+def write_snapshot(universe, path, include_cognition=True):
+    """Write the universe to snapshot directory `path` and return its header"""
+    return capture_snapshot(universe, include_cognition).write(path)
+
+
+def _scan_organisms(organisms):
+    """Scalar columns, class list, numeric gene matrix and genome vectors for organisms"""
+    n = len(organisms)
+    classes = []
+    columns = {name: np.zeros(n, dtype=dtype) for name, dtype in ORGANISM_COLUMNS.items()}
+    gene_names = []
+    layouts = {}  # genome schema -> rows with that layout
+    with_extras = []  # rows whose genomes carry genes outside their schema
+    for i, organism in enumerate(organisms):
+        path_name = _class_path(organism)
+        if path_name not in classes:
+            classes.append(path_name)
+        parent_id = organism.parent_id
+        columns['id'][i] = organism.id
+        columns['kind'][i] = classes.index(path_name)
+        columns['parent_id'][i] = parent_id if parent_id is not None else -1
+        columns['x'][i] = organism.x
+        columns['y'][i] = organism.y
+        columns['energy'][i] = organism.energy
+        columns['age'][i] = organism.age
+        columns['generation'][i] = organism.generation
+        columns['direction'][i] = getattr(organism, 'direction', -1)
+        columns['is_predator'][i] = organism.is_predator
+
+        # Gene names in the order genomes list them, first seen first
+        genome = organism.genome
+        rows = layouts.get(genome.schema)
+        if rows is None:
+            rows = layouts[genome.schema] = []
+            for key, _, _ in genome.schema.numeric:
+                if key not in gene_names:
+                    gene_names.append(key)
+        rows.append(i)
+        if genome.extras:
+            with_extras.append(i)
+            for key, value in genome.extras.items():
+                if _is_number(value) and key not in gene_names:
+                    gene_names.append(key)
+
+    # Gene values plus which of them are ints (mutation can clamp a float gene to 0 or 1),
+    # read from one copy of the genome vectors per layout
+    genes = np.full((n, len(gene_names)), np.nan)
+    gene_ints = np.zeros((n, len(gene_names)), dtype=bool)
+    index = {name: j for j, name in enumerate(gene_names)}
+    vectors = {}
+    for schema, rows in layouts.items():
+        rows = np.array(rows, dtype=np.int64)
+        block = np.stack([organisms[i].genome.vector for i in rows.tolist()])
+        vectors[schema] = (rows, block)
+        for key, slot, is_int in schema.numeric:
+            values = block[:, slot].astype(np.float64)
+            genes[rows, index[key]] = np.trunc(values) if is_int else values
+            gene_ints[rows, index[key]] = is_int
+    for i in with_extras:
+        for key, value in organisms[i].genome.extras.items():
+            if _is_number(value):
+                genes[i, index[key]] = value
+                gene_ints[i, index[key]] = isinstance(value, (int, np.integer))
+
+    return {
+        'classes': classes,
+        'columns': columns,
+        'gene_names': gene_names,
+        'genes': genes,
+        'gene_ints': gene_ints,
+        'vectors': vectors,  # schema -> (rows, genome vectors)
+    }
+
+
+def _capture_records(captured, organisms, rows, scan, include_cognition):
+    """Full records for organisms[rows]: columns, genes, colours, brains, extras, cognition.
+
+    Returns the brain group list for the header.
+    """
+    for name, column in scan['columns'].items():
+        captured.array(f"organisms.{name}", column[rows])
+    captured.array('genes', scan['genes'][rows])
+    captured.array('genes.int', scan['gene_ints'][rows])
+
+    # Colours and brains straight from the scanned genome vectors
+    position = np.full(len(organisms), -1, dtype=np.int64)
+    position[rows] = np.arange(len(rows))
+    colors = np.zeros((len(rows), 3), dtype=np.int16)
+    brains = {}  # topology -> ([rows], [params])
+    for schema, (layout_rows, block) in scan['vectors'].items():
+        positions = position[layout_rows]
+        keep = positions >= 0
+        if not keep.any():
+            continue
+        positions, block = positions[keep], block[keep]
+        if 'color' in schema.fields:
+            start, stop = schema.fields['color'][1:]
+            colors[positions] = np.trunc(block[:, start:stop])
+        if 'brain' in schema.fields:
+            start, stop = schema.fields['brain'][1:]
+            brain_rows, params = brains.setdefault(schema.topology, ([], []))
+            brain_rows.append(positions)
+            params.append(block[:, start:stop])
+    for topology, (brain_rows, params) in brains.items():
+        brain_rows, params = np.concatenate(brain_rows), np.concatenate(params)
+        order = np.argsort(brain_rows, kind='stable')  # Readers search the rows
+        brains[topology] = (brain_rows[order], params[order])
+
+    captured.array('colors', colors)
+    brain_groups = []
+    for index, (topology, (brain_rows, params)) in enumerate(brains.items()):
+        input_size, hidden_sizes, output_size = topology
+        captured.array(f"brains.{index}.rows", brain_rows)
+        captured.array(f"brains.{index}.params", params)
+        brain_groups.append({'section': f"brains.{index}", 'input_size': input_size,
+                             'hidden_sizes': list(hidden_sizes), 'output_size': output_size})
+
+    _capture_state(captured, organisms, rows, scan['gene_names'], include_cognition)
+    return brain_groups
+
+
+def _capture_state(captured, organisms, rows, gene_names, include_cognition, prefix=''):
+    """Records of organisms[rows]' extras (memory, kin, ...) and optional cognitive state"""
+    gene_names = set(gene_names)
+    extras = []
+    cognition = []
+    for row in rows.tolist():
+        organism = organisms[row]
+        attributes = organism.attributes()  # Lazy state only if already in use
+        leftover = {key: value for key, value in (organism.genome.extras or {}).items()
+                    if not (key in gene_names and _is_number(value))}
+
+        extra = {key: value for key, value in attributes.items()
+                 if key not in _COLUMN_ATTRIBUTES and key not in COGNITIVE_ATTRIBUTES}
+        if leftover:
+            extra['__genome__'] = leftover
+        extras.append(extra)
+        if include_cognition:
+            cognition.append({key: attributes[key] for key in COGNITIVE_ATTRIBUTES if key in attributes})
+
+    captured.records(f"{prefix}extras", extras)
+    if include_cognition:
+        captured.records(f"{prefix}cognition", cognition)
+
+
+def _capture_cell_groups(captured, organisms):
+    """Member IDs of every multi-cellular body (their `cells` list is shared)"""
+    groups = {}
+    for organism in organisms:
+        cells = getattr(organism, 'cells', None)
+        if cells is not None and len(cells) > 1 and id(cells) not in groups:
+            groups[id(cells)] = [cell.id if cell is not None else -1 for cell in cells]
+    captured.pickle('cell_groups', list(groups.values()))
+
+
+def _capture_index(captured, columns, width, height):
+    """Lookup tables for partial loads: rows sorted by ID, and rows bucketed by region"""
+    by_id = np.argsort(columns['id'], kind='stable')
+    captured.array('index.ids', columns['id'][by_id])
+    captured.array('index.by_id', by_id)
+
+    grid_columns = -(-width // INDEX_CELL_SIZE)
+    grid_rows = -(-height // INDEX_CELL_SIZE)
+    cells = (columns['y'] // INDEX_CELL_SIZE) * grid_columns + columns['x'] // INDEX_CELL_SIZE
+    captured.array('index.cell_rows', np.argsort(cells, kind='stable'))
+    counts = np.bincount(cells, minlength=grid_columns * grid_rows)
+    captured.array('index.cell_start', np.concatenate([[0], np.cumsum(counts)]))
+    return {'cell_size': INDEX_CELL_SIZE, 'columns': grid_columns, 'rows': grid_rows}
+
+
+def _capture_world(captured, universe):
+    """Signals, lineage records, world objects and random stream state"""
+    signals = getattr(universe, 'signals', None)
+    if signals is not None and hasattr(signals, 'count'):
+        for name in ('x', 'y', 'type', 'strength', 'age'):
+            captured.array(f"signals.{name}", getattr(signals, name)[:signals.count].copy())
+
+    lineage = getattr(universe, 'lineage', None)
+    if lineage is not None:
+        for name, column in lineage.arrays().items():
+            captured.array(f"lineage.{name}", column)
+
+    captured.pickle('world', {
+        'rng': universe.rng,
+        'structures': getattr(universe, 'structures', None),
+        'puzzles': getattr(universe, 'puzzles', None),
+        'hierarchies': getattr(universe, 'hierarchies', None),
+    })
+
+
+def _header(universe, organisms, scan, brain_groups, include_cognition):
+    return {
+        'format': FORMAT,
+        'version': VERSION,
+        'tick': universe.tick,
+        'population': len(organisms),
+        'width': universe.width,
+        'height': universe.height,
+        'stats': {k: v for k, v in universe.stats.items() if _is_number(v)},
+        'classes': scan['classes'],
+        'genome_keys': list(organisms[0].genome) if organisms else [],
+        'gene_names': scan['gene_names'],
+        'brains': brain_groups,
+        'has_cognition': include_cognition,
+        'multicellular': any(hasattr(organism, 'cells') for organism in organisms[:1]),
+    }
+
+
+def capture_snapshot(universe, include_cognition=True, name=None):
+    """Copy the universe's state into a CapturedSnapshot (no disk I/O).
+
+    `name` is the save's name, recorded in the baseline that later delta
+    checkpoints refer back to.
+    """
+    start = time.perf_counter()
+    captured = CapturedSnapshot()
+    organisms = list(universe.organisms)
+    scan = _scan_organisms(organisms)
+
+    grid = universe.energy_grid.copy()
+    captured.array('grid', grid)
+    brain_groups = _capture_records(captured, organisms, np.arange(len(organisms)),
+                                    scan, include_cognition)
+    _capture_cell_groups(captured, organisms)
+    _capture_world(captured, universe)
+
+    captured.header = _header(universe, organisms, scan, brain_groups, include_cognition)
+    captured.header['index'] = _capture_index(captured, scan['columns'],
+                                              universe.width, universe.height)
+    captured.baseline = Baseline(name, name, 0, organisms, scan, grid)
+    captured.capture_seconds = time.perf_counter() - start
+    return captured
+
+
+class Baseline:
+    """What the latest checkpoint recorded; the next delta is taken against it"""
+
+    def __init__(self, name, base, depth, organisms, scan, grid):
+        self.name = name
+        self.base = base  # Full snapshot at the root of the chain
+        self.depth = depth  # Deltas between the base and this checkpoint
+        self.grid = grid
+        self.columns = scan['columns']
+        self.gene_names = scan['gene_names']
+        self.genes = scan['genes']
+        self.gene_ints = scan['gene_ints']
+        self.rows = {organism_id: row for row, organism_id in enumerate(self.columns['id'].tolist())}
+        self.genomes = {organism.id: organism.genome for organism in organisms}
+        self.brains = {organism.id: organism.genome.get('brain') for organism in organisms}
+
+
+def capture_delta(universe, baseline, include_cognition=True, name=None):
+    """Capture only what changed since `baseline` (a delta checkpoint).
+
+    Records changed grid cells, the IDs of organisms that died, changed
+    scalar state and genes of survivors, survivors' extras (memory, kin,
+    ...) and cognitive state, and full records of organisms that were born
+    (or had their genome replaced). Only genomes and brains are not
+    re-recorded for survivors, so a replayed chain matches a full capture.
+
+    Returns None when the delta cannot be expressed against the baseline
+    (the set of numeric genes changed); take a full snapshot instead.
+    """
+    start = time.perf_counter()
+    organisms = list(universe.organisms)
+    scan = _scan_organisms(organisms)
+    if scan['gene_names'] != baseline.gene_names:
+        return None
+
+    captured = CapturedSnapshot()
+    columns = scan['columns']
+    ids = columns['id']
+
+    # Changed grid cells
+    grid = universe.energy_grid.copy()
+    changed_cells = np.flatnonzero(grid != baseline.grid)
+    captured.array('grid.index', changed_cells)
+    captured.array('grid.values', grid.ravel()[changed_cells])
+
+    # Population order, deaths and births
+    captured.array('order', ids)
+    captured.array('died', np.setdiff1d(baseline.columns['id'], ids))
+    previous = np.array([baseline.rows.get(organism_id, -1) for organism_id in ids.tolist()],
+                        dtype=np.int64)
+    new = previous < 0
+    for row, organism in enumerate(organisms):
+        if not new[row] and (organism.genome is not baseline.genomes[organism.id] or
+                             organism.genome.get('brain') is not baseline.brains[organism.id]):
+            new[row] = True
+    brain_groups = _capture_records(captured, organisms, np.flatnonzero(new), scan, include_cognition)
+
+    # Survivors whose scalar state or genes changed
+    survivors = np.flatnonzero(~new)
+    old_rows = previous[survivors]
+    changed = np.zeros(len(survivors), dtype=bool)
+    for column in DELTA_COLUMNS:
+        changed |= columns[column][survivors] != baseline.columns[column][old_rows]
+    rows = survivors[changed]
+    captured.array('state.id', ids[rows])
+    for column in DELTA_COLUMNS:
+        captured.array(f"state.{column}", columns[column][rows])
+
+    genes, old_genes = scan['genes'][survivors], baseline.genes[old_rows]
+    same = (genes == old_genes) | (np.isnan(genes) & np.isnan(old_genes))
+    same &= scan['gene_ints'][survivors] == baseline.gene_ints[old_rows]
+    rows = survivors[~same.all(axis=1)]
+    captured.array('genes.changed.id', ids[rows])
+    captured.array('genes.changed', scan['genes'][rows])
+    captured.array('genes.changed.int', scan['gene_ints'][rows])
+
+    # Survivors' other state changes in place (memories fill, subsystems learn),
+    # so it is recorded again for every survivor
+    captured.array('survivors.id', ids[survivors])
+    _capture_state(captured, organisms, survivors, scan['gene_names'], include_cognition,
+                   prefix='survivors.')
+
+    _capture_cell_groups(captured, organisms)
+    _capture_world(captured, universe)
+
+    captured.header = _header(universe, organisms, scan, brain_groups, include_cognition)
+    captured.header.update({
+        'format': DELTA_FORMAT,
+        'base': baseline.base,
+        'parent': baseline.name,
+        'depth': baseline.depth + 1,
+        'born': int(new.sum()),
+    })
+    captured.baseline = Baseline(name, baseline.base, baseline.depth + 1, organisms, scan, grid)
+    captured.capture_seconds = time.perf_counter() - start
+    return captured
+
+
+class Snapshot:
+    """A snapshot or delta checkpoint directory.
+
+    Opening one reads only the header. Sections are read on demand (arrays
+    memory-mapped), and read_organisms() loads a selection of organisms by
+    ID or region without touching the others.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        header_path = os.path.join(path, HEADER_FILE)
+        if not os.path.exists(header_path):
+            raise SnapshotError(f"Not a snapshot: {path}")
+        with open(header_path) as f:
+            self.header = json.load(f)
+        if self.header.get('format') not in (FORMAT, DELTA_FORMAT):
+            raise SnapshotError(f"Unknown save format in {path}")
+        if self.header.get('version', 0) > VERSION:
+            raise SnapshotError(f"Snapshot version {self.header['version']} is newer "
+                                f"than supported version {VERSION}")
+
+    @property
+    def tick(self):
+        return self.header['tick']
+
+    @property
+    def population(self):
+        return self.header['population']
+
+    @property
+    def is_delta(self):
+        return self.header['format'] == DELTA_FORMAT
+
+    def has_section(self, name):
+        return name in self.header['sections']
+
+    def _section_path(self, name):
+        if name not in self.header['sections']:
+            raise SnapshotError(f"Snapshot has no section '{name}'")
+        return os.path.join(self.path, self.header['sections'][name]['file'])
+
+    def array(self, name, mmap=True):
+        """One array section, memory-mapped read-only unless mmap=False"""
+        return np.load(self._section_path(name), mmap_mode='r' if mmap else None)
+
+    def load_pickle(self, name, organisms):
+        """One pickle section, with organism references resolved via `organisms`"""
+        with open(self._section_path(name), 'rb') as f:
+            return _ReferenceUnpickler(f, organisms).load()
+
+    def _records(self, name, rows, organisms):
+        """Per-organism objects of a records section, for the given rows only"""
+        if self.header['sections'][name]['kind'] == 'pickle':
+            # Version 1 snapshots pickled the whole list at once
+            objects = self.load_pickle(name, organisms)
+            return [objects[row] for row in rows]
+
+        offsets = self.array(f"{name}.offsets")
+        objects = []
+        with open(self._section_path(name), 'rb') as f:
+            for row in rows:
+                f.seek(int(offsets[row]))
+                objects.append(_ReferenceUnpickler(f, organisms).load())
+        return objects
+
+    # Partial loading
+
+    def grid(self):
+        """The energy grid (memory-mapped)"""
+        return self.array('grid')
+
+    def organism_ids(self):
+        """IDs of all organisms alive at save time, in population order"""
+        return self.array('order' if self.is_delta else 'organisms.id')
+
+    def find_ids(self, ids):
+        """Sorted rows of the recorded organisms with the given IDs (absent IDs are skipped)"""
+        wanted = np.unique(np.asarray(ids, dtype=np.int64))
+        if not self.has_section('index.ids'):
+            return np.flatnonzero(np.isin(self.array('organisms.id'), wanted))
+
+        # Binary search in the sorted ID index touches only a few pages
+        sorted_ids = self.array('index.ids')
+        if not len(sorted_ids):
+            return np.zeros(0, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(sorted_ids, wanted), len(sorted_ids) - 1)
+        positions = positions[sorted_ids[positions] == wanted]
+        return np.sort(self.array('index.by_id')[positions])
+
+    def find_region(self, x0, y0, x1, y1):
+        """Sorted rows of the recorded organisms with x0 <= x < x1 and y0 <= y < y1"""
+        if 'index' not in self.header:
+            xs, ys = self.array('organisms.x'), self.array('organisms.y')
+            return np.flatnonzero((xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1))
+
+        index = self.header['index']
+        size, grid_columns = index['cell_size'], index['columns']
+        cell_x0, cell_x1 = max(0, x0 // size), min(grid_columns - 1, (x1 - 1) // size)
+        cell_y0, cell_y1 = max(0, y0 // size), min(index['rows'] - 1, (y1 - 1) // size)
+        if cell_x0 > cell_x1 or cell_y0 > cell_y1:
+            return np.zeros(0, dtype=np.int64)
+
+        # Cells along one row of the index are contiguous in cell_rows
+        cell_start = self.array('index.cell_start')
+        cell_rows = self.array('index.cell_rows')
+        candidates = np.concatenate([
+            cell_rows[cell_start[cy * grid_columns + cell_x0]:cell_start[cy * grid_columns + cell_x1 + 1]]
+            for cy in range(cell_y0, cell_y1 + 1)
+        ]).astype(np.int64)
+        candidates.sort()
+        xs = self.array('organisms.x')[candidates]
+        ys = self.array('organisms.y')[candidates]
+        return candidates[(xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)]
+
+    def read_organisms(self, ids=None, region=None, include_cognition=False):
+        """Load only the selected organisms, as objects outside any universe.
+
+        Select by `ids`, by `region` (x0, y0, x1, y1; half-open), or both.
+        References to organisms outside the selection load as None.
+        """
+        if self.is_delta:
+            raise SnapshotError(f"{self.path} is a delta checkpoint; read its CheckpointChain")
+        rows = np.arange(self.population)
+        if ids is not None:
+            rows = np.intersect1d(rows, self.find_ids(ids))
+        if region is not None:
+            rows = np.intersect1d(rows, self.find_region(*region))
+
+        from rng import default_streams
+        organisms, _ = self._build_organisms(include_cognition, {}, rows)
+        for organism in organisms:
+            organism.rng = default_streams
+        return organisms
+
+    # Full restores
+
+    def restore(self, universe, include_cognition=True):
+        """Load the snapshot into `universe` (replacing its state)"""
+        if self.is_delta:
+            raise SnapshotError(f"{self.path} is a delta checkpoint; restore its CheckpointChain")
+        header = self.header
+        universe.tick = header['tick']
+        universe.energy_grid = self.array('grid', mmap=False)
+        universe.stats = dict(header['stats'])
+
+        organisms, by_id = self._build_organisms(include_cognition, {})
+        self._restore_world(universe, organisms, by_id)
+        return universe
+
+    def apply(self, universe, include_cognition=True):
+        """Replay this delta on top of a universe holding its parent checkpoint"""
+        header = self.header
+        universe.tick = header['tick']
+        universe.stats = dict(header['stats'])
+        np.put(universe.energy_grid, self.array('grid.index'), self.array('grid.values'))
+
+        living = {organism.id: organism for organism in universe.organisms}
+        born, by_id = self._build_organisms(include_cognition, living)
+
+        state = {column: self.array(f"state.{column}").tolist()
+                 for column in ('id',) + DELTA_COLUMNS}
+        for i, organism_id in enumerate(state['id']):
+            organism = by_id[organism_id]
+            for column in DELTA_COLUMNS:
+                value = state[column][i]
+                if column != 'direction' or value >= 0:
+                    setattr(organism, column, value)
+        self._apply_gene_changes(by_id)
+        self._apply_survivor_state(by_id, include_cognition)
+
+        organisms = [by_id[organism_id] for organism_id in self.array('order').tolist()]
+        self._restore_world(universe, organisms, by_id)
+        return universe
+
+    def _apply_gene_changes(self, by_id):
+        """Set the genes this delta recorded as changed (for organisms in by_id)"""
+        gene_names = self.header['gene_names']
+        for organism_id, values, ints in zip(self.array('genes.changed.id').tolist(),
+                                             self.array('genes.changed').tolist(),
+                                             self.array('genes.changed.int').tolist()):
+            organism = by_id.get(organism_id)
+            if organism is None:
+                continue
+            for name, value, is_int in zip(gene_names, values, ints):
+                if value == value:
+                    organism.set_gene(name, int(value) if is_int else value)
+
+    def _apply_survivor_state(self, by_id, include_cognition):
+        """Set the survivors' extras and cognitive state this delta recorded (for organisms in by_id)"""
+        if not self.has_section('survivors.id'):
+            return  # Deltas written before survivors' state was recorded
+        ids = self.array('survivors.id').tolist()
+        rows = [row for row, organism_id in enumerate(ids) if organism_id in by_id]
+        for row, extra in zip(rows, self._records('survivors.extras', rows, by_id)):
+            organism = by_id[ids[row]]
+            leftover = extra.pop('__genome__', {})
+            organism.__setstate__(extra)
+            organism.genome.update(leftover)
+        if include_cognition and self.header.get('has_cognition'):
+            for row, state in zip(rows, self._records('survivors.cognition', rows, by_id)):
+                organism = by_id[ids[row]]
+                organism._reset_cognition()
+                organism.__setstate__(state)
+
+    def _restore_world(self, universe, organisms, by_id):
+        """Install organisms, world objects, random streams and signals"""
+        world = self.load_pickle('world', by_id)
+        universe.rng = world['rng']
+        for name in ('structures', 'puzzles', 'hierarchies'):
+            if world.get(name) is not None:
+                setattr(universe, name, world[name])
+
+        for organism in organisms:
+            organism.rng = universe.rng
+            organism.config = universe.config
+        universe.set_organisms(organisms)
+
+        if universe.lineage is not None:
+            from lineage import LINEAGE_COLUMNS, LineageStore
+            if self.has_section('lineage.id'):
+                universe.lineage = LineageStore.from_arrays(
+                    {name: self.array(f"lineage.{name}") for name in LINEAGE_COLUMNS})
+            else:
+                universe.lineage = LineageStore.from_organisms(organisms)
+
+        if self.has_section('signals.x') and hasattr(universe, 'signals'):
+            from signals import SignalField
+            signals = SignalField()
+            count = self.header['sections']['signals.x']['shape'][0]
+            for name in ('x', 'y', 'type', 'strength', 'age'):
+                getattr(signals, name)[:count] = self.array(f"signals.{name}")
+            signals.count = count
+            signals._rebuild_buckets()
+            universe.signals = signals
+
+        universe.stats_tracker.resync(universe)
+
+    def _build_organisms(self, include_cognition, known, rows=None):
+        """Recreate recorded organisms without running their constructors.
+
+        `rows` selects recorded organisms (default: all). `known` maps IDs
+        to organisms that already exist (survivors when replaying a delta).
+        Returns the new organisms and an ID lookup covering both.
+        """
+        header = self.header
+        if rows is None:
+            rows = np.arange(header['sections']['organisms.id']['shape'][0])
+        rows = np.asarray(rows, dtype=np.int64)
+        classes = [_import_class(path) for path in header['classes']]
+        columns = {name: self.array(f"organisms.{name}")[rows].tolist() for name in ORGANISM_COLUMNS}
+        gene_names = header['gene_names']
+        genes = self.array('genes')[rows].tolist()
+        gene_ints = self.array('genes.int')[rows].tolist()
+        colors = self.array('colors')[rows].tolist()
+
+        organisms = []
+        for i in range(len(rows)):
+            cls = classes[columns['kind'][i]]
+            organism = cls.__new__(cls)
+            organism.id = columns['id'][i]
+            organism.x = columns['x'][i]
+            organism.y = columns['y'][i]
+            organism.energy = columns['energy'][i]
+            organism.age = columns['age'][i]
+            organism.generation = columns['generation'][i]
+            organism.is_predator = columns['is_predator'][i]
+            if columns['direction'][i] >= 0:
+                organism.direction = columns['direction'][i]
+
+            values = {}
+            for name, value, is_int in zip(gene_names, genes[i], gene_ints[i]):
+                if value == value:  # Not NaN: the organism has this gene
+                    values[name] = int(value) if is_int else value
+            values['color'] = tuple(colors[i])
+            organism.genome = values
+            organisms.append(organism)
+
+        # Brains (each topology group lists the rows it covers, in order)
+        from neural_network import NeuralNetwork
+        for group in header['brains']:
+            group_rows = self.array(f"{group['section']}.rows")
+            params = self.array(f"{group['section']}.params")
+            positions = np.minimum(np.searchsorted(group_rows, rows), max(len(group_rows) - 1, 0))
+            found = np.flatnonzero(group_rows[positions] == rows) if len(group_rows) else []
+            for i in found:
+                organisms[i].genome['brain'] = NeuralNetwork.from_params(
+                    params[positions[i]], group['input_size'], group['hidden_sizes'],
+                    group['output_size'])
+
+        by_id = dict(known)
+        by_id.update((organism.id, organism) for organism in organisms)
+
+        # Ancestry beyond the parent's ID lives in the lineage store
+        for organism, parent_id in zip(organisms, columns['parent_id']):
+            organism.parent_id = parent_id if parent_id >= 0 else None
+
+        # Everything else on the organism, then shared cell lists and cognition
+        for organism, extra in zip(organisms, self._records('extras', rows, by_id)):
+            leftover = extra.pop('__genome__', {})
+            organism.__setstate__(extra)
+            organism.genome.update(leftover)
+            organism.genome = Genome.from_dict({key: organism.genome[key] for key in header['genome_keys']
+                                                if key in organism.genome} | organism.genome)
+
+        if header.get('multicellular'):
+            for organism in organisms:
+                organism.cells = [organism]
+        if self.has_section('cell_groups'):
+            for members in self.load_pickle('cell_groups', {}):
+                cells = [by_id.get(member) for member in members]
+                for member in members:
+                    if member in by_id:
+                        by_id[member].cells = cells
+
+        if include_cognition and header.get('has_cognition'):
+            for organism, state in zip(organisms, self._records('cognition', rows, by_id)):
+                organism.__setstate__(state)
+        else:
+            for organism in organisms:
+                organism._reset_cognition()
+
+        return organisms, by_id
+
+
+class CheckpointChain:
+    """A delta checkpoint together with the checkpoints it builds on"""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots  # Full snapshot first, then deltas in order
+
+    @property
+    def tick(self):
+        return self.snapshots[-1].tick
+
+    @property
+    def population(self):
+        return self.snapshots[-1].population
+
+    @property
+    def header(self):
+        return self.snapshots[-1].header
+
+    def restore(self, universe, include_cognition=True):
+        """Restore the full snapshot and replay every delta on top of it"""
+        self.snapshots[0].restore(universe, include_cognition)
+        for delta in self.snapshots[1:]:
+            delta.apply(universe, include_cognition)
+        return universe
+
+    # Partial loading
+
+    def grid(self):
+        """The energy grid at the last checkpoint (an in-memory copy)"""
+        grid = self.snapshots[0].array('grid', mmap=False)
+        for delta in self.snapshots[1:]:
+            np.put(grid, delta.array('grid.index'), delta.array('grid.values'))
+        return grid
+
+    def organism_ids(self):
+        """IDs of all organisms alive at the last checkpoint, in population order"""
+        return self.snapshots[-1].organism_ids()
+
+    def scalar_columns(self):
+        """ID and changing scalar state of every living organism, replayed as arrays"""
+        names = ('id',) + DELTA_COLUMNS
+        columns = {name: np.array(self.snapshots[0].array(f"organisms.{name}")) for name in names}
+        for delta in self.snapshots[1:]:
+            stacked = {name: np.concatenate([columns[name], delta.array(f"organisms.{name}")])
+                       for name in names}
+            # Births and replaced genomes come last, so their rows win
+            position = {organism_id: row for row, organism_id in enumerate(stacked['id'].tolist())}
+            changed = [position[organism_id] for organism_id in delta.array('state.id').tolist()]
+            for name in DELTA_COLUMNS:
+                stacked[name][changed] = delta.array(f"state.{name}")
+            order = [position[organism_id] for organism_id in delta.array('order').tolist()]
+            columns = {name: stacked[name][order] for name in names}
+        return columns
+
+    def read_organisms(self, ids=None, region=None, include_cognition=False):
+        """Load only the selected organisms as they were at the last checkpoint.
+
+        Each organism comes from its newest full record in the chain, brought
+        up to date with the scalar state, gene changes and survivor state
+        recorded since.
+        """
+        columns = self.scalar_columns()
+        selected = np.ones(len(columns['id']), dtype=bool)
+        if ids is not None:
+            selected &= np.isin(columns['id'], np.asarray(ids, dtype=np.int64))
+        if region is not None:
+            x0, y0, x1, y1 = region
+            selected &= ((columns['x'] >= x0) & (columns['x'] < x1) &
+                         (columns['y'] >= y0) & (columns['y'] < y1))
+        wanted = columns['id'][selected].tolist()
+
+        from rng import default_streams
+        found = {}
+        remaining = set(wanted)
+        for index in range(len(self.snapshots) - 1, -1, -1):
+            snapshot = self.snapshots[index]
+            rows = snapshot.find_ids(sorted(remaining))
+            if len(rows):
+                organisms, _ = snapshot._build_organisms(include_cognition, {}, rows)
+                by_id = {organism.id: organism for organism in organisms}
+                for later in self.snapshots[index + 1:]:
+                    later._apply_gene_changes(by_id)
+                    later._apply_survivor_state(by_id, include_cognition)
+                found.update(by_id)
+                remaining.difference_update(by_id)
+            if not remaining:
+                break
+
+        row_of = {organism_id: row for row, organism_id in enumerate(columns['id'].tolist())}
+        result = []
+        for organism_id in wanted:
+            organism = found[organism_id]
+            organism.rng = default_streams
+            for name in DELTA_COLUMNS:
+                value = columns[name][row_of[organism_id]].item()
+                if name != 'direction' or value >= 0:
+                    setattr(organism, name, value)
+            result.append(organism)
+        return result
+
+def open_checkpoint(path):
+    """Snapshot at `path`, or the CheckpointChain ending there for a delta"""
+    snapshot = Snapshot(path)
+    if not snapshot.is_delta:
+        return snapshot
+
+    chain = [snapshot]
+    while chain[0].is_delta:
+        parent = os.path.join(os.path.dirname(path), chain[0].header['parent'])
+        if not os.path.isdir(parent):
+            raise SnapshotError(f"Checkpoint {chain[0].path} needs missing parent {parent}")
+        chain.insert(0, Snapshot(parent))
+    return CheckpointChain(chain)
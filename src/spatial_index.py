@@ -0,0 +1,139 @@
+"""
+Spatial Index
+Uniform-grid buckets of organisms for fast neighbourhood queries
+"""
+
+
+class SpatialIndex:
+    """Cell-bucketed index of organisms on a toroidal grid.
+
+    The grid is divided into square buckets of `bucket_size` cells. Each
+    bucket is an insertion-ordered dict used as an ordered set, so query
+    results come back in a stable order from run to run.
+    """
+
+    def __init__(self, width, height, bucket_size=5):
+        self.width = width
+        self.height = height
+        self.bucket_size = max(1, bucket_size)
+        self.buckets_x = (width + self.bucket_size - 1) // self.bucket_size
+        self.buckets_y = (height + self.bucket_size - 1) // self.bucket_size
+
+        self.buckets = {}  # (bx, by) -> {organism: None}
+        self.keys = {}  # organism -> (bx, by) it is currently filed under
+
+    def _key(self, x, y):
+        """Bucket holding grid position (x, y)"""
+        return (int(x) % self.width // self.bucket_size,
+                int(y) % self.height // self.bucket_size)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, organism):
+        return organism in self.keys
+
+    def insert(self, organism):
+        """Start tracking an organism at its current position"""
+        if organism in self.keys:
+            self.update(organism)
+            return
+        key = self._key(organism.x, organism.y)
+        self.buckets.setdefault(key, {})[organism] = None
+        self.keys[organism] = key
+
+    def remove(self, organism):
+        """Stop tracking an organism"""
+        key = self.keys.pop(organism, None)
+        if key is None:
+            return
+        bucket = self.buckets[key]
+        del bucket[organism]
+        if not bucket:
+            del self.buckets[key]
+
+    def update(self, organism):
+        """Re-file an organism after its position changed"""
+        old_key = self.keys.get(organism)
+        if old_key is None:
+            return  # Not tracked (e.g. not yet added to the universe)
+        new_key = self._key(organism.x, organism.y)
+        if new_key == old_key:
+            return
+        bucket = self.buckets[old_key]
+        del bucket[organism]
+        if not bucket:
+            del self.buckets[old_key]
+        self.buckets.setdefault(new_key, {})[organism] = None
+        self.keys[organism] = new_key
+
+    def clear(self):
+        """Forget every organism"""
+        self.buckets = {}
+        self.keys = {}
+
+    def rebuild(self, organisms):
+        """Rebuild the index from scratch"""
+        self.clear()
+        for organism in organisms:
+            self.insert(organism)
+
+    def _bucket_range(self, center, radius, size, count):
+        """Bucket coordinates covering cells [center - radius, center + radius] with wrap.
+
+        Cells are wrapped before they are bucketed: when size is not a
+        multiple of bucket_size the last bucket is partial, so wrapping
+        bucket numbers instead would land in the wrong bucket.
+        """
+        if 2 * radius + 1 >= size:
+            return range(count)
+        first = (center - radius) % size // self.bucket_size
+        last = (center + radius) % size // self.bucket_size
+        if (center - radius) % size <= (center + radius) % size:
+            return range(first, last + 1)
+        # Wraps: [first cell, size) then [0, last cell], without repeating a bucket
+        buckets = list(range(first, count)) + list(range(min(last + 1, first)))
+        return range(count) if len(buckets) == count else buckets
+
+    def query_radius(self, x, y, radius):
+        """Find organisms within `radius` of (x, y) on the torus.
+
+        Returns a list of (organism, dx, dy, distance) where (dx, dy) is the
+        shortest wrapped offset from (x, y) to the organism.
+        """
+        x = int(x)
+        y = int(y)
+        r = int(radius) + 1
+        half_w = self.width / 2
+        half_h = self.height / 2
+
+        found = []
+        for bx in self._bucket_range(x, r, self.width, self.buckets_x):
+            for by in self._bucket_range(y, r, self.height, self.buckets_y):
+                bucket = self.buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for organism in bucket:
+                    dx = organism.x - x
+                    dy = organism.y - y
+
+                    # Handle wrap-around (find shortest path)
+                    if abs(dx) > half_w:
+                        dx = dx - self.width if dx > 0 else dx + self.width
+                    if abs(dy) > half_h:
+                        dy = dy - self.height if dy > 0 else dy + self.height
+
+                    distance = (dx ** 2 + dy ** 2) ** 0.5
+                    if distance <= radius:
+                        found.append((organism, dx, dy, distance))
+
+        return found
+
+    def at(self, x, y):
+        """Organisms standing exactly on cell (x, y)"""
+        x = int(x) % self.width
+        y = int(y) % self.height
+        bucket = self.buckets.get(self._key(x, y))
+        if not bucket:
+            return []
+        return [o for o in bucket if o.x == x and o.y == y]
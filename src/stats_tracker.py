@@ -0,0 +1,144 @@
+"""
+Statistics Tracker
+Running totals behind Universe.get_stats and an opt-in deep stats sampler
+"""
+
+import numpy as np
+from config import *
+
+
+class StatsTracker:
+    """Keeps the totals reported by get_stats up to date incrementally.
+
+    Energy on the grid is adjusted as it is spawned and eaten; energy held
+    by organisms is summed during each tick's organism sweep and adjusted
+    on births and deaths in between, so building a snapshot is O(1).
+
+    The per-organism cognitive aggregates (Phase 4/5) are expensive and are
+    only computed by sample_deep(), every `deep_interval` ticks (by default
+    LOG_INTERVAL, so logged stats carry a fresh sample; 0 = only on demand).
+    Snapshots carry the most recent deep sample.
+    """
+
+    def __init__(self, deep_interval=DEEP_STATS_INTERVAL):
+        self.deep_interval = deep_interval
+        self.grid_energy = 0.0
+        self.organism_energy = 0.0
+        self.deep = {}
+        self.deep_tick = None
+
+    def resync(self, universe):
+        """Recompute the running totals from scratch (e.g. after loading)"""
+        self.grid_energy = float(np.sum(universe.energy_grid))
+        self.organism_energy = float(sum(o.energy for o in universe.organisms))
+
+    def energy_changed(self, amount):
+        """Energy was added to (positive) or removed from the grid"""
+        self.grid_energy += amount
+
+    def organism_added(self, organism):
+        self.organism_energy += organism.energy
+
+    def organism_removed(self, organism):
+        self.organism_energy -= organism.energy
+
+    def deep_due(self, tick):
+        """Should the deep sampler run at this tick?"""
+        return self.deep_interval > 0 and tick % self.deep_interval == 0
+
+    def snapshot(self, universe):
+        """Current statistics without touching any organism"""
+        population = len(universe.organisms)
+        counters = universe.stats
+        stats = {
+            'tick': universe.tick,
+            'population': population,
+            'total_births': counters['total_births'],
+            'total_deaths': counters['total_deaths'],
+            'total_energy_consumed': counters['total_energy_consumed'],
+            'total_energy': self.grid_energy,
+            'avg_organism_energy': self.organism_energy / population if population else 0,
+            'peak_population': counters['peak_population']
+        }
+
+        # Phase 2 stats
+        if ENABLE_PREDATORS:
+            stats['predator_count'] = counters.get('predator_count', 0)
+            stats['prey_count'] = counters.get('prey_count', 0)
+
+        if ENABLE_COMMUNICATION:
+            stats['active_signals'] = len(universe.signals) if hasattr(universe, 'signals') else 0
+            stats['signals_emitted'] = counters.get('signals_emitted', 0)
+
+        # Tick profile, when profiling is on
+        if universe.profiler.enabled:
+            stats['profile'] = universe.profiler.summary()
+        
+        # Phase 4/5 stats from the last deep sample
+        if self.deep_tick is not None:
+            stats.update(self.deep)
+            stats['deep_stats_tick'] = self.deep_tick
+
+        return stats
+
+    def sample_deep(self, universe):
+        """Aggregate cognitive statistics over every organism (expensive)"""
+        self.resync(universe)
+        organisms = universe.organisms
+        deep = {}
+
+        # Phase 4 stats - aggregate from organisms
+        if ENABLE_ABSTRACT_REASONING and organisms:
+            reasoning_organisms = [o for o in organisms if hasattr(o, 'reasoning')]
+            if reasoning_organisms:
+                reasoning_stats = [o.reasoning.get_stats() for o in reasoning_organisms]
+                deep['avg_patterns_recognized'] = np.mean([s['patterns_recognized']
+                                                          for s in reasoning_stats])
+                deep['avg_categories'] = np.mean([s['categories_formed']
+                                                 for s in reasoning_stats])
+
+        if ENABLE_LANGUAGE and organisms:
+            language_organisms = [o for o in organisms if hasattr(o, 'language')]
+            if language_organisms:
+                deep['avg_vocabulary'] = np.mean([o.language.get_vocabulary_size()
+                                                 for o in language_organisms])
+                deep['total_utterances'] = sum([len(o.language.utterances_produced)
+                                               for o in language_organisms])
+
+        if ENABLE_SELF_AWARENESS and organisms:
+            aware_organisms = [o for o in organisms if hasattr(o, 'self_awareness')]
+            if aware_organisms:
+                deep['self_aware_count'] = sum([1 for o in aware_organisms
+                                               if o.self_awareness.recognizes_self])
+                deep['avg_reflections'] = np.mean([len(o.self_awareness.reflections)
+                                                  for o in aware_organisms])
+
+        if ENABLE_CREATIVITY and organisms:
+            creative_organisms = [o for o in organisms if hasattr(o, 'creativity')]
+            if creative_organisms:
+                deep['total_innovations'] = sum([o.creativity.innovations_created
+                                                for o in creative_organisms])
+                deep['avg_exploration_rate'] = np.mean([o.creativity.exploration_rate
+                                                       for o in creative_organisms])
+
+        # Phase 5 stats - AGI emergence
+        if ENABLE_GENERAL_INTELLIGENCE and organisms:
+            agi_organisms = [o for o in organisms if hasattr(o, 'agi')]
+            if agi_organisms:
+                deep['avg_general_intelligence'] = np.mean([o.agi.calculate_general_intelligence()
+                                                           for o in agi_organisms])
+                deep['total_problems_solved'] = sum([sum(o.agi.problems_solved.values())
+                                                     for o in agi_organisms])
+                deep['avg_consciousness_phi'] = np.mean([o.agi.consciousness.phi
+                                                        for o in agi_organisms])
+                deep['total_autonomous_goals'] = sum([len(o.agi.goals)
+                                                     for o in agi_organisms])
+                # One complexity_history entry per organism per deep sample
+                deep['avg_complexity'] = np.mean([o.agi.measure_complexity()
+                                                 for o in agi_organisms])
+                deep['novel_behaviors_archived'] = sum([len(o.agi.behavior_archive)
+                                                       for o in agi_organisms])
+
+        self.deep = deep
+        self.deep_tick = universe.tick
+        return deep
@@ -0,0 +1,195 @@
+"""
+Two-Phase Tick
+Organisms decide against a read-only view of the world, then one
+deterministic pass commits every decision
+
+Decide: every organism ages, pays its cost of living, senses and thinks
+(Organism.act) against a WorldView. The view answers the same queries as
+the universe but records moves, hunts, signals and utterances as intents
+instead of applying them, and the energy grid is read-only. Organisms
+only change their own state here, and each draws from streams keyed on
+(seed, tick, id), so the outcome does not depend on the order organisms
+decide in or on how they are split into batches.
+
+Commit, in organism ID order: signals and utterances, hunts (resolved at
+the cells predators started the tick on; each prey is caught at most
+once, by the lowest-ID predator), moves, eating (after everyone has
+moved, the lowest-ID eligible organism on a cell eats), old age, then
+reproduction.
+"""
+
+import numpy as np
+from profiler import TickProfiler
+from rng import KeyedStreams
+
+
+class Intent:
+    """What one organism decided to do this tick"""
+
+    __slots__ = ('organism', 'acted', 'move', 'hunt', 'signals', 'utterances')
+
+    def __init__(self, organism):
+        self.organism = organism
+        self.acted = False      # False: a behaviour took the whole turn (no eating)
+        self.move = None        # (dx, dy)
+        self.hunt = False
+        self.signals = []
+        self.utterances = []    # (listener, utterance)
+
+
+class WorldView:
+    """Read-only stand-in for the universe during the decide phase.
+
+    Queries pass through to the universe; the calls Organism.act uses to
+    change the world are recorded on the current organism's Intent. Each
+    view times its batch on its own profiler (timers are not thread-safe),
+    which decide_intents merges into the universe's.
+    """
+
+    def __init__(self, universe):
+        self._universe = universe
+        self.intent = None
+        self.profiler = TickProfiler(enabled=universe.profiler.enabled)
+
+    def __getattr__(self, name):
+        return getattr(self._universe, name)
+
+    def move_organism(self, organism, dx, dy):
+        self.intent.move = (dx, dy)
+
+    def hunt(self, predator):
+        self.intent.hunt = True
+
+    def add_signal(self, signal):
+        self.intent.signals.append(signal)
+
+    def deliver_utterance(self, listener, utterance):
+        self.intent.utterances.append((listener, utterance))
+
+    def consume_energy(self, x, y, amount):
+        raise RuntimeError("Energy is only consumed in the commit phase")
+
+    def decide(self, organisms):
+        """Run the decide phase for a batch of organisms; returns their intents"""
+        intents = []
+        for organism in organisms:
+            self.intent = Intent(organism)
+            organism.age += 1
+            organism.energy -= organism.living_cost
+            self.intent.acted = organism.act(self)
+            intents.append(self.intent)
+        self.intent = None
+        return intents
+
+
+def decide_intents(universe, organisms, batch_size=None, executor=None):
+    """Decide phase for the whole population, in independent batches.
+
+    Batches share nothing but read-only state, so `executor` (anything with
+    a map(), e.g. a concurrent.futures thread pool) may run them in
+    parallel. Neural moves are decided first, vectorized per topology.
+    """
+    if batch_size is None:
+        batch_size = universe.config.TWO_PHASE_BATCH_SIZE
+    organisms = sorted(organisms, key=lambda organism: organism.id)
+    seed = universe.rng.seed
+    shared = [organism.rng for organism in organisms]
+    for organism in organisms:
+        organism.rng = KeyedStreams(seed, universe.tick, organism.id)
+
+    grid = universe.energy_grid
+    grid.flags.writeable = False
+    try:
+        if universe.config.USE_NEURAL_NETWORKS:
+            with universe.profiler.timer('neural_prefetch'):
+                universe._prefetch_neural_moves(organisms)
+
+        batches = [organisms[start:start + batch_size]
+                   for start in range(0, len(organisms), max(1, batch_size))]
+        views = [WorldView(universe) for _ in batches]
+        decide = lambda view, batch: view.decide(batch)
+        mapped = map(decide, views, batches) if executor is None else executor.map(decide, views, batches)
+        intents = [intent for batch in mapped for intent in batch]
+        for view in views:
+            universe.profiler.merge(view.profiler)
+    finally:
+        grid.flags.writeable = True
+        for organism, rng in zip(organisms, shared):
+            organism.rng = rng
+        universe.neural_moves.clear()
+
+    return intents
+
+
+def commit_intents(universe, intents):
+    """Apply decided intents in organism ID order.
+
+    Returns (dead organisms, offspring, energy held by the survivors),
+    like Universe.update_organisms.
+    """
+    # Signals and utterances
+    for intent in intents:
+        for signal in intent.signals:
+            universe.add_signal(signal)
+        for listener, utterance in intent.utterances:
+            if hasattr(listener, 'language'):
+                listener.language.comprehend(utterance)
+
+    # Hunts, where the predators stood when they decided
+    for intent in intents:
+        if intent.hunt:
+            _resolve_hunt(universe, intent.organism)
+
+    # Moves
+    for intent in intents:
+        if intent.move is not None:
+            intent.organism.move(*intent.move, universe)
+
+    # Eat: after everyone has moved, the lowest ID on a cell eats first
+    eaters = [intent.organism for intent in intents
+              if intent.acted and intent.organism.energy > 0]
+    if eaters:
+        xs = np.fromiter((o.x for o in eaters), dtype=np.int64, count=len(eaters))
+        ys = np.fromiter((o.y for o in eaters), dtype=np.int64, count=len(eaters))
+        thresholds = np.fromiter((o.genome['eat_threshold'] for o in eaters),
+                                 dtype=np.float64, count=len(eaters))
+        eligible = np.flatnonzero(universe.energy_grid[ys, xs] >= thresholds)
+        _, first = np.unique(ys[eligible] * universe.width + xs[eligible], return_index=True)
+        for i in eligible[first]:
+            eater = eaters[i]
+            eater.energy += universe.consume_energy(eater.x, eater.y, universe.energy_grid[ys[i], xs[i]])
+
+    # Die of old age
+    for intent in intents:
+        if intent.acted and intent.organism.age > universe.config.MAX_ORGANISM_AGE:
+            intent.organism.energy = 0
+
+    dead_organisms = [intent.organism for intent in intents if intent.organism.is_dead()]
+
+    reproduction = universe.profiler.timer('reproduction')
+    new_organisms = []
+    for intent in intents:
+        with reproduction:
+            offspring = intent.organism.try_reproduce(universe)
+        if offspring:
+            new_organisms.append(offspring)
+
+    living_energy = sum(intent.organism.energy for intent in intents if not intent.organism.is_dead())
+    return dead_organisms, new_organisms, living_energy
+
+
+def _resolve_hunt(universe, predator):
+    """A predator catches the lowest-ID living prey on its cell, if any"""
+    prey = [organism for organism in universe.organisms_at(predator.x, predator.y)
+            if not getattr(organism, 'is_predator', False) and not organism.is_dead()]
+    if not prey:
+        return
+    catch = min(prey, key=lambda organism: organism.id)
+
+    predator.energy += catch.energy * 0.5  # Get 50% of prey's energy
+    catch.energy = 0  # Kill the prey
+
+    # Emit alarm signal
+    if hasattr(universe, 'signals'):
+        from signals import Signal
+        universe.add_signal(Signal(predator.x, predator.y, 'alarm', 2.0))
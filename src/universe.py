@@ -1,38 +1,89 @@
 import numpy as np
-import random
 from config import *
+from rng import RandomStreams
+from simulation_config import default_config
+from spatial_index import SpatialIndex
+from organism_store import OrganismStore
+from population import Population
+from stats_tracker import StatsTracker
+from profiler import TickProfiler
+from lineage import LineageStore
 
 class Universe:
     """The digital world where artificial life exists"""
     
-    def __init__(self):
-        self.width = GRID_WIDTH
-        self.height = GRID_HEIGHT
+    def __init__(self, seed=None, array_mode=None, two_phase=None, config=None):
+        # Settings for this universe and its organisms
+        self.config = default_config if config is None else config
+        
+        self.width = self.config.GRID_WIDTH
+        self.height = self.config.GRID_HEIGHT
         self.tick = 0
         
+        # Named random streams; a seed and config reproduce the run exactly
+        self.rng = RandomStreams(seed)
+        
         # Energy grid - where resources exist
         self.energy_grid = np.zeros((self.height, self.width))
         
         # Initialize with some energy
         self._spawn_initial_energy()
         
-        # Organisms list
-        self.organisms = []
+        # Organisms, indexed by stable ID
+        self._organisms = Population()
+        
+        # Bucketed index of organism positions for neighbourhood queries
+        self.spatial_index = SpatialIndex(self.width, self.height, self.config.SPATIAL_BUCKET_SIZE)
+        
+        # Per-tick directional energy summaries used for neural sensor inputs
+        if self.config.ENERGY_FIELD_SENSING:
+            from energy_fields import DirectionalEnergyFields
+            self.energy_fields = DirectionalEnergyFields(
+                self.width, self.height,
+                self.config.sensing_range,
+                self.config.VISION_CONE_ANGLE if self.config.ENABLE_DIRECTIONAL_SENSING else None
+            )
+        else:
+            self.energy_fields = None
+        
+        # Tile (x0, y0, x1, y1) this universe simulates in a sharded world;
+        # energy, puzzles and predators only spawn inside it
+        self.spawn_region = None
+        
+        # Moves decided ahead of the organism loop by batched inference
+        self.neural_moves = {}
+        
+        # Array mode: hot organism state in contiguous arrays, batched tick
+        self.array_mode = self.config.ARRAY_MODE if array_mode is None else array_mode
+        self.store = OrganismStore() if self.array_mode else None
+        
+        # Genome pool: every genome (brain included) in one float32 table
+        self.genome_pool = None
+        if self.config.GENOME_POOL:
+            from genome_pool import GenomePool
+            self.genome_pool = GenomePool(self.config.MAX_POPULATION)
+        
+        # Two-phase tick: decide against a read-only view, then commit in ID
+        # order; decide batches go through decide_executor.map when it is set
+        self.two_phase = self.config.TWO_PHASE_TICK if two_phase is None else two_phase
+        self.decide_batch_size = self.config.TWO_PHASE_BATCH_SIZE
+        self.decide_executor = None
         
         # Phase 2: Communication signals
-        if ENABLE_COMMUNICATION:
-            self.signals = []
+        if self.config.ENABLE_COMMUNICATION:
+            from signals import SignalField
+            self.signals = SignalField()
         
         # Phase 3: Structures
-        if ENABLE_STRUCTURES:
+        if self.config.ENABLE_STRUCTURES:
             self.structures = []
         
         # Phase 3: Puzzles
-        if ENABLE_PUZZLES:
+        if self.config.ENABLE_PUZZLES:
             self.puzzles = []
         
         # Phase 3: Social hierarchies
-        if ENABLE_HIERARCHY:
+        if self.config.ENABLE_HIERARCHY:
             from social_hierarchy import SocialHierarchy
             self.hierarchies = []
         
@@ -48,23 +99,35 @@ class Universe:
             'structures_built': 0,
             'puzzles_solved': 0
         }
+        
+        # Ancestry records of every organism born here
+        self.lineage = LineageStore() if self.config.TRACK_LINEAGE else None
+        
+        # Per-phase timers and counters (no-ops unless profiling is enabled)
+        self.profiler = TickProfiler()
+        
+        # Running totals for get_stats, plus the periodic deep sampler
+        self.stats_tracker = StatsTracker(self.config.DEEP_STATS_INTERVAL)
+        self.stats_tracker.resync(self)
     
     def _spawn_initial_energy(self):
         """Distribute initial energy across the grid"""
-        for y in range(self.height):
-            for x in range(self.width):
-                if random.random() < INITIAL_ENERGY_DISTRIBUTION:
-                    self.energy_grid[y][x] = ENERGY_AMOUNT
+        mask = self.rng.energy.np.random(self.energy_grid.shape) < self.config.INITIAL_ENERGY_DISTRIBUTION
+        self.energy_grid[mask] = self.config.ENERGY_AMOUNT
     
     def spawn_energy(self):
         """Randomly spawn energy in the universe"""
-        for y in range(self.height):
-            for x in range(self.width):
-                if random.random() < ENERGY_SPAWN_RATE:
-                    self.energy_grid[y][x] = min(
-                        self.energy_grid[y][x] + ENERGY_AMOUNT,
-                        MAX_ENERGY_PER_CELL
-                    )
+        grid = self.energy_grid
+        if self.spawn_region is not None:
+            x0, y0, x1, y1 = self.spawn_region
+            grid = grid[y0:y1, x0:x1]
+        
+        # One mask draw for the whole grid, then a clipped add on the hit cells
+        mask = self.rng.energy.np.random(grid.shape) < self.config.ENERGY_SPAWN_RATE
+        before = grid[mask]
+        after = np.minimum(before + self.config.ENERGY_AMOUNT, self.config.MAX_ENERGY_PER_CELL)
+        grid[mask] = after
+        self.stats_tracker.energy_changed(float(after.sum() - before.sum()))
     
     def get_energy(self, x, y):
         """Get energy at position"""
@@ -72,6 +135,14 @@ class Universe:
             return self.energy_grid[y][x]
         return 0
     
+    def directional_energy(self, x, y, direction=0):
+        """Average energy (N, S, E, W) inside the vision cone seen from (x, y).
+
+        Cells beyond the edge count as empty, as in get_energy, and energy
+        eaten earlier in the tick is already gone (see consume_energy).
+        """
+        return self.energy_fields.lookup(self.energy_grid, x, y, direction)
+    
     def consume_energy(self, x, y, amount):
         """Organism consumes energy from a cell"""
         if 0 <= x < self.width and 0 <= y < self.height:
@@ -79,16 +150,48 @@ class Universe:
             consumed = min(available, amount)
             self.energy_grid[y][x] -= consumed
             self.stats['total_energy_consumed'] += consumed
+            self.stats_tracker.energy_changed(-consumed)
+            if self.energy_fields is not None and consumed:
+                self.energy_fields.consumed(x, y, consumed)
             return consumed
         return 0
     
-    def add_organism(self, organism):
-        """Add organism to universe"""
-        self.organisms.append(organism)
-        self.stats['total_births'] += 1
+    @property
+    def organisms(self):
+        """Living organisms (a Population: iterable, sized and indexable)"""
+        return self._organisms
+    
+    @organisms.setter
+    def organisms(self, organisms):
+        self.set_organisms(organisms)
+    
+    def get_organism(self, organism_id):
+        """Living organism with the given ID, or None"""
+        return self._organisms.get(organism_id)
+    
+    def random_position(self):
+        """Random cell for spawned objects (inside spawn_region, if set)"""
+        x0, y0, x1, y1 = self.spawn_region or (0, 0, self.width, self.height)
+        x = self.rng.spawn.randint(x0, x1 - 1)
+        y = self.rng.spawn.randint(y0, y1 - 1)
+        return x, y
+    
+    def add_organism(self, organism, birth=True):
+        """Add organism to universe (birth=False: it arrived from another shard)"""
+        self._organisms.add(organism)
+        self.spatial_index.insert(organism)
+        if self.store is not None:
+            self.store.attach(organism)
+        if self.genome_pool is not None:
+            self.genome_pool.attach(organism)
+        if birth:
+            self.stats['total_births'] += 1
+            if self.lineage is not None:
+                self.lineage.record(organism, self.tick)
+        self.stats_tracker.organism_added(organism)
         self.stats['peak_population'] = max(
             self.stats['peak_population'],
-            len(self.organisms)
+            len(self._organisms)
         )
         
         # Update predator/prey counts
@@ -97,55 +200,155 @@ class Universe:
         else:
             self.stats['prey_count'] = self.stats.get('prey_count', 0) + 1
     
+    def move_organism(self, organism, dx, dy):
+        """Move an organism (Organism.act moves through here)"""
+        organism.move(dx, dy, self)
+    
+    def hunt(self, predator):
+        """Let a predator try to catch prey on its cell"""
+        return predator.try_hunt(self)
+    
+    def deliver_utterance(self, listener, utterance):
+        """Pass an utterance to a listening organism"""
+        if hasattr(listener, 'language'):
+            listener.language.comprehend(utterance)
+    
     def remove_organism(self, organism):
         """Remove dead organism"""
-        if organism in self.organisms:
-            self.organisms.remove(organism)
+        if organism in self._organisms:
+            self._organisms.remove(organism)
+            self._forget(organism)
+    
+    def remove_organisms(self, organisms, death=True):
+        """Remove a batch of organisms in one sweep over the population.
+        
+        death=False removes them without counting deaths (they are leaving
+        for another shard). Returns the organisms that were removed.
+        """
+        removed = self._organisms.remove_many(organisms)
+        for organism in removed:
+            self._forget(organism, death)
+        return removed
+    
+    def _forget(self, organism, death=True):
+        """Drop a removed organism from the indexes and count its death"""
+        self.spatial_index.remove(organism)
+        if self.store is not None:
+            self.store.detach(organism)
+        if self.genome_pool is not None:
+            self.genome_pool.detach(organism)
+        if death:
             self.stats['total_deaths'] += 1
-            
-            # Update predator/prey counts
-            if hasattr(organism, 'is_predator') and organism.is_predator:
-                self.stats['predator_count'] = max(0, self.stats.get('predator_count', 0) - 1)
-            else:
-                self.stats['prey_count'] = max(0, self.stats.get('prey_count', 0) - 1)
+        self.stats_tracker.organism_removed(organism)
+        
+        # Update predator/prey counts
+        if hasattr(organism, 'is_predator') and organism.is_predator:
+            self.stats['predator_count'] = max(0, self.stats.get('predator_count', 0) - 1)
+        else:
+            self.stats['prey_count'] = max(0, self.stats.get('prey_count', 0) - 1)
+    
+    def set_organisms(self, organisms):
+        """Replace the whole population (e.g. when restoring a save)"""
+        if self.store is not None:
+            self.store.clear()
+        if self.genome_pool is not None:
+            self.genome_pool.clear()
+        self._organisms = Population(organisms)
+        self.spatial_index.rebuild(self._organisms)
+        if self.store is not None:
+            for organism in self._organisms:
+                self.store.attach(organism)
+        if self.genome_pool is not None:
+            for organism in self._organisms:
+                self.genome_pool.attach(organism)
+        
+        # Organisms born from now on must not reuse a restored ID
+        if len(self._organisms):
+            from organism import Organism
+            Organism.reserve_ids(max(self._organisms.ids()))
+    
+    def organisms_near(self, x, y, radius):
+        """Organisms within radius of (x, y) as (organism, dx, dy, distance)"""
+        return self.spatial_index.query_radius(x, y, radius)
+    
+    def organisms_at(self, x, y):
+        """Organisms standing on cell (x, y)"""
+        return self.spatial_index.at(x, y)
     
     def add_signal(self, signal):
         """Add a communication signal"""
-        if ENABLE_COMMUNICATION and len(self.signals) < MAX_SIGNALS:
-            self.signals.append(signal)
+        if self.config.ENABLE_COMMUNICATION and self.signals.add(signal):
             self.stats['signals_emitted'] = self.stats.get('signals_emitted', 0) + 1
     
     def add_structure(self, structure):
         """Add a structure to the universe"""
-        if ENABLE_STRUCTURES and len(self.structures) < MAX_STRUCTURES:
+        if self.config.ENABLE_STRUCTURES and len(self.structures) < self.config.MAX_STRUCTURES:
             self.structures.append(structure)
             self.stats['structures_built'] = self.stats.get('structures_built', 0) + 1
     
     def add_puzzle(self, puzzle):
         """Add a puzzle to the universe"""
-        if ENABLE_PUZZLES and len(self.puzzles) < MAX_PUZZLES:
+        if self.config.ENABLE_PUZZLES and len(self.puzzles) < self.config.MAX_PUZZLES:
             self.puzzles.append(puzzle)
     
     def update(self):
         """Update universe one time step"""
         self.tick += 1
+        timer = self.profiler.timer
         
         # Spawn new energy
-        self.spawn_energy()
+        with timer('spawn_energy'):
+            self.spawn_energy()
         
         # Phase 2: Update signals
-        if ENABLE_COMMUNICATION:
-            expired_signals = []
-            for signal in self.signals:
-                signal.update()
-                if signal.is_expired():
-                    expired_signals.append(signal)
-            
-            for signal in expired_signals:
-                self.signals.remove(signal)
+        with timer('signals'):
+            self.update_signals()
         
         # Phase 3: Update structures
-        if ENABLE_STRUCTURES:
+        with timer('structures'):
+            self.update_structures()
+        
+        # Phase 2/3: Occasional puzzles and predators
+        with timer('spawning'):
+            self.spawn_puzzles_and_predators()
+        
+        # Update all organisms
+        with timer('organisms'):
+            dead_organisms, new_organisms, living_energy = self.update_organisms()
+        
+        # Remove the dead, add offspring
+        with timer('births_and_deaths'):
+            self.apply_births_and_deaths(dead_organisms, new_organisms, living_energy)
+        
+        # Forget the ancestry of branches that died out
+        interval = self.config.LINEAGE_PRUNE_INTERVAL
+        if self.lineage is not None and interval and self.tick % interval == 0:
+            with timer('lineage'):
+                self.lineage.prune(organism.id for organism in self.organisms)
+        
+        if self.stats_tracker.deep_due(self.tick):
+            with timer('deep_stats'):
+                self.stats_tracker.sample_deep(self)
+        
+        self.profiler.count('births', len(new_organisms))
+        self.profiler.count('deaths', len(dead_organisms))
+        self.profiler.tick()
+        
+        # Safety check
+        if len(self.organisms) > self.config.EMERGENCY_STOP_POPULATION:
+            print(f"⚠️ EMERGENCY STOP: Population exceeded {self.config.EMERGENCY_STOP_POPULATION}")
+            return False
+        
+        return True
+    
+    def update_signals(self):
+        """Decay communication signals and drop expired ones"""
+        if self.config.ENABLE_COMMUNICATION:
+            self.signals.update()
+    
+    def update_structures(self):
+        """Age structures and remove destroyed ones"""
+        if self.config.ENABLE_STRUCTURES:
             destroyed_structures = []
             for structure in self.structures:
                 structure.update()
@@ -154,127 +357,196 @@ class Universe:
             
             for structure in destroyed_structures:
                 self.structures.remove(structure)
-        
+    
+    def spawn_puzzles_and_predators(self):
+        """Occasionally add a puzzle or a new predator"""
         # Phase 3: Spawn puzzles occasionally
-        if ENABLE_PUZZLES and random.random() < PUZZLE_SPAWN_CHANCE:
-            if len(self.puzzles) < MAX_PUZZLES:
+        if self.config.ENABLE_PUZZLES and self.rng.spawn.random() < self.config.PUZZLE_SPAWN_CHANCE:
+            if len(self.puzzles) < self.config.MAX_PUZZLES:
                 from problem_solving import Puzzle
-                x = random.randint(0, self.width - 1)
-                y = random.randint(0, self.height - 1)
-                puzzle_type = random.choice(['maze', 'locked_resource', 'multi_step'])
+                x, y = self.random_position()
+                puzzle_type = self.rng.spawn.choice(['maze', 'locked_resource', 'multi_step'])
                 puzzle = Puzzle(x, y, puzzle_type)
                 self.add_puzzle(puzzle)
         
         # Phase 2: Occasionally spawn predators
-        if ENABLE_PREDATORS and random.random() < PREDATOR_SPAWN_CHANCE:
+        if self.config.ENABLE_PREDATORS and self.rng.spawn.random() < self.config.PREDATOR_SPAWN_CHANCE:
             if self.stats.get('predator_count', 0) < len(self.organisms) * 0.1:  # Max 10% predators
                 from predator import Predator
-                x = random.randint(0, self.width - 1)
-                y = random.randint(0, self.height - 1)
-                predator = Predator(x, y)
+                x, y = self.random_position()
+                predator = Predator(x, y, rng=self.rng, config=self.config)
                 self.add_organism(predator)
+    
+    def update_organisms(self):
+        """Run every organism for one tick.
         
-        # Update all organisms
-        dead_organisms = []
-        new_organisms = []
+        Returns (dead organisms, offspring, energy held by the survivors).
+        """
+        if self.energy_fields is not None:
+            self.energy_fields.invalidate()
+        
+        timer = self.profiler.timer
+        self.profiler.count('organisms_updated', len(self.organisms))
+        
+        if self.two_phase:
+            from two_phase import decide_intents, commit_intents
+            with timer('decide'):
+                intents = decide_intents(self, self.organisms, self.decide_batch_size,
+                                         self.decide_executor)
+            with timer('commit'):
+                return commit_intents(self, intents)
+        
+        if self.config.BATCH_NEURAL_INFERENCE and self.config.USE_NEURAL_NETWORKS:
+            with timer('neural_prefetch'):
+                self._prefetch_neural_moves()
         
-        for organism in self.organisms:
-            organism.update(self)
+        if self.store is not None:
+            result = self._update_organisms_batched()
+        else:
+            dead_organisms = []
+            new_organisms = []
+            living_energy = 0.0
             
-            # Check if organism died
-            if organism.is_dead():
-                dead_organisms.append(organism)
+            for organism in self.organisms:
+                organism.update(self)
+                
+                # Check if organism died
+                if organism.is_dead():
+                    dead_organisms.append(organism)
+                
+                # Check if organism reproduced
+                with timer('reproduction'):
+                    offspring = organism.try_reproduce(self)
+                if offspring:
+                    new_organisms.append(offspring)
+                
+                if not organism.is_dead():
+                    living_energy += organism.energy
             
-            # Check if organism reproduced
-            offspring = organism.try_reproduce(self)
-            if offspring:
-                new_organisms.append(offspring)
+            result = dead_organisms, new_organisms, living_energy
         
+        self.neural_moves.clear()
+        return result
+    
+    def apply_births_and_deaths(self, dead_organisms, new_organisms, living_energy):
+        """Remove the dead and add offspring at the end of a tick"""
         # Remove dead organisms
-        for organism in dead_organisms:
-            self.remove_organism(organism)
+        self.remove_organisms(dead_organisms)
+        
+        # Offspring carry their parent's genes until now: with a genome pool
+        # they are mutated in their rows in one pass, before the store and
+        # lineage read them
+        if self.genome_pool is not None and new_organisms:
+            for organism in new_organisms:
+                self.genome_pool.attach(organism)
+            self.genome_pool.mutate(new_organisms, self.config, self.rng.mutation)
         
         # Add new organisms
         for organism in new_organisms:
             self.add_organism(organism)
         
-        # Safety check
-        if len(self.organisms) > EMERGENCY_STOP_POPULATION:
-            print(f"⚠️ EMERGENCY STOP: Population exceeded {EMERGENCY_STOP_POPULATION}")
-            return False
+        # Energy held by organisms, as summed during the sweep
+        self.stats_tracker.organism_energy = living_energy + sum(o.energy for o in new_organisms)
+    
+    def _prefetch_neural_moves(self, organisms=None):
+        """Run every brain once, batched by network topology.
         
-        return True
+        With a genome pool the parameters are gathered straight from it.
+        Inputs are sensed at the start of the organism phase. Organisms that
+        pass their move_probability roll get their decided move stored in
+        neural_moves; the rest get (0, 0). Organism.decide_move picks the
+        stored move up instead of calling its network again.
+        """
+        from neural_network import forward_batch
+        
+        groups = {}
+        for organism in self.organisms if organisms is None else organisms:
+            if 'brain' not in organism.genome:
+                continue
+            if organism.rng.movement.random() > organism.genome['move_probability']:
+                self.neural_moves[organism] = (0, 0)
+                continue
+            groups.setdefault(organism.genome.schema.topology, []).append(organism)
+        
+        for members in groups.values():
+            inputs = [organism._neural_inputs(self) for organism in members]
+            if self.genome_pool is not None:
+                outputs = self.genome_pool.forward(members, inputs)
+            else:
+                outputs = forward_batch([o.genome['brain'] for o in members], inputs)
+            for organism, row in zip(members, outputs):
+                self.neural_moves[organism] = organism._interpret_outputs(row)
     
-    def get_stats(self):
-        """Get current statistics"""
-        stats = {
-            'tick': self.tick,
-            'population': len(self.organisms),
-            'total_births': self.stats['total_births'],
-            'total_deaths': self.stats['total_deaths'],
-            'total_energy_consumed': self.stats['total_energy_consumed'],
-            'total_energy': np.sum(self.energy_grid),
-            'avg_organism_energy': np.mean([o.energy for o in self.organisms]) if self.organisms else 0,
-            'peak_population': self.stats['peak_population']
-        }
+    def _update_organisms_batched(self):
+        """Array-mode organism update.
+        
+        Cost of living, ageing, eating, old-age and starvation deaths and the
+        reproduction-threshold check run as array operations over the store;
+        only sensing, cognition and movement (Organism.act) stay per-organism.
+        Eating happens after everyone has moved; when several organisms share
+        a cell the one in the lowest slot eats first.
+        """
+        store = self.store
+        n = store.count
+        members = list(store.members)
+        
+        # Cost of living and ageing
+        store.age[:n] += 1
+        store.energy[:n] -= store.living_cost[:n]
+        
+        # Sense, think and move
+        acted = np.fromiter((organism.act(self) for organism in members), dtype=bool, count=n)
+        energy = store.energy[:n]
+        age = store.age[:n]
         
-        # Phase 2 stats
-        if ENABLE_PREDATORS:
-            stats['predator_count'] = self.stats.get('predator_count', 0)
-            stats['prey_count'] = self.stats.get('prey_count', 0)
-        
-        if ENABLE_COMMUNICATION:
-            stats['active_signals'] = len(self.signals) if hasattr(self, 'signals') else 0
-            stats['signals_emitted'] = self.stats.get('signals_emitted', 0)
-        
-        # Phase 4 stats - aggregate from organisms
-        if ENABLE_ABSTRACT_REASONING and self.organisms:
-            reasoning_organisms = [o for o in self.organisms if hasattr(o, 'reasoning')]
-            if reasoning_organisms:
-                stats['avg_patterns_recognized'] = np.mean([o.reasoning.get_stats()['patterns_recognized'] 
-                                                           for o in reasoning_organisms])
-                stats['avg_categories'] = np.mean([o.reasoning.get_stats()['categories_formed'] 
-                                                  for o in reasoning_organisms])
-        
-        if ENABLE_LANGUAGE and self.organisms:
-            language_organisms = [o for o in self.organisms if hasattr(o, 'language')]
-            if language_organisms:
-                stats['avg_vocabulary'] = np.mean([o.language.get_vocabulary_size() 
-                                                  for o in language_organisms])
-                stats['total_utterances'] = sum([len(o.language.utterances_produced) 
-                                                for o in language_organisms])
-        
-        if ENABLE_SELF_AWARENESS and self.organisms:
-            aware_organisms = [o for o in self.organisms if hasattr(o, 'self_awareness')]
-            if aware_organisms:
-                stats['self_aware_count'] = sum([1 for o in aware_organisms 
-                                                if o.self_awareness.recognizes_self])
-                stats['avg_reflections'] = np.mean([len(o.self_awareness.reflections) 
-                                                   for o in aware_organisms])
-        
-        if ENABLE_CREATIVITY and self.organisms:
-            creative_organisms = [o for o in self.organisms if hasattr(o, 'creativity')]
-            if creative_organisms:
-                stats['total_innovations'] = sum([o.creativity.innovations_created 
-                                                 for o in creative_organisms])
-                stats['avg_exploration_rate'] = np.mean([o.creativity.exploration_rate 
-                                                        for o in creative_organisms])
-        
-        # Phase 5 stats - AGI emergence
-        if ENABLE_GENERAL_INTELLIGENCE and self.organisms:
-            agi_organisms = [o for o in self.organisms if hasattr(o, 'agi')]
-            if agi_organisms:
-                stats['avg_general_intelligence'] = np.mean([o.agi.calculate_general_intelligence() 
-                                                            for o in agi_organisms])
-                stats['total_problems_solved'] = sum([sum(o.agi.problems_solved.values()) 
-                                                      for o in agi_organisms])
-                stats['avg_consciousness_phi'] = np.mean([o.agi.consciousness.phi 
-                                                         for o in agi_organisms])
-                stats['total_autonomous_goals'] = sum([len(o.agi.goals) 
-                                                      for o in agi_organisms])
-                stats['avg_complexity'] = np.mean([o.agi.measure_complexity() 
-                                                  for o in agi_organisms])
-                stats['novel_behaviors_archived'] = sum([len(o.agi.behavior_archive) 
-                                                        for o in agi_organisms])
-        
-        return stats
+        # Eat: the first eligible organism on a cell takes all of its energy
+        xs = store.x[:n]
+        ys = store.y[:n]
+        available = self.energy_grid[ys, xs]
+        eligible = np.flatnonzero(acted & (available >= store.eat_threshold[:n]))
+        if len(eligible):
+            cells = ys[eligible] * self.width + xs[eligible]
+            _, first = np.unique(cells, return_index=True)
+            eaters = eligible[first]
+            consumed = self.energy_grid[ys[eaters], xs[eaters]]
+            energy[eaters] += consumed
+            self.energy_grid[ys[eaters], xs[eaters]] = 0
+            self.stats['total_energy_consumed'] += float(consumed.sum())
+            self.stats_tracker.energy_changed(-float(consumed.sum()))
+            if self.energy_fields is not None:
+                self.energy_fields.consumed(xs[eaters], ys[eaters], consumed)
+        
+        # Die of old age
+        energy[acted & (age > self.config.MAX_ORGANISM_AGE)] = 0
+        
+        dead = energy <= 0
+        dead_organisms = [members[i] for i in np.flatnonzero(dead)]
+        
+        # Only organisms over their threshold attempt to reproduce
+        new_organisms = []
+        reproduction = self.profiler.timer('reproduction')
+        for i in np.flatnonzero(energy >= store.reproduce_threshold[:n]):
+            with reproduction:
+                offspring = members[i].try_reproduce(self)
+            if offspring:
+                new_organisms.append(offspring)
+        
+        living_energy = float(store.energy[:n][~dead].sum())
+        return dead_organisms, new_organisms, living_energy
+    
+    def get_stats(self, deep=False):
+        """Get current statistics.
+        
+        O(1): the Phase 4/5 cognitive stats (avg_patterns_recognized,
+        avg_vocabulary, avg_general_intelligence, ...) come from the last
+        deep sample, taken every DEEP_STATS_INTERVAL ticks and tagged with
+        'deep_stats_tick'. deep=True samples them now first, as every call
+        used to.
+        """
+        if deep:
+            self.stats_tracker.sample_deep(self)
+        return self.stats_tracker.snapshot(self)
+    
+    def sample_deep_stats(self):
+        """Aggregate cognitive statistics over all organisms right now"""
+        return self.stats_tracker.sample_deep(self)
@@ -0,0 +1,103 @@
+"""
+Vision Cone Tables
+Precomputed visibility lookups shared by all directional sensing code
+"""
+
+import math
+import numpy as np
+from config import VISION_RANGE, VISION_CONE_ANGLE
+
+# Direction vectors for each of 8 directions
+DIRECTION_VECTORS = [
+    (0, -1),   # 0: North
+    (1, -1),   # 1: NE
+    (1, 0),    # 2: East
+    (1, 1),    # 3: SE
+    (0, 1),    # 4: South
+    (-1, 1),   # 5: SW
+    (-1, 0),   # 6: West
+    (-1, -1)   # 7: NW
+]
+
+# Offsets exactly on the cone edge count as visible despite float round-off
+_EDGE_TOLERANCE = 1e-9
+
+
+def cone_contains(direction, dx, dy, cone_angle):
+    """Direct test: is offset (dx, dy) inside the cone facing `direction`?"""
+    if dx == 0 and dy == 0:
+        return True
+
+    facing_dx, facing_dy = DIRECTION_VECTORS[direction]
+
+    # Angle between facing direction and target from the dot product
+    dot_product = dx * facing_dx + dy * facing_dy
+    facing_mag = math.sqrt(facing_dx ** 2 + facing_dy ** 2)
+    target_mag = math.sqrt(dx ** 2 + dy ** 2)
+
+    cos_angle = dot_product / (facing_mag * target_mag)
+    angle_deg = math.degrees(math.acos(max(-1, min(1, cos_angle))))
+
+    return angle_deg <= cone_angle / 2 + _EDGE_TOLERANCE
+
+
+class VisionTable:
+    """Cone visibility for one (vision range, cone angle) pair.
+
+    masks[d] is a (2r+1, 2r+1) boolean array indexed [r + dy, r + dx];
+    offsets[d] lists the visible (dx, dy, distance) in the window,
+    excluding the centre, sorted nearest first.
+    """
+
+    def __init__(self, vision_range, cone_angle):
+        self.vision_range = vision_range
+        self.cone_angle = cone_angle
+
+        r = vision_range
+        self.masks = np.zeros((8, 2 * r + 1, 2 * r + 1), dtype=bool)
+        self.offsets = []
+        for direction in range(8):
+            visible = []
+            for dy in range(-r, r + 1):
+                for dx in range(-r, r + 1):
+                    if cone_contains(direction, dx, dy, cone_angle):
+                        self.masks[direction, dy + r, dx + r] = True
+                        if dx != 0 or dy != 0:
+                            visible.append((dx, dy, math.sqrt(dx * dx + dy * dy)))
+            visible.sort(key=lambda offset: offset[2])
+            self.offsets.append(visible)
+
+        # Nested lists: scalar lookups are much cheaper than on numpy arrays
+        self._rows = self.masks.tolist()
+
+    def in_cone(self, direction, dx, dy):
+        """Is offset (dx, dy) visible when facing `direction`?"""
+        r = self.vision_range
+        if -r <= dx <= r and -r <= dy <= r:
+            return self._rows[direction][dy + r][dx + r]
+        return cone_contains(direction, dx, dy, self.cone_angle)
+
+
+_TABLES = {}
+
+
+def get_table(vision_range=VISION_RANGE, cone_angle=VISION_CONE_ANGLE):
+    """Shared table for a (vision range, cone angle) pair, built on first use"""
+    key = (vision_range, cone_angle)
+    table = _TABLES.get(key)
+    if table is None:
+        table = VisionTable(vision_range, cone_angle)
+        _TABLES[key] = table
+    return table
+
+
+def in_cone(direction, dx, dy, cone_angle=VISION_CONE_ANGLE):
+    """Is offset (dx, dy) visible when facing `direction`?"""
+    return get_table(VISION_RANGE, cone_angle).in_cone(direction, dx, dy)
+
+
+# Build the tables used by organisms, predators and the memory-less fallback
+# at startup (a 360 degree cone is the non-directional window)
+for _range in (VISION_RANGE, 1):
+    for _angle in (VISION_CONE_ANGLE, 360):
+        get_table(_range, _angle)
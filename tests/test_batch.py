@@ -0,0 +1,96 @@
+"""
+Tests for the batch runner
+"""
+
+import sys
+import os
+import csv
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch import expand_runs, run_batch, format_table, parse_setting
+
+SMALL = {'GRID_WIDTH': 30, 'GRID_HEIGHT': 30, 'ENABLE_AUTOSAVE': False, 'PERFORMANCE_MODE': True}
+
+def test_expand_runs():
+    """A grid of overrides expands to every combination, once per seed"""
+    print("Testing sweep expansion...")
+    runs = expand_runs([1, 2], {'MUTATION_RATE': [0.01, 0.05], 'INITIAL_ORGANISMS': [5]}, SMALL)
+    assert len(runs) == 4
+    assert {run['seed'] for run in runs} == {1, 2}
+    assert {run['overrides']['MUTATION_RATE'] for run in runs} == {0.01, 0.05}
+    assert all(run['overrides']['GRID_WIDTH'] == 30 for run in runs)
+    print(f"✓ {len(runs)} runs")
+
+def test_parse_setting():
+    """--set values split on top-level commas, so list values stay whole"""
+    print("\nTesting --set parsing...")
+    assert parse_setting('MUTATION_RATE=0.01,0.05') == ('MUTATION_RATE', [0.01, 0.05])
+    assert parse_setting('PERFORMANCE_MODE=true') == ('PERFORMANCE_MODE', [True])
+    assert parse_setting('NEURAL_HIDDEN_LAYERS=[8,8]') == ('NEURAL_HIDDEN_LAYERS', [[8, 8]])
+    assert parse_setting('NEURAL_HIDDEN_LAYERS=[8,8],[16]') == ('NEURAL_HIDDEN_LAYERS', [[8, 8], [16]])
+    assert parse_setting('NAME="a,b",plain') == ('NAME', ['a,b', 'plain'])
+    print("✓ Lists and quoted strings survive the split")
+
+def test_batch_run():
+    """Runs execute in worker processes with their own config and output"""
+    print("\nTesting batch run...")
+    runs = expand_runs([3], {'INITIAL_ORGANISMS': [4, 12]}, SMALL)
+    streamed = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        rows = run_batch(runs, ticks=20, processes=2, output_dir=output_dir,
+                         log_interval=10, on_stats=lambda index, row: streamed.append((index, row)))
+
+        assert [row['run'] for row in rows] == [0, 1]
+        for row in rows:
+            assert row['ticks'] == 20 or row['stopped'] != 'done'
+            run_dir = os.path.join(output_dir, f"run_{row['run']:03d}")
+            assert os.path.isdir(os.path.join(run_dir, 'saves', 'final_save'))
+            with open(os.path.join(run_dir, 'stats.csv')) as f:
+                assert [int(r['tick']) for r in csv.DictReader(f)] == [10, 20][:row['ticks'] // 10]
+        with open(os.path.join(output_dir, 'summary.csv')) as f:
+            assert len(list(csv.DictReader(f))) == 2
+
+    # Each run saw its own INITIAL_ORGANISMS (births count the initial organisms)
+    assert rows[0]['total_births'] >= 4 and rows[1]['total_births'] >= 12
+    assert rows[0]['total_births'] != rows[1]['total_births']
+    assert sorted(index for index, _ in streamed) == [0, 0, 1, 1]
+    print(format_table(rows))
+    print(f"✓ {len(rows)} runs, {len(streamed)} stats rows streamed")
+
+def test_failed_run():
+    """A run that raises gets an error row; the other runs and summary.csv survive"""
+    print("\nTesting a failing run...")
+    runs = [{'seed': 5, 'overrides': dict(SMALL, INITIAL_ORGANISMS=4)},
+            {'seed': 6, 'overrides': dict(SMALL, NOT_A_SETTING=1)}]
+    with tempfile.TemporaryDirectory() as output_dir:
+        rows = run_batch(runs, ticks=10, processes=1, output_dir=output_dir,
+                         log_interval=10, on_stats=lambda index, row: None)
+        assert rows[0]['stopped'] in ('done', 'extinct', 'safety limit')
+        assert rows[1]['stopped'].startswith('error: ValueError')
+        assert rows[1]['seed'] == 6 and rows[1]['ticks'] == 0
+        assert os.path.exists(os.path.join(output_dir, 'run_001', 'error.log'))
+        with open(os.path.join(output_dir, 'summary.csv')) as f:
+            summary = list(csv.DictReader(f))
+    assert [row['stopped'][:6] for row in summary] == [rows[0]['stopped'][:6], 'error:']
+    print(format_table(rows))
+    print("✓ Failure recorded, summary still written")
+
+def main():
+    print("=" * 60)
+    print("BATCH RUNNER TEST SUITE")
+    print("=" * 60)
+
+    test_expand_runs()
+    test_parse_setting()
+    test_batch_run()
+    test_failed_run()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
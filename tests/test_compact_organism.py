@@ -0,0 +1,112 @@
+"""
+Tests for the compact organism representation (slots, lazy state, ring buffer memory)
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism, COGNITIVE_ATTRIBUTES
+from predator import Predator
+from universe import Universe
+from ring_buffer import RingBuffer
+from rng import RandomStreams
+from simulation_config import SimulationConfig
+from persistence import SimulationSaver
+from snapshot import Snapshot
+from config import *
+
+def test_no_instance_dict():
+    """Organisms and predators are slotted"""
+    rng = RandomStreams(1)
+    for organism in (Organism(1, 2, rng=rng), Predator(3, 4, rng=rng)):
+        assert not hasattr(organism, '__dict__')
+    print("✓ Organisms and predators carry no __dict__")
+
+def test_lazy_state():
+    """Feature state appears on first use, and only while the feature is on"""
+    config = SimulationConfig(ENABLE_MEMORY=True, ENABLE_LANGUAGE=True, ENABLE_CREATIVITY=False)
+    organism = Organism(0, 0, rng=RandomStreams(1), config=config)
+    assert 'memory' not in organism.attributes() and 'language' not in organism.attributes()
+
+    assert hasattr(organism, 'language')
+    assert organism.language is organism.language  # Created once
+    assert 'language' in organism.attributes()
+    assert not hasattr(organism, 'creativity')
+
+    organism._reset_cognition()
+    assert not any(name in organism.attributes() for name in COGNITIVE_ATTRIBUTES)
+
+    off = Organism(0, 0, rng=RandomStreams(1), config=SimulationConfig(ENABLE_MEMORY=False))
+    assert not hasattr(off, 'memory')
+    print("✓ Subsystems created lazily, only for enabled features")
+
+def test_ring_buffer_memory():
+    """Memory keeps the most recent MEMORY_SIZE locations"""
+    memory = RingBuffer(3, 3)
+    assert not memory and list(memory) == []
+    for i in range(5):
+        memory.append((i, i, 10 * i))
+    assert len(memory) == 3
+    assert list(memory) == [(2.0, 2.0, 20.0), (3.0, 3.0, 30.0), (4.0, 4.0, 40.0)]
+    assert memory[0] == (2.0, 2.0, 20.0) and memory[-1] == (4.0, 4.0, 40.0)
+    assert memory.best(2) == (4.0, 4.0, 40.0)
+
+    restored = RingBuffer.from_rows([(1, 1, 5), (2, 2, 9), (3, 3, 9)], 2, 3)
+    assert list(restored) == [(2.0, 2.0, 9.0), (3.0, 3.0, 9.0)]
+    assert restored.best(2) == (2.0, 2.0, 9.0)  # Oldest of the best, like max() on a list
+    print("✓ Ring buffer drops the oldest row and finds the best one")
+
+def test_pickle_round_trip():
+    """Pickled organisms keep their set attributes, and old list memories convert"""
+    config = SimulationConfig(ENABLE_MEMORY=True)
+    organism = Organism(5, 6, rng=RandomStreams(1), config=config)
+    organism.memory.append((5, 6, 80))
+    copy = pickle.loads(pickle.dumps(organism))
+    assert (copy.x, copy.y, copy.id) == (5, 6, organism.id)
+    assert list(copy.memory) == [(5.0, 6.0, 80.0)]
+
+    legacy = Organism.__new__(Organism)
+    legacy.__setstate__({'config': config, 'id': 7, 'memory': [(1, 2, 60)],
+                         'visited_recently': {(1, 2)}, 'parent': None})
+    assert isinstance(legacy.memory, RingBuffer) and legacy.parent_id is None
+    assert not hasattr(legacy, 'visited_recently')
+    print("✓ Pickles round-trip; old saves' memory lists become ring buffers")
+
+def test_universe_runs():
+    """Snapshots and the organism store work with slotted organisms"""
+    universe = Universe(seed=4, config=SimulationConfig(ARRAY_MODE=True))
+    for _ in range(40):
+        x, y = universe.random_position()
+        universe.add_organism(Organism(x, y, rng=universe.rng, config=universe.config))
+    for _ in range(5):
+        universe.update()
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        SimulationSaver(save_dir).save(universe, "compact")
+        restored = Snapshot(os.path.join(save_dir, "compact")).restore(Universe(seed=4, config=universe.config))
+    assert [o.id for o in restored.organisms] == [o.id for o in universe.organisms]
+    assert [o.energy for o in restored.organisms] == [o.energy for o in universe.organisms]
+    print(f"✓ {len(universe.organisms)} slotted organisms stored, snapshotted and restored")
+
+def main():
+    print("=" * 60)
+    print("COMPACT ORGANISM TEST SUITE")
+    print("=" * 60)
+
+    test_no_instance_dict()
+    test_lazy_state()
+    test_ring_buffer_memory()
+    test_pickle_round_trip()
+    test_universe_runs()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Tests for flat genomes
+"""
+
+import sys
+import os
+import copy
+import pickle
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from genome import Genome, GenomeSchema
+from rng import RandomStreams
+from simulation_config import SimulationConfig
+from config import *
+
+def test_dict_interface():
+    """Genomes read and write like the dict genomes they replace"""
+    organism = Organism(5, 5, rng=RandomStreams(1))
+    genome = organism.genome
+
+    assert isinstance(genome, Genome)
+    assert list(genome)[:6] == ['move_probability', 'move_randomness', 'eat_threshold',
+                                'reproduce_threshold', 'generation', 'color']
+    assert genome.vector.dtype == np.float32 and genome.vector.size == genome.schema.size
+    assert isinstance(genome['generation'], int)
+    assert all(isinstance(channel, int) for channel in genome['color'])
+
+    genome['color'] = (60, 70, 80)
+    genome['move_probability'] = 0.25
+    genome['favourite_food'] = 'light'  # Not part of the layout
+    assert genome['color'] == (60, 70, 80)
+    assert genome['move_probability'] == 0.25
+    assert genome['favourite_food'] == 'light'
+    assert 'favourite_food' in genome and len(genome) == len(genome.schema.keys) + 1
+
+    # The brain is a view into the vector
+    brain = genome['brain']
+    assert genome['brain'] is brain
+    brain.weights[0][0, 0] = 3.0
+    start = genome.schema.fields['brain'][1]
+    assert genome.vector[start] == 3.0
+
+    # Copies (including deep copies and pickles) share nothing
+    for duplicate in (genome.copy(), copy.deepcopy(genome), pickle.loads(pickle.dumps(genome))):
+        assert duplicate == {**genome, 'brain': duplicate['brain']}
+        assert duplicate.schema is genome.schema
+        duplicate['move_probability'] = 0.75
+        assert genome['move_probability'] == 0.25
+
+    assert Genome.from_dict(dict(genome)).vector.tobytes() == genome.vector.tobytes()
+    print("✓ Genomes behave like dicts over one float32 vector")
+
+def test_mutation():
+    """Mutation changes the vector in place of a copy and keeps genes in bounds"""
+    config = SimulationConfig(MUTATION_RATE=1.0, NEURAL_MUTATION_RATE=0.5)
+    parent = Organism(5, 5, rng=RandomStreams(2), config=config)
+    parent.genome['move_probability'] = 0.99
+    parent.genome['eat_threshold'] = 0.5
+    original = parent.genome.vector.copy()
+
+    genes_changed = brains_changed = 0
+    for _ in range(200):
+        child = parent.mutate_genome()
+        assert child.schema is parent.genome.schema
+        assert np.array_equal(parent.genome.vector, original)
+        assert 0 <= child['move_probability'] <= 1
+        assert child['eat_threshold'] >= 0
+        assert child['reproduce_threshold'] >= config.MIN_ENERGY_TO_REPLICATE
+        assert all(50 <= channel <= 255 for channel in child['color'])
+        start, stop = child.schema.fields['brain'][1:]
+        genes = np.r_[0:start, stop:child.schema.size]
+        brains_changed += not np.array_equal(child.vector[start:stop], original[start:stop])
+        genes_changed += not np.array_equal(child.vector[genes], original[genes])
+    assert genes_changed > 100 and brains_changed > 100
+
+    # Without neural networks the brain is inherited unchanged
+    frozen = config.replace(USE_NEURAL_NETWORKS=False)
+    parent.config = frozen
+    start, stop = parent.genome.schema.fields['brain'][1:]
+    assert all(np.array_equal(parent.mutate_genome().vector[start:stop], original[start:stop])
+               for _ in range(20))
+    print(f"✓ {genes_changed}/200 gene and {brains_changed}/200 brain mutations, all in bounds")
+
+def test_cognitive_genes_fixed():
+    """Cognitive genes can be picked by a mutation but never change"""
+    config = SimulationConfig(MUTATION_RATE=1.0, USE_NEURAL_NETWORKS=False)
+    parent = Organism(5, 5, rng=RandomStreams(4), config=config)
+    cognitive = ['pattern_recognition', 'causal_reasoning', 'language_ability', 'innovation_tendency',
+                 'curiosity', 'exploration_tendency', 'self_reflection', 'theory_of_mind']
+    cognitive = [gene for gene in cognitive if gene in config.mutable_genes and gene in parent.genome]
+    assert cognitive
+    for _ in range(200):
+        child = parent.mutate_genome()
+        assert all(child[gene] == parent.genome[gene] for gene in cognitive)
+    print(f"✓ {len(cognitive)} cognitive genes stay fixed through mutation")
+
+def test_offspring():
+    """Offspring own their genome and count generations"""
+    parent = Organism(5, 5, rng=RandomStreams(3))
+    child = Organism(6, 5, parent.mutate_genome(), parent=parent)
+    assert child.genome is not parent.genome
+    assert child.genome['brain'] is not parent.genome['brain']
+    assert child.generation == 1
+
+    # Old dict genomes are converted on the way in
+    adopted = Organism(7, 5, dict(parent.genome), parent=parent)
+    assert isinstance(adopted.genome, Genome)
+    assert np.array_equal(adopted.genome.vector, parent.genome.vector)
+    assert GenomeSchema.get(parent.genome.schema.keys, parent.genome.schema.topology) is parent.genome.schema
+    print("✓ Offspring get their own copy of the genome")
+
+def main():
+    print("=" * 60)
+    print("GENOME TEST SUITE")
+    print("=" * 60)
+
+    test_dict_interface()
+    test_mutation()
+    test_cognitive_genes_fixed()
+    test_offspring()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
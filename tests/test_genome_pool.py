@@ -0,0 +1,143 @@
+"""
+Tests for the genome pool
+"""
+
+import sys
+import os
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from genome_pool import GenomePool
+from lineage import genome_hash
+from neural_network import forward_batch
+from rng import RandomStreams
+from simulation_config import SimulationConfig
+from config import *
+
+def make_organisms(count, seed=1):
+    rng = RandomStreams(seed)
+    return [Organism(i % 50, i // 50, rng=rng) for i in range(count)]
+
+def test_rows_follow_organisms():
+    """Genomes move into rows on attach, out on detach; rows are reused and tables grow"""
+    pool = GenomePool(capacity=4)
+    organisms = make_organisms(10)
+    before = [organism.genome.vector.copy() for organism in organisms]
+    for organism in organisms:
+        pool.attach(organism)
+
+    table = pool.tables[organisms[0].genome.schema]
+    assert len(pool) == 10 and len(table.rows) == 16  # Grew 4 -> 8 -> 16
+    for organism, vector in zip(organisms, before):
+        assert np.shares_memory(organism.genome.vector, table.rows)
+        assert np.array_equal(organism.genome.vector, vector)
+        # The brain is a view into the row
+        assert np.shares_memory(organism.genome['brain'].weights[0], table.rows)
+
+    # Detached genomes keep their genes in a vector of their own
+    gone = organisms[3]
+    pool.detach(gone)
+    assert not np.shares_memory(gone.genome.vector, table.rows)
+    assert np.array_equal(gone.genome.vector, before[3])
+    newcomer = make_organisms(1, seed=2)[0]
+    pool.attach(newcomer)
+    assert pool.slots[newcomer.id][1] == 3  # Freed row reused
+    pool.clear()
+    assert len(pool) == 0 and np.array_equal(organisms[5].genome.vector, before[5])
+    print("✓ Rows allocated on attach, freed on detach, reused and grown")
+
+def test_batched_inference():
+    """Brains gathered from the pool give the same outputs as the networks"""
+    pool = GenomePool(capacity=64)
+    organisms = make_organisms(40)
+    for organism in organisms[:30]:  # Some pooled, some not
+        pool.attach(organism)
+    inputs = np.random.random((40, 10))
+
+    expected = forward_batch([organism.genome['brain'] for organism in organisms], inputs)
+    assert np.allclose(pool.forward(organisms, inputs), expected, atol=1e-5)
+    print("✓ Batched inference from the pool matches the per-network pass")
+
+def test_batched_mutation():
+    """Mutating the pool in place changes genomes and keeps genes in bounds"""
+    config = SimulationConfig(MUTATION_RATE=1.0, NEURAL_MUTATION_RATE=0.5)
+    pool = GenomePool()
+    organisms = make_organisms(200)
+    for organism in organisms:
+        pool.attach(organism)
+    table = pool.tables[organisms[0].genome.schema]
+    before = table.rows[:200].copy()
+
+    pool.mutate(organisms, config, RandomStreams(3).mutation)
+    changed = (table.rows[:200] != before).any(axis=1)
+    assert changed.sum() > 150  # A picked cognitive gene changes nothing
+    schema = organisms[0].genome.schema
+    for gene in ('pattern_recognition', 'curiosity', 'theory_of_mind'):
+        if gene in schema.fields:
+            slot = schema.fields[gene][1]
+            assert np.array_equal(table.rows[:200, slot], before[:, slot])
+    for organism in organisms:
+        genome = organism.genome
+        assert 0 <= genome['move_probability'] <= 1
+        assert genome['reproduce_threshold'] >= config.MIN_ENERGY_TO_REPLICATE
+        assert all(50 <= channel <= 255 for channel in genome['color'])
+    print("✓ 200 pooled genomes mutated in one pass, all in bounds")
+
+def test_pooled_run():
+    """A universe with a genome pool keeps exactly the living genomes pooled"""
+    universe = Universe(seed=5, config=SimulationConfig(GENOME_POOL=True, BATCH_NEURAL_INFERENCE=True))
+    for _ in range(100):
+        x, y = universe.random_position()
+        universe.add_organism(Organism(x, y, rng=universe.rng, config=universe.config))
+    for _ in range(20):
+        universe.update()
+
+    pool = universe.genome_pool
+    living = universe.organisms
+    assert len(pool) == len(living)
+    assert all(np.shares_memory(organism.genome.vector, pool.slots[organism.id][0].rows)
+               for organism in living)
+    print(f"✓ {len(living)} living genomes pooled ({pool.nbytes} bytes of tables) after 20 ticks")
+
+def test_offspring_mutated_in_pool():
+    """Offspring are mutated in their pool rows before the store and lineage read them"""
+    config = SimulationConfig(GENOME_POOL=True, ARRAY_MODE=True, TRACK_LINEAGE=True, MUTATION_RATE=1.0)
+    universe = Universe(seed=6, config=config)
+    for _ in range(100):
+        x, y = universe.random_position()
+        universe.add_organism(Organism(x, y, rng=universe.rng, config=universe.config))
+    parents = {organism.id: organism.genome.copy() for organism in universe.organisms}
+    universe.update()
+
+    children = [organism for organism in universe.organisms if organism.parent_id in parents]
+    assert children
+    changed = sum(not np.array_equal(child.genome.vector, parents[child.parent_id].vector)
+                  for child in children)
+    assert changed > len(children) // 2  # A picked cognitive gene changes nothing
+    for child in children:
+        for gene in ('eat_threshold', 'reproduce_threshold'):
+            assert np.isclose(universe.store.columns[gene][child._slot], child.genome[gene])
+        assert universe.lineage.get(child.id)['genome_hash'] == genome_hash(child.genome)
+    print(f"✓ {changed}/{len(children)} offspring mutated in the pool; store and lineage agree")
+
+def main():
+    print("=" * 60)
+    print("GENOME POOL TEST SUITE")
+    print("=" * 60)
+
+    test_rows_follow_organisms()
+    test_batched_inference()
+    test_batched_mutation()
+    test_pooled_run()
+    test_offspring_mutated_in_pool()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
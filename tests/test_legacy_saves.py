@@ -0,0 +1,80 @@
+"""
+Tests for loading legacy .pkl saves
+
+data/baseline_save.pkl was written by the original single-file saver,
+before organisms had IDs, before signal.py became signals.py and while
+organisms still held their parent objects.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from persistence import SimulationSaver, restore_universe
+from simulation_config import SimulationConfig
+from config import *
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+BASELINE_CONFIG = SimulationConfig(GRID_WIDTH=30, GRID_HEIGHT=30)  # The save's world size
+
+def load_baseline():
+    """Load the baseline save from a scratch save directory"""
+    with tempfile.TemporaryDirectory() as save_dir:
+        shutil.copy(os.path.join(DATA_DIR, 'baseline_save.pkl'), save_dir)
+        return SimulationSaver(save_dir).load('baseline_save.pkl')
+
+def test_organisms_get_ids():
+    """Organisms pickled before IDs existed get fresh, unique ones"""
+    save_data = load_baseline()
+    organisms = save_data['organisms']
+    ids = [organism.id for organism in organisms]
+    assert len(set(ids)) == len(ids)
+
+    universe = restore_universe(save_data, Universe(seed=1, config=BASELINE_CONFIG))
+    assert len(universe.organisms) == len(organisms)
+    assert Organism(0, 0).id > max(ids)  # Reserved after the restore
+    print(f"✓ {len(ids)} legacy organisms got unique IDs")
+
+def test_restore_and_run():
+    """A restored legacy world keeps its ancestry and signals, runs, and saves as a snapshot"""
+    save_data = load_baseline()
+    universe = restore_universe(save_data, Universe(seed=1, config=BASELINE_CONFIG))
+    assert universe.tick == save_data['tick'] and len(universe.signals) > 0
+
+    # Children point at their parents' (freshly assigned) IDs
+    children = [organism for organism in universe.organisms if organism.parent_id is not None]
+    assert children and all(child.parent_id != child.id for child in children)
+    if universe.lineage is not None:
+        assert all(universe.lineage.parent_of(child.id) == child.parent_id for child in children)
+
+    for _ in range(10):
+        universe.update()
+    assert universe.organisms
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        saver.save(universe, "converted")
+        restored = restore_universe(saver.load("converted"), Universe(seed=1, config=BASELINE_CONFIG))
+    assert sorted(o.id for o in restored.organisms) == sorted(o.id for o in universe.organisms)
+    print(f"✓ Legacy world restored ({len(children)} children linked), ran 10 ticks and re-saved")
+
+def main():
+    print("=" * 60)
+    print("LEGACY SAVE TEST SUITE")
+    print("=" * 60)
+
+    test_organisms_get_ids()
+    test_restore_and_run()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
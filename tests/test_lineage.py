@@ -0,0 +1,113 @@
+"""
+Tests for the lineage store
+"""
+
+import sys
+import os
+import gc
+import tempfile
+import weakref
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from lineage import LineageStore
+from persistence import SimulationSaver, restore_universe
+from config import *
+
+class Record:
+    """Minimal organism stand-in for building lineage trees"""
+    def __init__(self, id, parent_id):
+        self.id = id
+        self.parent_id = parent_id
+        self.genome = {'color': (id, id, id)}
+
+def test_records_and_pruning():
+    """Ancestors are found by ID; pruning keeps only living branches"""
+    print("Testing records and pruning...")
+    #        1           2
+    #      /   \         |
+    #     3     4        5
+    #     |     |
+    #     6     7
+    lineage = LineageStore(capacity=2)
+    for id, parent_id in [(1, None), (2, None), (3, 1), (4, 1), (5, 2), (6, 3), (7, 4)]:
+        lineage.record(Record(id, parent_id), tick=id)
+    assert len(lineage) == 7
+    assert lineage.ancestors(6) == [3, 1]
+    assert lineage.get(5)['birth_tick'] == 5 and lineage.get(99) is None
+    assert lineage.get(6)['genome_hash'] != lineage.get(7)['genome_hash']
+
+    # Only 6 is alive: the branches through 4 and 2 died out
+    assert lineage.prune([6]) == 4
+    assert list(lineage.id) == [1, 3, 6]
+    assert lineage.ancestors(6) == [3, 1]
+    print(f"✓ {lineage.pruned} extinct records pruned")
+
+def test_dead_parents_are_collected():
+    """Offspring keep only their parent's ID, not the parent"""
+    print("\nTesting parent references...")
+    universe = Universe(seed=3)
+    parent = Organism(4, 4, rng=universe.rng)
+    universe.add_organism(parent)
+    child = Organism(5, 4, parent.genome, parent=parent)
+    universe.add_organism(child)
+
+    assert child.parent_id == parent.id and not hasattr(child, 'parent')
+    assert universe.lineage.parent_of(child.id) == parent.id
+
+    ref = weakref.ref(parent)
+    universe.remove_organism(parent)
+    del parent
+    gc.collect()
+    assert ref() is None
+    print("✓ Dead parent garbage-collected")
+
+def test_lineage_in_runs_and_saves():
+    """Every birth is recorded, pruning bounds the store, saves keep it"""
+    print("\nTesting lineage over a run...")
+    universe = Universe(seed=6)
+    for _ in range(30):
+        x = universe.rng.spawn.randint(0, universe.width - 1)
+        y = universe.rng.spawn.randint(0, universe.height - 1)
+        universe.add_organism(Organism(x, y, rng=universe.rng))
+    for _ in range(20):
+        universe.update()
+
+    lineage = universe.lineage
+    assert len(lineage) == universe.stats['total_births']
+    for organism in universe.organisms:
+        assert lineage.parent_of(organism.id) == organism.parent_id
+
+    living = [o.id for o in universe.organisms]
+    before = len(lineage)
+    lineage.prune(living)
+    assert len(lineage) <= before
+    assert (lineage.rows(living) >= 0).all()
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        saver.save(universe, "lineage")
+        restored = restore_universe(saver.load("lineage"), Universe())
+    assert np.array_equal(restored.lineage.id, lineage.id)
+    assert np.array_equal(restored.lineage.genome_hash, lineage.genome_hash)
+    print(f"✓ {before} births recorded, {len(lineage)} kept, {lineage.nbytes} bytes")
+
+def main():
+    print("=" * 60)
+    print("LINEAGE TEST SUITE")
+    print("=" * 60)
+
+    test_records_and_pruning()
+    test_dead_parents_are_collected()
+    test_lineage_in_runs_and_saves()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Tests for the organism neural network
+"""
+
+import sys
+import os
+import pickle
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from neural_network import NeuralNetwork, forward_batch
+from organism import Organism
+from universe import Universe
+from config import *
+
+def test_forward_batch_matches_forward():
+    """Batched inference should give the same outputs as one-by-one calls"""
+    print("Testing batched forward pass...")
+    networks = [NeuralNetwork(10, NEURAL_HIDDEN_LAYERS, 6) for _ in range(50)]
+    inputs = np.random.random((50, 10))
+
+    expected = np.array([net.forward(row) for net, row in zip(networks, inputs)])
+    batched = forward_batch(networks, inputs)
+
+    assert batched.shape == (50, 6)
+    assert np.allclose(batched, expected)
+    print("✓ Batched outputs match per-network outputs")
+
+def test_flat_parameters():
+    """Weights are views into one buffer; copies and pickles copy that buffer"""
+    print("\nTesting flat parameter buffer...")
+    net = NeuralNetwork(10, NEURAL_HIDDEN_LAYERS, 6)
+    net.weights[0][0, 0] = 2.0
+    assert net.params[0] == 2.0
+    assert all(np.shares_memory(w, net.params) for w in net.weights + net.biases)
+
+    copy = net.copy()
+    assert not np.shares_memory(copy.params, net.params)
+    assert np.array_equal(copy.params, net.params)
+    copy.weights[-1] += 1
+    assert not np.array_equal(copy.params, net.params)
+
+    restored = pickle.loads(pickle.dumps(net))
+    assert np.shares_memory(restored.weights[0], restored.params)
+    assert np.array_equal(restored.params, net.params)
+
+    # Pickles from before the flat buffer held per-layer arrays
+    old = NeuralNetwork.__new__(NeuralNetwork)
+    old.__setstate__({'input_size': 10, 'hidden_sizes': NEURAL_HIDDEN_LAYERS, 'output_size': 6,
+                      'weights': [w.copy() for w in net.weights], 'biases': [b.copy() for b in net.biases]})
+    assert np.array_equal(old.params, net.params)
+
+    empty = NeuralNetwork.empty(10, NEURAL_HIDDEN_LAYERS, 6, dtype=np.float32)
+    empty.params[:] = net.params
+    inputs = np.random.random(10)
+    out = np.zeros(6, dtype=np.float32)
+    assert empty.forward(inputs, out=out) is out
+    assert np.allclose(out, net.forward(inputs), atol=1e-5)
+    print("✓ Copies, pickles and empty networks keep weights as views of one buffer")
+
+def test_prefetched_moves_are_used():
+    """decide_move should return the move prepared by batched inference"""
+    print("\nTesting prefetched neural moves...")
+    if not USE_NEURAL_NETWORKS:
+        print("  Skipped (neural networks disabled)")
+        return
+
+    universe = Universe()
+    org = Organism(50, 50)
+    universe.add_organism(org)
+
+    universe._prefetch_neural_moves()
+    assert org in universe.neural_moves
+    move = universe.neural_moves[org]
+
+    assert org.decide_move(universe) == move
+    assert org not in universe.neural_moves
+    print(f"✓ Prefetched move {move} consumed by decide_move")
+
+def main():
+    print("=" * 60)
+    print("NEURAL NETWORK TEST SUITE")
+    print("=" * 60)
+
+    test_forward_batch_matches_forward()
+    test_flat_parameters()
+    test_prefetched_moves_are_used()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
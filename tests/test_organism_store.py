@@ -0,0 +1,106 @@
+"""
+Tests for array mode (structure-of-arrays organism store)
+"""
+
+import sys
+import os
+import pickle
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from config import *
+
+def test_attached_organism_is_a_view():
+    """Reads and writes on an attached organism go to the store arrays"""
+    print("Testing organism views over the store...")
+    universe = Universe(array_mode=True)
+    org = Organism(10, 20)
+    universe.add_organism(org)
+
+    slot = org._slot
+    assert universe.store.x[slot] == 10 and universe.store.y[slot] == 20
+
+    org.energy = 123.5
+    assert universe.store.energy[slot] == 123.5
+
+    universe.store.age[slot] = 42
+    assert org.age == 42 and isinstance(org.age, int)
+
+    # Moving updates both the arrays and the spatial index
+    org.move(1, 0, universe)
+    assert universe.store.x[slot] == 11
+    assert universe.organisms_at(11, 20) == [org]
+    print("✓ Organism API reads and writes the arrays")
+
+def test_removal_keeps_slots_dense():
+    """Removing an organism swaps the last slot into the hole"""
+    print("\nTesting swap-remove...")
+    universe = Universe(array_mode=True)
+    organisms = [Organism(i, i) for i in range(5)]
+    for org in organisms:
+        universe.add_organism(org)
+
+    removed = organisms[1]
+    removed.energy = 77
+    universe.remove_organism(removed)
+
+    assert universe.store.count == 4
+    for org in universe.organisms:
+        assert universe.store.members[org._slot] is org
+        assert universe.store.x[org._slot] == org.x
+
+    # The removed organism keeps its state as a plain object
+    assert type(removed) is Organism
+    assert removed.energy == 77 and removed.x == 1
+    print("✓ Slots stay dense and detached organisms keep their state")
+
+def test_attached_organism_pickles_as_plain():
+    """Pickled views come back as ordinary organisms"""
+    print("\nTesting pickling of attached organisms...")
+    universe = Universe(array_mode=True)
+    org = Organism(3, 4)
+    universe.add_organism(org)
+    org.energy = 55
+
+    copy = pickle.loads(pickle.dumps(org))
+    assert type(copy) is Organism
+    assert (copy.x, copy.y, copy.energy) == (3, 4, 55)
+    print("✓ Attached organisms pickle as plain organisms")
+
+def test_batched_tick_runs():
+    """A few array-mode ticks keep the store and population in sync"""
+    print("\nTesting batched ticks...")
+    random.seed(3)
+    universe = Universe(seed=3, array_mode=True)
+    for _ in range(10):
+        universe.add_organism(Organism(random.randint(0, GRID_WIDTH - 1),
+                                       random.randint(0, GRID_HEIGHT - 1)))
+
+    for _ in range(15):
+        universe.update()
+
+    assert universe.store.count == len(universe.organisms)
+    assert set(universe.store.members) == set(universe.organisms)
+    assert all(org.energy > 0 for org in universe.organisms)
+    print(f"✓ {len(universe.organisms)} organisms after 15 batched ticks")
+
+def main():
+    print("=" * 60)
+    print("ORGANISM STORE TEST SUITE")
+    print("=" * 60)
+
+    test_attached_organism_is_a_view()
+    test_removal_keeps_slots_dense()
+    test_attached_organism_pickles_as_plain()
+    test_batched_tick_runs()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Tests for the ID-indexed population container
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from population import Population
+from universe import Universe
+from config import *
+
+def test_ids_are_unique():
+    """Every organism gets its own stable ID"""
+    print("Testing organism IDs...")
+    orgs = [Organism(i, i) for i in range(100)]
+    ids = [org.id for org in orgs]
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    print(f"✓ {len(ids)} unique, increasing IDs")
+
+def test_swap_remove():
+    """remove() is O(1) and keeps lookups by ID consistent"""
+    print("\nTesting swap-remove...")
+    orgs = [Organism(i, i) for i in range(10)]
+    population = Population(orgs)
+
+    population.remove(orgs[2])
+    population.remove(orgs[9])
+    assert len(population) == 8
+    assert orgs[2] not in population and orgs[9] not in population
+    for org in orgs:
+        if org not in (orgs[2], orgs[9]):
+            assert population.get(org.id) is org
+    assert population.get(orgs[2].id) is None
+    print("✓ Removed organisms gone, survivors still found by ID")
+
+def test_remove_many_keeps_order():
+    """remove_many() drops a batch in one sweep and keeps survivor order"""
+    print("\nTesting batch removal...")
+    orgs = [Organism(i, i) for i in range(10)]
+    population = Population(orgs)
+
+    removed = population.remove_many([orgs[1], orgs[5], orgs[5], Organism(0, 0)])
+    assert len(removed) == 2
+    assert list(population) == [o for i, o in enumerate(orgs) if i not in (1, 5)]
+    assert all(population.get(o.id) is o for o in population)
+    print("✓ Duplicates and strangers ignored, order preserved")
+
+def test_universe_lookup_and_restore():
+    """Universe removal updates the index; restored IDs are never reused"""
+    print("\nTesting universe integration...")
+    universe = Universe()
+    orgs = [Organism(10, 10) for _ in range(5)]
+    for org in orgs:
+        universe.add_organism(org)
+
+    universe.remove_organisms(orgs[:2])
+    assert universe.get_organism(orgs[0].id) is None
+    assert universe.get_organism(orgs[3].id) is orgs[3]
+    assert len(universe.organisms_at(10, 10)) == 3
+    assert universe.stats['total_deaths'] == 2
+
+    # Simulate loading a save from a run that got further along
+    orgs[4].id = Organism._next_id + 1000
+    universe.organisms = list(universe.organisms)
+    assert Organism(0, 0).id > orgs[4].id
+    print("✓ Lookups, index and ID reservation consistent")
+
+def main():
+    print("=" * 60)
+    print("POPULATION TEST SUITE")
+    print("=" * 60)
+
+    test_ids_are_unique()
+    test_swap_remove()
+    test_remove_many_keeps_order()
+    test_universe_lookup_and_restore()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
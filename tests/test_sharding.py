@@ -0,0 +1,133 @@
+"""
+Tests for sharded worlds: tile layout, halo exchange and migration
+"""
+
+import sys
+import os
+import numpy as np
+from multiprocessing import shared_memory
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from sharding import ShardedUniverse, TileLayout, _Shard, _pack, _unpack
+from simulation_config import SimulationConfig
+from config import *
+
+def test_tile_layout():
+    """Tiles cover the grid exactly once and halos wrap around the edges"""
+    print("Testing tile layout...")
+    layout = TileLayout.for_workers(100, 50, 8)
+    assert (layout.tiles_x, layout.tiles_y) == (4, 2)
+
+    owners = np.array([[layout.owner(x, y) for x in range(100)] for y in range(50)])
+    for index in range(len(layout)):
+        x0, y0, x1, y1 = layout.bounds(index)
+        assert (owners[y0:y1, x0:x1] == index).all()
+    assert np.bincount(owners.ravel()).sum() == 100 * 50
+    assert layout.owner(-1, 50) == layout.owner(99, 0)
+
+    rows, cols = layout.halo(0, 3)
+    assert list(rows) == list(range(0, 28)) + list(range(47, 50))
+    assert 97 in cols and 27 in cols and 50 not in cols
+    print(f"✓ {len(layout)} tiles of about {100 // 4}x{50 // 2}")
+
+def test_shard_window():
+    """A shard simulates only its tile plus halo, in local coordinates"""
+    print("\nTesting shard window...")
+    layout = TileLayout(200, 100, 4, 1)  # 50x100 tiles: the y axis is whole
+    shm = shared_memory.SharedMemory(create=True, size=200 * 100 * 8)
+    saved_ids = (Organism._next_id, Organism._id_step)  # The shard interleaves IDs
+    try:
+        grid = np.ndarray((100, 200), dtype=np.float64, buffer=shm.buf)
+        grid[:] = np.arange(200 * 100).reshape(100, 200)
+        shard = _Shard(0, layout, 5, [3, 1], shm.name, 1, 1)
+        universe = shard.universe
+        assert (universe.width, universe.height) == (60, 100)
+        assert universe.energy_fields is None or universe.energy_fields.width == 60
+
+        # The window wraps around the world's left edge
+        shard.read_halo()
+        assert universe.energy_grid[7, 0] == grid[7, 195] and universe.energy_grid[7, 5] == grid[7, 0]
+
+        # Organisms arrive and leave in world coordinates
+        organism = Organism(2, 40)
+        organism.memory.append((198, 40, 80))
+        arrivals = [_pack([organism], organism.rng)]
+        emigrants, _, _, _ = shard.step(arrivals)
+        gathered = _unpack(shard.gather(), {}, organism.rng)
+        for moved in gathered + [o for data, _ in emigrants.values() for o in _unpack(data, {}, organism.rng)]:
+            assert 0 <= moved.x < 200 and 0 <= moved.y < 100
+            assert moved.memory[0][:2] == (198.0, 40.0)
+        local = universe.organisms[0] if len(universe.organisms) else None
+        assert local is None or 5 <= local.x < 55
+        shard.shm.close()
+    finally:
+        Organism.interleave_ids(max(saved_ids[0], Organism._next_id), saved_ids[1])
+        shm.close()
+        shm.unlink()
+    print("✓ 60x100 window for a 50x100 tile of a 200x100 world")
+
+def test_sharded_run():
+    """Organisms migrate between tiles without being lost or duplicated"""
+    print("\nTesting sharded run...")
+    with ShardedUniverse(workers=2, seed=21) as world:
+        assert len(world.layout) == 2
+        rng = world.rng.spawn
+        for _ in range(60):
+            x = rng.randint(0, GRID_WIDTH - 1)
+            y = rng.randint(0, GRID_HEIGHT - 1)
+            world.add_organism(Organism(x, y, rng=world.rng))
+        assert world.population == 60
+
+        migrated = 0
+        for _ in range(12):
+            assert world.update()
+            migrated += world._migrating
+        stats = world.get_stats()
+        organisms = world.gather_organisms()
+
+        # Every organism is on exactly one tile; IDs stay unique across workers
+        assert len(organisms) == stats['population'] > 0
+        assert len({o.id for o in organisms}) == len(organisms)
+        assert stats['population'] == stats['total_births'] - stats['total_deaths']
+        assert sum(stats['shard_populations']) <= stats['population']
+        assert (world.energy_grid >= 0).all()
+        assert migrated > 0
+    print(f"✓ {stats['population']} organisms on {stats['shard_populations']}, "
+          f"{migrated} migrations")
+
+def test_sharded_config():
+    """Workers run with the coordinator's SimulationConfig"""
+    print("\nTesting sharded config...")
+    # Creativity and AGI stages can skip a tick's ageing check, so they are off here
+    config = SimulationConfig(MAX_ORGANISM_AGE=3, ENABLE_CREATIVITY=False, ENABLE_GENERAL_INTELLIGENCE=False)
+    with ShardedUniverse(workers=2, seed=4, config=config) as world:
+        rng = world.rng.spawn
+        for _ in range(40):
+            x, y = rng.randint(0, world.width - 1), rng.randint(0, world.height - 1)
+            world.add_organism(Organism(x, y, rng=world.rng, config=config))
+        for _ in range(6):
+            world.update()
+        organisms = world.gather_organisms()
+    assert all(organism.age <= 3 for organism in organisms)
+    assert all(organism.config.MAX_ORGANISM_AGE == 3 for organism in organisms)
+    print(f"✓ {len(organisms)} organisms, none older than MAX_ORGANISM_AGE=3")
+
+def main():
+    print("=" * 60)
+    print("SHARDING TEST SUITE")
+    print("=" * 60)
+
+    test_tile_layout()
+    test_shard_window()
+    test_sharded_run()
+    test_sharded_config()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
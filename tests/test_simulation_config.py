@@ -0,0 +1,75 @@
+"""
+Tests for per-universe simulation configs
+"""
+
+import sys
+import os
+import pickle
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from simulation_config import SimulationConfig, default_config
+from config import *
+
+def test_overrides():
+    """Overrides replace config.py values; unknown names are refused"""
+    print("Testing overrides...")
+    config = SimulationConfig(ENABLE_LANGUAGE=False, MUTATION_RATE=0.5)
+    assert config.ENABLE_LANGUAGE is False and config.MUTATION_RATE == 0.5
+    assert config.GRID_WIDTH == GRID_WIDTH
+    assert 'language' not in config.organism_stages
+    assert 'language_ability' not in config.mutable_genes
+    assert config.replace(MUTATION_RATE=0.1).ENABLE_LANGUAGE is False
+
+    performance = SimulationConfig(PERFORMANCE_MODE=True, MAX_POPULATION=123)
+    assert performance.ENABLE_STRUCTURES is False and performance.MAX_POPULATION == 123
+
+    try:
+        SimulationConfig(ENABLE_TELEPATHY=True)
+        assert False, "unknown settings should be refused"
+    except ValueError:
+        pass
+
+    copy = pickle.loads(pickle.dumps(config))
+    assert copy.organism_stages == config.organism_stages and copy.MUTATION_RATE == 0.5
+    print(f"✓ Stages without language: {', '.join(config.organism_stages)}")
+
+def test_universes_with_different_configs():
+    """Two universes in one process run with their own settings"""
+    print("\nTesting in-process configs...")
+    quiet = SimulationConfig(ENABLE_LANGUAGE=False, ENABLE_CREATIVITY=False, ENABLE_COMMUNICATION=False)
+    universes = [Universe(seed=2), Universe(seed=2, config=quiet)]
+    for universe in universes:
+        for _ in range(30):
+            x = universe.rng.spawn.randint(0, universe.width - 1)
+            y = universe.rng.spawn.randint(0, universe.height - 1)
+            universe.add_organism(Organism(x, y, rng=universe.rng, config=universe.config))
+        for _ in range(10):
+            universe.update()
+
+    default, custom = universes
+    assert default.config is default_config and custom.config is quiet
+    assert all(o.config is quiet for o in custom.organisms)
+    assert all(hasattr(o, 'language') for o in default.organisms)
+    assert not any(hasattr(o, 'language') or 'signal_probability' in o.genome for o in custom.organisms)
+    assert any(o.generation > 0 for o in custom.organisms), "offspring inherit the config"
+    assert not hasattr(custom, 'signals') and hasattr(default, 'signals')
+    print(f"✓ Populations {len(default.organisms)} (default) and {len(custom.organisms)} (quiet)")
+
+def main():
+    print("=" * 60)
+    print("SIMULATION CONFIG TEST SUITE")
+    print("=" * 60)
+
+    test_overrides()
+    test_universes_with_different_configs()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+Tests for columnar snapshots and the save/load system
+"""
+
+import sys
+import os
+import pickle
+import tempfile
+import hashlib
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from persistence import SimulationSaver, restore_universe
+from snapshot import Snapshot
+from config import *
+
+def run(seed, ticks=8):
+    """Small seeded run; returns the universe"""
+    universe = Universe(seed=seed)
+    for _ in range(40):
+        x = universe.rng.spawn.randint(0, universe.width - 1)
+        y = universe.rng.spawn.randint(0, universe.height - 1)
+        universe.add_organism(Organism(x, y, rng=universe.rng))
+    for _ in range(ticks):
+        universe.update()
+    return universe
+
+def fingerprint(universe):
+    digest = hashlib.sha256(universe.energy_grid.tobytes())
+    for o in universe.organisms:
+        digest.update(repr((o.x, o.y, float(o.energy), o.age, o.genome['color'])).encode())
+    return digest.hexdigest()
+
+def test_roundtrip():
+    """A restored snapshot has the same organisms, genomes and brains"""
+    print("Testing snapshot roundtrip...")
+    universe = run(5)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        saver.save(universe, "roundtrip")
+        restored = restore_universe(saver.load("roundtrip"), Universe())
+
+    assert restored.tick == universe.tick
+    assert np.array_equal(restored.energy_grid, universe.energy_grid)
+    assert len(restored.organisms) == len(universe.organisms)
+    for original, copy in zip(universe.organisms, restored.organisms):
+        base = lambda o: getattr(type(o), '_base_class', type(o))
+        assert base(copy) is base(original)
+        assert (copy.id, copy.x, copy.y, copy.energy, copy.age) == \
+               (original.id, original.x, original.y, original.energy, original.age)
+        assert list(copy.genome) == list(original.genome)
+        for key, value in original.genome.items():
+            if key == 'brain':
+                assert np.array_equal(copy.genome[key].get_params(), value.get_params())
+            else:
+                assert copy.genome[key] == value
+        assert copy.parent_id == original.parent_id
+        for name in ('reasoning', 'language', 'agi'):
+            if hasattr(original, name):
+                assert getattr(copy, name).organism is copy
+    assert len(restored.signals) == len(universe.signals)
+    print(f"✓ {len(restored.organisms)} organisms restored at tick {restored.tick}")
+
+def test_restored_run_continues():
+    """A restored universe carries on exactly like the original"""
+    print("\nTesting resumed run...")
+    universe = run(9)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        saver.save(universe, "resume")
+        restored = restore_universe(saver.load("resume"), Universe())
+
+    for _ in range(5):
+        universe.update()
+        restored.update()
+    assert fingerprint(restored) == fingerprint(universe)
+    print(f"✓ Fingerprints match after 5 more ticks")
+
+def test_metadata_and_size():
+    """Metadata records section sizes; snapshots are smaller than pickles"""
+    print("\nTesting metadata and size...")
+    universe = run(2)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        saver.save(universe, "sized", include_cognition=False)
+        meta = saver.list_saves()[0]['metadata']
+        assert meta['population'] == len(universe.organisms)
+        assert meta['bytes'] == sum(meta['section_bytes'].values())
+        assert 'grid' in meta['section_bytes'] and meta['save_seconds'] >= 0
+
+        legacy = len(pickle.dumps({'organisms': list(universe.organisms),
+                                   'energy_grid': universe.energy_grid}))
+        print(f"  snapshot {meta['bytes']} bytes, pickle {legacy} bytes")
+        assert meta['bytes'] < legacy
+
+        # Snapshots saved without cognition still get fresh subsystems
+        snapshot = Snapshot(os.path.join(save_dir, "sized"))
+        assert not snapshot.has_section('cognition')
+        restored = snapshot.restore(Universe())
+        assert len(restored.organisms) == len(universe.organisms)
+    print("✓ Section sizes recorded")
+
+def test_legacy_pickle_loads():
+    """Old single-file pickle saves still load"""
+    print("\nTesting legacy saves...")
+    universe = run(4, ticks=3)
+    with tempfile.TemporaryDirectory() as save_dir:
+        save_data = {
+            'tick': universe.tick,
+            'energy_grid': universe.energy_grid,
+            'organisms': list(universe.organisms),
+            'stats': universe.stats,
+            'rng': universe.rng,
+        }
+        with open(os.path.join(save_dir, "old.pkl"), 'wb') as f:
+            pickle.dump(save_data, f)
+        saver = SimulationSaver(save_dir)
+        restored = restore_universe(saver.load("old.pkl"), Universe())
+    assert len(restored.organisms) == len(universe.organisms)
+    print("✓ Legacy pickle restored")
+
+def test_autosave_rotation():
+    """Autosaves keep the newest by tick number"""
+    print("\nTesting autosave rotation...")
+    universe = run(6, ticks=1)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir)
+        for tick in (8, 9, 10, 11):
+            universe.tick = tick
+            saver.save(universe, f"autosave_tick_{tick}")
+        saver.cleanup_old_autosaves(keep=2)
+        assert sorted(os.listdir(save_dir)) == [
+            'autosave_tick_10', 'autosave_tick_10_meta.json',
+            'autosave_tick_11', 'autosave_tick_11_meta.json']
+    print("✓ Oldest autosaves removed")
+
+def test_background_autosave():
+    """Background autosaves are complete, rotated and never overlap"""
+    print("\nTesting background autosave...")
+    universe = run(7, ticks=2)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir, background=True, full_every=1)
+        expected = fingerprint(universe)
+        for tick in (10, 20, 30, 40):
+            universe.tick = tick
+            saver.autosave(universe, interval=10, keep=2)
+            # Only one write may be in flight
+            assert saver._writer is not None and saver.autosave_stats['saves'] == tick // 10
+        saver.flush()
+        assert saver.last_error is None
+
+        # A half-written save left behind by a crash is ignored
+        os.makedirs(os.path.join(save_dir, "autosave_tick_50.tmp"))
+        names = [save['filename'] for save in saver.list_saves()]
+        assert sorted(names) == ['autosave_tick_30', 'autosave_tick_40']
+
+        restored = restore_universe(saver.load("autosave_tick_40"), Universe())
+        assert restored.tick == 40
+        assert fingerprint(restored) == expected
+    print(f"✓ {saver.autosave_stats['saves']} autosaves, "
+          f"{saver.autosave_stats['blocked_seconds'] * 1000:.1f} ms waiting on writes")
+
+def test_autosave_while_running():
+    """An autosave records the tick it was taken at, even as the run carries on during the write"""
+    print("\nTesting autosave during a running simulation...")
+    for fork in (True, False):
+        universe = run(9, ticks=2)
+        with tempfile.TemporaryDirectory() as save_dir:
+            saver = SimulationSaver(save_dir, background=True, full_every=1, fork=fork)
+            universe.tick = 10
+            expected = fingerprint(universe)
+            saver.autosave(universe, interval=10)
+            for _ in range(3):  # Organisms move, eat, breed and die meanwhile
+                universe.update()
+            saver.flush()
+            assert saver.last_error is None
+
+            restored = restore_universe(saver.load("autosave_tick_10"), Universe())
+            assert restored.tick == 10 and fingerprint(restored) == expected
+        mode = "forked child" if saver.fork else "writer thread"
+        print(f"✓ {mode}: {saver.autosave_stats['capture_seconds'] * 1000:.1f} ms on the simulation thread")
+
+def state(universe):
+    """Everything a delta chain must reproduce exactly"""
+    genes = [(o.id, o.x, o.y, float(o.energy), o.age,
+              sorted((k, float(v) if isinstance(v, float) else v)
+                     for k, v in o.genome.items() if k != 'brain'))
+             for o in universe.organisms]
+    return universe.tick, universe.energy_grid.tobytes(), repr(genes)
+
+def test_delta_chain():
+    """Delta checkpoints replay to the exact state they recorded"""
+    print("\nTesting delta checkpoints...")
+    universe = run(8, ticks=2)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir, background=False, full_every=3)
+        expected = {}
+        for _ in range(5):
+            universe.update()
+            universe.update()
+            saver.autosave(universe, interval=2, keep=10)
+            expected[universe.tick] = state(universe)
+
+        saves = {save['filename']: save['metadata'] for save in saver.list_saves()}
+        kinds = [saves[f"autosave_tick_{tick}"]['format'] for tick in sorted(expected)]
+        assert kinds == ['genesis-snapshot', 'genesis-delta', 'genesis-delta',
+                         'genesis-snapshot', 'genesis-delta']
+        full = saves[f"autosave_tick_{min(expected)}"]['bytes']
+        delta = saves[f"autosave_tick_{min(expected) + 2}"]['bytes']
+        print(f"  full {full} bytes, delta {delta} bytes")
+        assert delta < full
+
+        for tick, recorded in expected.items():
+            restored = restore_universe(saver.load(f"autosave_tick_{tick}"), Universe())
+            assert state(restored) == recorded
+
+        # Rotation keeps the full snapshot the newest delta replays from
+        saver.cleanup_old_autosaves(keep=1)
+        newest = max(expected)
+        assert sorted(saves) != sorted(save['filename'] for save in saver.list_saves())
+        assert sorted(save['filename'] for save in saver.list_saves()) == [
+            f"autosave_tick_{newest - 2}", f"autosave_tick_{newest}"]
+    print(f"✓ {len(expected)} checkpoints replayed exactly")
+
+def inner_state(universe):
+    """Memories, kin and cognitive subsystem stats of every organism"""
+    organisms = []
+    for o in universe.organisms:
+        attributes = o.attributes()
+        memory = [tuple(row) for row in attributes['memory']] if 'memory' in attributes else None
+        kin = [k.id if k is not None else None for k in attributes.get('kin', ())]
+        cognition = {name: repr(attributes[name].get_stats()) for name in sorted(attributes)
+                     if name in ('reasoning', 'language', 'self_awareness', 'creativity', 'agi')}
+        organisms.append((o.id, memory, kin, cognition))
+    return organisms
+
+def test_delta_chain_keeps_survivor_state():
+    """Survivors restored from a chain have the memories and cognition of the live universe"""
+    print("\nTesting survivor state in delta checkpoints...")
+    universe = run(9, ticks=5)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir, background=False, full_every=4)
+        for _ in range(4):
+            for _ in range(5):
+                universe.update()
+            saver.autosave(universe, interval=5, keep=10)
+        expected = inner_state(universe)
+        chain = saver.load(f"autosave_tick_{universe.tick}")
+        assert chain.header['format'] == 'genesis-delta' and chain.header['depth'] == 3
+
+        restored = restore_universe(chain, Universe())
+        assert inner_state(restored) == expected
+        assert any(memory for _, memory, _, _ in expected)
+        assert any(cognition for _, _, _, cognition in expected)
+
+        # Partial loads replay the same state
+        picked = [organism_id for organism_id, *_ in expected[::5]]
+        loaded = {o.id: o for o in chain.read_organisms(ids=picked, include_cognition=True)}
+        for organism_id, memory, _, _ in expected[::5]:
+            attributes = loaded[organism_id].attributes()
+            assert ([tuple(row) for row in attributes['memory']] if 'memory' in attributes else None) == memory
+    print(f"✓ {len(expected)} organisms' memories and cognition survive a 3-delta chain")
+
+def test_partial_loading():
+    """Organisms can be read by ID or region without restoring the save"""
+    print("\nTesting partial loading...")
+    universe = run(12, ticks=4)
+    with tempfile.TemporaryDirectory() as save_dir:
+        saver = SimulationSaver(save_dir, background=False, full_every=3)
+        saver.autosave(universe, interval=4)
+        full = saver.load(f"autosave_tick_{universe.tick}")
+        for _ in range(4):
+            universe.update()
+        saver.autosave(universe, interval=4)
+        chain = saver.load(f"autosave_tick_{universe.tick}")
+
+        for save in (full, chain):
+            reference = restore_universe(save, Universe())
+            expected = {o.id: o for o in reference.organisms}
+            assert list(save.organism_ids()) == list(expected)
+            assert np.array_equal(save.grid(), reference.energy_grid)
+
+            picked = list(expected)[::7] + [10 ** 9]
+            loaded = save.read_organisms(ids=picked)
+            assert [o.id for o in loaded] == picked[:-1]
+            for organism in loaded:
+                original = expected[organism.id]
+                assert (organism.x, organism.y, organism.energy, organism.age) == \
+                       (original.x, original.y, original.energy, original.age)
+                assert np.array_equal(organism.genome['brain'].get_params(),
+                                      original.genome['brain'].get_params())
+                assert organism.genome == {**original.genome, 'brain': organism.genome['brain']}
+
+            region = (10, 20, 45, 60)
+            inside = sorted(o.id for o in expected.values()
+                            if 10 <= o.x < 45 and 20 <= o.y < 60)
+            assert sorted(o.id for o in save.read_organisms(region=region)) == inside
+
+        # Listing needs only the header when the metadata sidecar is gone
+        for name in os.listdir(save_dir):
+            if name.endswith('_meta.json'):
+                os.remove(os.path.join(save_dir, name))
+        listed = {save['filename']: save['metadata'] for save in saver.list_saves()}
+        assert listed[f"autosave_tick_{universe.tick}"]['population'] == len(universe.organisms)
+    print(f"✓ {len(picked) - 1} organisms by ID and a region read from snapshot and chain")
+
+def main():
+    print("=" * 60)
+    print("SNAPSHOT TEST SUITE")
+    print("=" * 60)
+
+    test_roundtrip()
+    test_restored_run_continues()
+    test_metadata_and_size()
+    test_legacy_pickle_loads()
+    test_autosave_rotation()
+    test_background_autosave()
+    test_autosave_while_running()
+    test_delta_chain()
+    test_delta_chain_keeps_survivor_state()
+    test_partial_loading()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
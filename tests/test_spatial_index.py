@@ -0,0 +1,110 @@
+"""
+Tests for the organism spatial index
+"""
+
+import sys
+import os
+import random
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from spatial_index import SpatialIndex
+from config import *
+
+def brute_force_near(organisms, x, y, radius, width, height):
+    """Reference implementation: scan every organism"""
+    found = set()
+    for organism in organisms:
+        dx = organism.x - x
+        dy = organism.y - y
+        if abs(dx) > width / 2:
+            dx = dx - width if dx > 0 else dx + width
+        if abs(dy) > height / 2:
+            dy = dy - height if dy > 0 else dy + height
+        if (dx ** 2 + dy ** 2) ** 0.5 <= radius:
+            found.add(organism)
+    return found
+
+def test_radius_query_matches_brute_force():
+    """Radius queries should agree with a full scan, including wrap-around"""
+    print("Testing radius query against brute force...")
+    rng = random.Random(7)
+    index = SpatialIndex(40, 30, bucket_size=5)
+
+    organisms = [Organism(rng.randint(0, 39), rng.randint(0, 29)) for _ in range(200)]
+    for organism in organisms:
+        index.insert(organism)
+
+    for x, y in [(0, 0), (39, 29), (20, 15), (2, 28), (38, 1)]:
+        for radius in (1, 5, 7.5):
+            found = {o for o, dx, dy, d in index.query_radius(x, y, radius)}
+            expected = brute_force_near(organisms, x, y, radius, 40, 30)
+            assert found == expected, f"Mismatch at ({x}, {y}) r={radius}"
+
+    print("✓ Radius queries match brute force")
+
+def test_uneven_grid():
+    """Queries across the edge find everything when buckets don't divide the grid"""
+    print("\nTesting a grid with partial edge buckets...")
+    rng = random.Random(11)
+    width, height = 42, 31
+    index = SpatialIndex(width, height, bucket_size=5)
+
+    organisms = [Organism(rng.randint(0, width - 1), rng.randint(0, height - 1)) for _ in range(500)]
+    for organism in organisms:
+        index.insert(organism)
+
+    queries = 0
+    for x in range(width):
+        for y in range(height):
+            for radius in (3, 5):
+                found = {o for o, dx, dy, d in index.query_radius(x, y, radius)}
+                assert found == brute_force_near(organisms, x, y, radius, width, height), \
+                    f"Mismatch at ({x}, {y}) r={radius}"
+                queries += 1
+
+    print(f"✓ {queries} queries on a {width}x{height} grid match brute force")
+
+def test_move_and_remove_keep_index_in_sync():
+    """Moving and removing organisms should update their buckets"""
+    print("\nTesting incremental index updates...")
+    universe = Universe()
+    org = Organism(0, 0)
+    universe.add_organism(org)
+
+    assert universe.organisms_at(0, 0) == [org]
+
+    # Move across the wrap boundary
+    org.move(-1, -1, universe)
+    assert (org.x, org.y) == (universe.width - 1, universe.height - 1)
+    assert universe.organisms_at(0, 0) == []
+    assert universe.organisms_at(org.x, org.y) == [org]
+
+    # A neighbour on the other side of the wrap should see it
+    near = universe.organisms_near(0, 0, 2)
+    assert [o for o, dx, dy, d in near] == [org]
+    assert (near[0][1], near[0][2]) == (-1, -1)
+
+    universe.remove_organism(org)
+    assert org not in universe.spatial_index
+    assert universe.organisms_near(0, 0, 2) == []
+    print("✓ Index follows moves and removals")
+
+def main():
+    print("=" * 60)
+    print("SPATIAL INDEX TEST SUITE")
+    print("=" * 60)
+
+    test_radius_query_matches_brute_force()
+    test_uneven_grid()
+    test_move_and_remove_keep_index_in_sync()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
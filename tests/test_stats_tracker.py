@@ -0,0 +1,96 @@
+"""
+Tests for the incremental statistics tracker
+"""
+
+import sys
+import os
+import random
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from universe import Universe
+from config import *
+
+def populated_universe(array_mode=False):
+    random.seed(3)
+    universe = Universe(seed=3, array_mode=array_mode)
+    for _ in range(50):
+        universe.add_organism(Organism(random.randint(0, universe.width - 1),
+                                       random.randint(0, universe.height - 1)))
+    return universe
+
+def test_running_totals_match_recount():
+    """Snapshot totals equal a full recount after several ticks"""
+    print("Testing running totals...")
+    for array_mode in (False, True):
+        universe = populated_universe(array_mode)
+        for _ in range(10):
+            universe.update()
+
+        stats = universe.get_stats()
+        expected_avg = np.mean([o.energy for o in universe.organisms])
+        assert np.isclose(stats['total_energy'], np.sum(universe.energy_grid))
+        assert np.isclose(stats['avg_organism_energy'], expected_avg)
+        assert stats['population'] == len(universe.organisms)
+        print(f"✓ array_mode={array_mode}: energy {stats['total_energy']:.0f}, "
+              f"avg organism energy {stats['avg_organism_energy']:.1f}")
+
+def test_deep_sampling():
+    """Cognitive aggregates appear after a deep sample: on cadence, on demand or via get_stats(deep=True)"""
+    print("\nTesting deep stats sampler...")
+    universe = populated_universe()
+    assert universe.stats_tracker.deep_interval == universe.config.DEEP_STATS_INTERVAL == LOG_INTERVAL
+    universe.stats_tracker.deep_interval = 0
+    universe.update()
+    assert 'deep_stats_tick' not in universe.get_stats()
+
+    universe.sample_deep_stats()
+    assert universe.get_stats()['deep_stats_tick'] == universe.tick
+
+    universe.stats_tracker.deep_interval = 2
+    universe.update()
+    universe.update()
+    assert universe.get_stats()['deep_stats_tick'] == 2
+
+    universe.update()
+    stats = universe.get_stats(deep=True)
+    assert stats['deep_stats_tick'] == universe.tick
+    if ENABLE_GENERAL_INTELLIGENCE:
+        assert 'avg_general_intelligence' in stats
+    print("✓ Deep stats sampled on demand and on cadence")
+
+def test_stats_reads_do_not_record_complexity():
+    """Polling get_stats must not grow complexity history"""
+    print("\nTesting side-effect free stats...")
+    if not ENABLE_GENERAL_INTELLIGENCE:
+        print("  Skipped (general intelligence disabled)")
+        return
+
+    org = Organism(5, 5)
+    for _ in range(5):
+        org.agi.get_stats()
+        org.agi.measure_complexity(record=False)
+    assert len(org.agi.complexity_history) == 0
+
+    org.agi.measure_complexity()
+    assert len(org.agi.complexity_history) == 1
+    print("✓ Only recording calls append to complexity history")
+
+def main():
+    print("=" * 60)
+    print("STATS TRACKER TEST SUITE")
+    print("=" * 60)
+
+    test_running_totals_match_recount()
+    test_deep_sampling()
+    test_stats_reads_do_not_record_complexity()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Tests for the two-phase (decide/commit) tick
+"""
+
+import sys
+import os
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from organism import Organism
+from predator import Predator
+from universe import Universe
+from two_phase import Intent, WorldView, commit_intents, decide_intents
+from config import *
+
+def populate(seed):
+    """Seeded two-phase universe with prey and a few predators"""
+    Organism._next_id = 1  # Decisions are keyed on IDs, so runs must reuse them
+    universe = Universe(seed=seed, two_phase=True)
+    rng = universe.rng.spawn
+    for i in range(60):
+        x = rng.randint(0, 19)
+        y = rng.randint(0, 19)
+        cls = Predator if i % 10 == 0 else Organism
+        universe.add_organism(cls(x, y, rng=universe.rng))
+    return universe
+
+def fingerprint(universe):
+    digest = hashlib.sha256(universe.energy_grid.tobytes())
+    for o in sorted(universe.organisms, key=lambda o: o.id):
+        digest.update(repr((o.x, o.y, float(o.energy), o.age, o.direction, o.genome['color'])).encode())
+    return digest.hexdigest()
+
+def run(universe, ticks=10, reverse=False):
+    for _ in range(ticks):
+        if reverse:
+            universe.set_organisms(list(universe.organisms)[::-1])
+        universe.update()
+    return fingerprint(universe)
+
+def test_order_independent():
+    """Population order, batch size and threads do not change the outcome"""
+    print("Testing order independence...")
+    expected = run(populate(4))
+
+    assert run(populate(4), reverse=True) == expected
+
+    single = populate(4)
+    single.decide_batch_size = 1
+    assert run(single) == expected
+
+    threaded = populate(4)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded.decide_executor = executor
+        assert run(threaded) == expected
+    assert run(populate(5)) != expected
+    print(f"✓ Fingerprint {expected[:12]} with reversed order, batches of 1 and threads")
+
+def test_threaded_profiling():
+    """Threaded decide batches time themselves and merge into the universe's profile"""
+    print("\nTesting profiling with threaded decide batches...")
+    profiles = []
+    for workers in (None, 4):
+        universe = populate(6)
+        universe.profiler.enabled = True
+        universe.decide_batch_size = 8
+        if workers is None:
+            run(universe, ticks=5)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                universe.decide_executor = executor
+                run(universe, ticks=5)
+        profiles.append(universe.profiler)
+
+    serial, threaded = profiles
+    assert threaded.calls == serial.calls  # Same decisions, so the same timed calls
+    decide = threaded.totals['decide']
+    assert any('.' in name for name in threaded.totals)
+    for name, seconds in threaded.totals.items():
+        assert 0 <= seconds, name
+        if '.' in name:  # Cognitive subsystem calls happen inside decide, on up to 4 threads
+            assert seconds <= decide * 4, name
+    print(f"✓ {sum(threaded.calls.values())} timed calls match a serial run")
+
+def test_decide_is_read_only():
+    """Deciding records intents without touching the world"""
+    print("\nTesting read-only decide phase...")
+    universe = populate(8)
+    universe.tick += 1
+    grid = universe.energy_grid.copy()
+    positions = [(o.x, o.y) for o in universe.organisms]
+    signals = len(universe.signals)
+
+    intents = decide_intents(universe, universe.organisms)
+    assert [(o.x, o.y) for o in universe.organisms] == positions
+    assert (universe.energy_grid == grid).all() and universe.energy_grid.flags.writeable
+    assert len(universe.signals) == signals
+    assert [i.organism.id for i in intents] == sorted(o.id for o in universe.organisms)
+    assert all(o.rng is universe.rng for o in universe.organisms)
+    assert any(i.move for i in intents)
+
+    try:
+        WorldView(universe).consume_energy(0, 0, 1)
+        assert False, "consume_energy should be refused while deciding"
+    except RuntimeError:
+        pass
+    print(f"✓ {sum(1 for i in intents if i.move)} moves recorded, world unchanged")
+
+def test_hunt_conflicts():
+    """Each prey is caught once, by the lowest-ID predator on its cell"""
+    print("\nTesting hunt conflict resolution...")
+    universe = Universe(seed=1, two_phase=True)
+    prey = Organism(5, 5, rng=universe.rng)
+    hunters = [Predator(5, 5, rng=universe.rng) for _ in range(3)]
+    for organism in [prey] + hunters[::-1]:
+        universe.add_organism(organism)
+    prey.energy = 100.0
+    for hunter in hunters:
+        hunter.energy = 20.0  # Too little to reproduce after the catch
+    before = [h.energy for h in hunters]
+
+    intents = []
+    for hunter in hunters:
+        intent = Intent(hunter)
+        intent.hunt = True
+        intents.append(intent)
+    dead, _, _ = commit_intents(universe, [Intent(prey)] + intents)
+
+    assert dead == [prey]
+    assert [h.energy - b for h, b in zip(hunters, before)] == [50.0, 0.0, 0.0]
+    print("✓ Lowest-ID predator caught the prey")
+
+def main():
+    print("=" * 60)
+    print("TWO-PHASE TICK TEST SUITE")
+    print("=" * 60)
+
+    test_order_independent()
+    test_threaded_profiling()
+    test_decide_is_read_only()
+    test_hunt_conflicts()
+
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()